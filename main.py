@@ -1,16 +1,24 @@
 # --- START OF FULL CORRECTED FILE main.py ---
 
 import csv
+import importlib.util
+from itertools import chain, repeat
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, colorchooser, scrolledtext
 import numpy as np
 from datetime import datetime, timedelta, UTC
 import threading
+import time
+from functools import lru_cache
+import queue
 import json
 from typing import Optional, Callable # Added Callable for type hinting
 import random
+import re
+from collections import OrderedDict, deque
 import os
 import logging
+import math
 import sys # Import sys for fallback exit/ephemeris error handling
 
 # --- Logging Setup ---
@@ -24,7 +32,7 @@ log_format = '%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s'
 logging.basicConfig(level=numeric_level, format=log_format)
 # Get logger specifically for this application module
 logger = logging.getLogger(__name__)
-logger.info(f"Logging level set to: {log_level_name}")
+logger.info("Logging level set to: %s", log_level_name)
 
 
 # --- Attempt to Import Custom Modules ---
@@ -43,8 +51,9 @@ try:
     from planet_calculations import (
         ts, sun, earth, ephem_start_jd, ephem_end_jd, # Ensure ephem bounds are imported
         EPHEMERIS_START, EPHEMERIS_END, parse_date_time,
-        calculate_orbit, get_heliocentric_positions, get_orbital_elements,
-        calculate_events, find_next_events
+        calculate_orbit, calculate_orbits, get_heliocentric_positions, get_orbital_elements,
+        get_heliocentric_positions_cached, get_orbital_elements_cached, CACHE_JD_DECIMALS,
+        calculate_events, find_next_events, warm_up
     )
     # Check if calculations module loaded its critical components
     # FIX: Added checks for ephem bounds
@@ -53,7 +62,7 @@ try:
          raise ImportError(f"Core components from planet_calculations failed to load: {', '.join(missing)}")
 
 except ImportError as e:
-     logger.critical(f"Failed to import core dependency: {e}. Application cannot start.", exc_info=True)
+     logger.critical("Failed to import core dependency: %s. Application cannot start.", e, exc_info=True)
      # Try showing a Tkinter error message if possible, otherwise exit
      try:
          root_fallback = tk.Tk(); root_fallback.withdraw()
@@ -63,7 +72,7 @@ except ImportError as e:
      sys.exit(f"Core Import Error: {e}")
 except SystemExit as e:
      # Catch SystemExit if raised by planet_calculations during ephemeris load failure
-     logger.critical(f"Caught SystemExit during initialization: {e}")
+     logger.critical("Caught SystemExit during initialization: %s", e)
      try:
          root_fallback = tk.Tk(); root_fallback.withdraw()
          messagebox.showerror("Initialization Error", f"Ephemeris loading failed:\n{e}\n\nPlease check the ephemeris file and logs.", parent=root_fallback)
@@ -72,7 +81,7 @@ except SystemExit as e:
      sys.exit(f"Initialization Error: {e}") # Re-exit after showing message
 except Exception as e:
      # Catch any other unexpected error during initial imports/setup
-     logger.critical(f"Unexpected error during initial imports: {e}", exc_info=True)
+     logger.critical("Unexpected error during initial imports: %s", e, exc_info=True)
      try:
          root_fallback = tk.Tk(); root_fallback.withdraw()
          messagebox.showerror("Critical Startup Error", f"An unexpected error occurred during startup:\n{e}\n\nCheck logs.", parent=root_fallback)
@@ -84,140 +93,470 @@ except Exception as e:
 # --- Groq Integration ---
 # Placed after core imports to ensure logging is likely set up
 LLM_ENABLED = False
-try:
-    from groq import Groq, APIError
+# groq pulls in httpx/pydantic/anyio, a noticeable share of startup time, so only check
+# that it is installed here; _load_groq binds Groq/APIError the first time a client is needed.
+GROQ_AVAILABLE = importlib.util.find_spec("groq") is not None
+if GROQ_AVAILABLE:
     logger.info("Python 'groq' library found.")
-    # Attempt initialization later inside PlanetTrackerApp.__init__ after config/API key loaded
-except ImportError:
+else:
     logger.warning("'groq' library not found. LLM features will be disabled.")
     logger.info("Install it using: pip install groq")
-    Groq = None
-    APIError = None
-
-
-# --- Tooltip Function (Improved Safety Checks) ---
-def create_tooltip(widget, text):
-    """Create a tooltip for a given widget with improved safety."""
-    # Basic validation of the widget itself
-    if not isinstance(widget, tk.Widget) or not widget.winfo_exists():
-        logger.warning(f"Cannot create tooltip for invalid or destroyed widget: {widget}")
-        return None
+Groq = None
+APIError = None
 
+def _load_groq() -> bool:
+    """Imports the groq client classes on first use; returns False if that fails."""
+    global Groq, APIError
+    if Groq is None:
+        try:
+            from groq import Groq as groq_client_cls, APIError as groq_api_error
+        except ImportError as e:
+            logger.error("Failed to import 'groq' library: %s", e)
+            return False
+        APIError, Groq = groq_api_error, groq_client_cls # APIError first: Groq being set implies both are
+    return True
+
+# Static request parameters. Kept byte-identical across calls (system prompt first)
+# so the provider's prompt-prefix cache can be reused from one query to the next.
+GROQ_MODEL = "llama3-8b-8192" # Fast and capable for short factual answers
+GROQ_TEMPERATURE = 0.6 # Lower is more factual
+GROQ_MAX_TOKENS = 300 # Limit response length
+GROQ_TIMEOUT_S = 20.0 # A stalled request must not hold one of the few background workers for long
+# Transient failures (429 / 5xx / connection errors) are retried by the groq client itself, with
+# exponential backoff + jitter that honours the server's Retry-After header. Retries only cover
+# opening the request, so a reply that has started streaming is never duplicated.
+GROQ_MAX_RETRIES = 3
+# Client-side tokens-per-minute budget: requests wait locally instead of being rejected by the
+# server once a burst of questions has used up the minute's allowance.
+GROQ_TPM_LIMIT = 30000
+CHAT_STREAM_FLUSH_CHARS = 200 # Streamed reply text is pushed to the chat display in batches of about this size...
+CHAT_STREAM_FLUSH_S = 0.020 # ...or at least this often, so the first tokens show up right away
+GROQ_MAX_INPUT_CHARS = 4000 # Longer questions are truncated before sending (bounds prompt tokens per request)
+GROQ_TRUNCATION_NOTE = "\n[...truncated...]"
+LLM_CACHE_SIZE = 64 # Recent replies kept for repeated questions (see _normalize_query)
+LLM_CACHE_TTL_S = 24 * 3600 # Cached replies older than this are asked again
+GROQ_SYSTEM_PROMPT = (
+    "You are Nexus, a concise astronomical assistant within the 'Planet Tracker: Galactic Nexus' GUI application. "
+    "Focus on astronomy facts, planet data (like size, mass, distance), celestial events, and space concepts relevant to the solar system visualization context. "
+    "Keep answers factual and brief. Use clear, simple language. "
+    "Avoid code examples, excessive formatting (like lists unless necessary), apologies, or conversational fillers. "
+    "If information is unavailable or outside your scope, state that directly (e.g., 'Data not available'). "
+    "The user controls the application's time and view settings via the GUI, so you don't need to manipulate these."
+)
+
+class _TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until enough tokens have refilled."""
+
+    def __init__(self, capacity: float, refill_per_s: float):
+        self._capacity = float(capacity)
+        self._refill_per_s = float(refill_per_s)
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._stamp) * self._refill_per_s)
+        self._stamp = now
+
+    def acquire(self, cost: float, on_wait: Optional[Callable] = None):
+        """Takes `cost` tokens, first calling `on_wait()` (once) if the caller has to wait."""
+        cost = min(float(cost), self._capacity) # A single oversized request must still get through
+        with self._cond:
+            self._refill()
+            if self._tokens < cost and on_wait: on_wait()
+            while self._tokens < cost:
+                self._cond.wait((cost - self._tokens) / self._refill_per_s)
+                self._refill()
+            self._tokens -= cost
+
+    def adjust(self, delta: float):
+        """Returns (delta > 0) or charges (delta < 0) tokens once the real cost is known."""
+        with self._cond:
+            self._refill()
+            self._tokens = min(self._capacity, self._tokens + delta)
+            self._cond.notify_all()
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for rate limiting."""
+    return len(text) // 4 + 1
+
+# Fixed part of every chat request, built once (the SDK only reads the message dicts)
+GROQ_SYSTEM_MESSAGE = {"role": "system", "content": GROQ_SYSTEM_PROMPT}
+GROQ_SYSTEM_PROMPT_TOKENS = _estimate_tokens(GROQ_SYSTEM_PROMPT)
+
+_QUERY_PUNCT_RE = re.compile(r"[^\w\s]+")
+
+def _normalize_query(text: str) -> str:
+    """Cache key for an LLM question: case, punctuation and spacing differences are ignored."""
+    return " ".join(_QUERY_PUNCT_RE.sub(" ", text.lower()).split())
+
+# --- Background Work ---
+# Long-running work (plot/animation computation, event searches, LLM queries) runs on a
+# small persistent pool instead of a fresh thread per request.
+BACKGROUND_WORKERS = 2 # Bounded: extra submissions queue instead of piling up Skyfield/Groq load
+
+class _DaemonWorkerPool:
+    """
+    Fixed-size pool of daemon worker threads fed from a FIFO queue.
+
+    Unlike ThreadPoolExecutor (whose workers are joined at interpreter exit), a stuck
+    task here (e.g. a Groq call retrying on timeouts) cannot keep the process alive
+    after the window closes. Submitted callables handle their own errors; anything
+    that escapes is logged. Results are not returned.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._queue = queue.SimpleQueue()
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._threads = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable, *args):
+        """Queues fn(*args); starts another worker if the pool is not yet full."""
+        with self._lock:
+            if self._shutdown:
+                logger.warning("Background pool is shut down; dropped task %s.", getattr(fn, "__name__", fn))
+                return
+            self._queue.put((fn, args))
+            if len(self._threads) < self._max_workers:
+                worker = threading.Thread(target=self._worker, daemon=True,
+                                          name=f"{self._thread_name_prefix}-{len(self._threads)}")
+                self._threads.append(worker)
+                worker.start()
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None: return # Shutdown sentinel
+            fn, args = item
+            try: fn(*args)
+            except Exception as e: logger.error("Unhandled error in background task %s: %s", getattr(fn, "__name__", fn), e, exc_info=True)
+
+    def shutdown(self, cancel_futures: bool = False):
+        """Stops accepting work; optionally drops queued tasks. Never waits for running ones."""
+        with self._lock:
+            if self._shutdown: return
+            self._shutdown = True
+            if cancel_futures:
+                try:
+                    while True: self._queue.get_nowait()
+                except queue.Empty: pass
+            for _ in self._threads: self._queue.put(None)
+
+_background_pool = _DaemonWorkerPool(BACKGROUND_WORKERS, thread_name_prefix="Task")
+# Status-bar / thread names for the tasks run through PlanetTrackerApp._run_long_task
+TASK_DISPLAY_NAMES = {
+    "_update_preview": "Plot",
+    "_compute_animation_frames": "Animation",
+    "_show_upcoming_events": "Upcoming events",
+    "_get_groq_response_worker": "Assistant reply",
+}
+
+def _task_display_name(func: Callable) -> str:
+    """Readable task name for status/log messages (TASK_DISPLAY_NAMES, else derived from the function name)."""
+    name = func.__name__
+    return TASK_DISPLAY_NAMES.get(name) or name.replace('_', ' ').strip().capitalize()
+
+# --- Chat Display ---
+CHAT_SCROLL_THROTTLE_MS = 50 # Auto-scroll to the newest chat text at most this often
+CHAT_FLUSH_MS = 16 # Chat appends are queued and inserted together at most once per frame
+CHAT_END_MARK = "chat_end" # Right-gravity mark that stays at the end of the chat text; appends go here
+CHAT_SUBMIT_DEBOUNCE_S = 0.15 # A second submit this soon after the last is a double-tap and is dropped
+# Sender -> (display prefix, default text tag) for add_chat_message
+_SENDER_META = {
+    "User": ("You: ", "user_tag"),
+    "Nexus": ("Nexus: ", "bot_tag"),
+}
+# Chat text tags: (tag, fixed options set at creation, theme key for its foreground or None).
+# error_tag stays red in every theme.
+_CHAT_TAGS = (
+    ("user_tag", {"font": ("Arial", 10, "bold")}, "hdr_fg"), # Bold for user input
+    ("bot_tag", {}, "text_fg"), # Default style for bot
+    ("error_tag", {"foreground": "red"}, None), # Red for errors
+    ("info_tag", {"font": ("Arial", 10, "italic")}, "stat_fg"), # Italic for info messages
+)
+_CHAT_THEMED_TAGS = tuple((tag, theme_key) for tag, _options, theme_key in _CHAT_TAGS if theme_key)
+# Reply to the local `help` / `commands` chat command
+CHAT_HELP_TEXT = (
+    "Available Commands:\n"
+    "- `help` / `commands`: Show this help message.\n"
+    "- `info [Planet Name]`: Show data for a celestial body.\n"
+    "- `update plot`: Update the static plot to the current time.\n"
+    "- `animate`: Generate an animation (uses orbit range).\n"
+    "- `upcoming events`: Show predicted events for the next year.\n"
+    "- `clear`: Clear this chat display.\n"
+    "Ask general astronomy questions to contact the Nexus AI (if enabled)."
+)
+
+# --- File Export ---
+EXPORT_WRITE_BUFFER = 1 << 20 # Bytes; orbit CSV export goes to disk in a few large writes
+
+# --- Notifications ---
+NOTIFICATION_MS = 4000 # How long info/warning notifications stay up
+NOTIFICATION_ERROR_MS = 8000 # Errors stay up longer
+
+# --- Info Panel ---
+INFO_TEXT_CACHE_SIZE = 64 # Rendered info panel texts kept for repeat requests
+
+# --- Planet List ---
+# Widget options shared by every row of the planet list (built once, not per row)
+PLANET_ROW_PACK = dict(fill="x", pady=2)
+PLANET_SWATCH_KW = dict(text="", width=2, relief="solid", borderwidth=1)
+PLANET_SWATCH_PACK = dict(side="left", padx=(0, 5))
+PLANET_CHECK_PACK = dict(side="left", expand=True, fill="x", padx=(0, 5))
+PLANET_SET_BTN_KW = dict(text="Set", width=4, style="TButton")
+PLANET_TOGGLE_TIP = "Toggle visibility of {}" # Tooltip text templates, filled per row with .format(planet)
+PLANET_COLOR_TIP = "Choose display color for {}"
+
+# --- GUI Timing ---
+SLIDER_LABEL_UPDATE_MS = 33 # Time label refresh interval while the slider is dragged (~30 fps; formatting is cached)
+SLIDER_PREVIEW_DEBOUNCE_MS = 150 # Quiet period after the last slider release before the plot is recomputed
+
+
+# --- Time Label Formatting ---
+# Labels are keyed on the UTC minute they display, so a slider drag formats each minute once.
+TIME_LABEL_FORMAT = '%Y-%m-%d %H:%M UTC'
+SECONDS_PER_DAY = 86400.0
+MINUTES_PER_DAY = 1440
+UNIX_EPOCH_JD = 2440587.5
+_UNIX_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+
+def _tt_minus_utc_at(tt_jd: float) -> float:
+    """TT - UTC in seconds at a TT Julian date (whole leap seconds + 32.184 s)."""
+    utc_jd = ts.tt_jd(tt_jd).utc_datetime().timestamp() / SECONDS_PER_DAY + UNIX_EPOCH_JD
+    return round((tt_jd - utc_jd) * SECONDS_PER_DAY, 3) # utc_datetime has microsecond resolution
+
+@lru_cache(maxsize=512)
+def _tt_minus_utc_for_day(tt_day: int) -> Optional[float]:
+    """TT - UTC in seconds over TT day [tt_day, tt_day + 1), or None if a leap second falls inside it."""
+    offset_s = _tt_minus_utc_at(float(tt_day))
+    return offset_s if offset_s == _tt_minus_utc_at(tt_day + 1.0) else None
+
+@lru_cache(maxsize=4096)
+def _format_utc_minute(utc_minute: int) -> str:
+    """Formats whole minutes since the Unix epoch (UTC) with TIME_LABEL_FORMAT."""
+    return (_UNIX_EPOCH_UTC + timedelta(minutes=utc_minute)).strftime(TIME_LABEL_FORMAT)
+
+def _format_time_label(tt_jd: float) -> str:
+    """
+    Same text as ts.tt_jd(tt_jd).utc_strftime(TIME_LABEL_FORMAT) (rounded to the nearest
+    UTC minute), but served from caches while the slider moves.
+    """
+    tt_day = math.floor(tt_jd)
+    offset_s = _tt_minus_utc_for_day(tt_day)
+    if offset_s is None: # Leap-second day: let Skyfield handle it exactly
+        return ts.tt_jd(tt_jd).utc_strftime(TIME_LABEL_FORMAT)
+    # Whole days become whole minutes; only the seconds within the day are rounded, in full precision
+    day_start_minute = round((tt_day - UNIX_EPOCH_JD) * MINUTES_PER_DAY)
+    seconds_in_day = (tt_jd - tt_day) * SECONDS_PER_DAY - offset_s
+    return _format_utc_minute(day_start_minute + math.floor(seconds_in_day / 60.0 + 0.5)) # Half up, like utc_strftime
+
+
+# --- Time Slider Range ---
+def _time_slider_range():
+    """(min_jd, max_jd, tooltip_text) for the time slider, from the loaded ephemeris bounds."""
     try:
-        tooltip = tk.Toplevel(widget)
-        tooltip.wm_overrideredirect(True) # No window decorations
+        # Use the IMPORTED ephemeris bounds
+        slider_start_yr = ts.tt(jd=ephem_start_jd).utc_datetime().year
+        slider_end_yr = ts.tt(jd=ephem_end_jd).utc_datetime().year
+        return ephem_start_jd, ephem_end_jd, f"Slide to navigate time\n({slider_start_yr} – {slider_end_yr})"
     except Exception as e:
-        # Handle cases where widget might be destroyed before Toplevel created
-        logger.error(f"Failed to create Toplevel for tooltip (widget might be destroyed): {e}")
-        return None
+        # Should not happen if imports worked, but keep fallback
+        logger.error("Could not determine slider range from imported ephemeris bounds: %s", e, exc_info=True)
+        return (ts.from_datetime(EPHEMERIS_START).tt, ts.from_datetime(EPHEMERIS_END).tt,
+                f"Slide to navigate time\n({EPHEMERIS_START.year} – {EPHEMERIS_END.year})")
 
-    # Store reference to prevent garbage collection issues in callbacks
-    tooltip.widget_ref = widget
+# The ephemeris is fixed for the life of the process, so the range is worked out once
+SLIDER_MIN_JD, SLIDER_MAX_JD, SLIDER_TOOLTIP = _time_slider_range()
 
-    label = tk.Label(tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1, justify=tk.LEFT, wraplength=300)
-    label.pack(ipadx=2, ipady=2)
-    tooltip.withdraw() # Start hidden
 
-    # Debounce mechanism variables
-    enter_id = None
-    leave_id = None
-    widget_hover = False
-    tooltip_hover = False
+# --- Tooltip Function (Improved Safety Checks) ---
+# All tooltips share one Toplevel + Label owned by _TooltipManager: entering a registered
+# widget retargets that window (text + position) instead of every widget keeping its own
+# window, timers and <Destroy> cleanup. At most one show/hide is pending at any time.
+TOOLTIP_SHOW_DELAY_MS = 700
+TOOLTIP_HIDE_DELAY_MS = 200
+
+class _TooltipManager:
+    """Single shared tooltip window, retargeted to whichever registered widget is hovered."""
+
+    def __init__(self):
+        self._tooltip = None # Created lazily by _ensure_window()
+        self._label = None
+        self._alive = False # Flipped off when the tooltip window is destroyed (e.g. app exit)
+        self._target = None # Widget the tooltip currently belongs to
+        self._text = None # Text for the current target
+        self._shown_text = None # Text currently set on the label
+        self._widget_hover = False
+        self._tooltip_hover = False
+        self._after_id = None
+        self._pending_kind = None
+
+    def register(self, widget, text):
+        """Binds Enter/Leave (and destroy cleanup) on `widget` so it shows `text` when hovered."""
+        widget._tip_alive = True # Flipped off on <Destroy>; cheaper than winfo_exists()
+        widget.bind("<Enter>", lambda event: self._on_enter(widget, text), add='+')
+        widget.bind("<Leave>", lambda event: self._on_leave(widget), add='+')
+        widget.bind("<Destroy>", lambda event: self._on_widget_destroy(event, widget), add='+')
+
+    def _ensure_window(self, widget):
+        """Builds the shared Toplevel + Label on first use; returns it (or None on failure)."""
+        if self._alive: return self._tooltip
+        try:
+            tooltip = tk.Toplevel(widget.winfo_toplevel())
+            tooltip.wm_overrideredirect(True) # No window decorations
+            tooltip.withdraw() # Start hidden
+            label = tk.Label(tooltip, text="", background="#ffffe0", relief="solid", borderwidth=1, justify=tk.LEFT, wraplength=300)
+            label.pack(ipadx=2, ipady=2)
+            tooltip.bind("<Enter>", self._on_tooltip_enter, add='+')
+            tooltip.bind("<Leave>", self._on_tooltip_leave, add='+')
+            tooltip.bind("<Destroy>", self._on_tooltip_destroy, add='+')
+        except tk.TclError as e:
+            logger.error("Failed to create tooltip window: %s", e)
+            return None
+        self._tooltip, self._label, self._alive, self._shown_text = tooltip, label, True, None
+        return tooltip
+
+    # Shared timer
+    def _cancel(self, kind: Optional[str] = None):
+        """Cancels the pending show/hide (only if it is of `kind`, when given)."""
+        if self._after_id is None: return
+        if kind is not None and self._pending_kind != kind: return
+        after_id = self._after_id
+        self._after_id = self._pending_kind = None
+        if not self._alive: return
+        try: self._tooltip.after_cancel(after_id)
+        except Exception as e: logger.warning("Tooltip 'after_cancel' error: %s", e)
+
+    def _schedule(self, kind: str, action: Callable, delay_ms: int):
+        """Replaces the pending action with `action` ('show'/'hide') after `delay_ms`."""
+        self._cancel()
+        if not self._alive: return
+
+        def run_pending():
+            self._after_id = self._pending_kind = None
+            action()
+        try:
+            self._after_id, self._pending_kind = self._tooltip.after(delay_ms, run_pending), kind
+        except Exception as e: logger.warning("Tooltip 'after' scheduling error: %s", e)
 
     # Improved positioning logic (needs widget dimensions)
-    def position_tooltip():
-         # Check widget and tooltip exist before accessing geometry
-         if not widget or not widget.winfo_exists() or not tooltip or not tooltip.winfo_exists():
-             return
-         widget.update_idletasks() # Ensure widget geometry is up-to-date
-         # Get geometry relative to the screen
-         x = widget.winfo_rootx() + widget.winfo_width() // 2
-         y = widget.winfo_rooty() + widget.winfo_height() + 5 # Below widget
-         screen_width = widget.winfo_screenwidth(); screen_height = widget.winfo_screenheight()
-         tooltip.update_idletasks() # Ensure tooltip size is known
-         tip_width = tooltip.winfo_width(); tip_height = tooltip.winfo_height()
-
-         # Adjust x to keep tooltip on screen
-         if x + tip_width > screen_width: x = screen_width - tip_width - 5
-         if x < 0: x = 5
-         # Adjust y (try above if below goes off screen)
-         if y + tip_height > screen_height: y = widget.winfo_rooty() - tip_height - 5
-         if y < 0: y = 5
-         tooltip.wm_geometry(f"+{x}+{y}")
-
-    # Enhanced scheduler/canceller with existence checks
-    def schedule(action: Callable, delay_ms: int):
-         if tooltip and tooltip.winfo_exists():
-              try: return tooltip.after(delay_ms, action)
-              except Exception as e: logger.warning(f"Tooltip 'after' scheduling error: {e}")
-         return None
-    def cancel_schedule(schedule_id):
-        if schedule_id and tooltip and tooltip.winfo_exists():
-            try: tooltip.after_cancel(schedule_id)
-            except Exception as e: logger.warning(f"Tooltip 'after_cancel' error: {e}")
+    def _position(self):
+        widget, tooltip = self._target, self._tooltip
+        # No update_idletasks() here: the hovered widget is already mapped, and the label's
+        # requested size is updated as soon as its text is set, so there is no need to flush
+        # the whole GUI's pending geometry work first (+4 for the pack ipadx/ipady).
+        x = widget.winfo_rootx() + widget.winfo_width() // 2
+        y = widget.winfo_rooty() + widget.winfo_height() + 5 # Below widget
+        screen_width = widget.winfo_screenwidth(); screen_height = widget.winfo_screenheight()
+        tip_width = self._label.winfo_reqwidth() + 4; tip_height = self._label.winfo_reqheight() + 4
+
+        # Adjust x to keep tooltip on screen
+        if x + tip_width > screen_width: x = screen_width - tip_width - 5
+        if x < 0: x = 5
+        # Adjust y (try above if below goes off screen)
+        if y + tip_height > screen_height: y = widget.winfo_rooty() - tip_height - 5
+        if y < 0: y = 5
+        tooltip.wm_geometry(f"+{x}+{y}")
 
     # Debounced show/hide logic
-    def show_tooltip_debounced():
-        nonlocal enter_id; enter_id = None
-        # Double check hover state and widget existence before showing
-        if (widget_hover or tooltip_hover) and tooltip and tooltip.winfo_exists() and widget and widget.winfo_exists():
-             position_tooltip()
-             try: tooltip.deiconify()
-             except Exception as e: logger.warning(f"Error deiconifying tooltip: {e}")
-
-    def hide_tooltip_debounced():
-        nonlocal leave_id; leave_id = None
-        if not widget_hover and not tooltip_hover and tooltip and tooltip.winfo_exists():
-             try: tooltip.withdraw()
-             except Exception as e: logger.warning(f"Error withdrawing tooltip: {e}")
+    def _show(self):
+        # Double check hover state and that both windows are still alive before showing
+        if not (self._widget_hover or self._tooltip_hover): return
+        if not (self._alive and self._target is not None and self._target._tip_alive): return
+        try:
+            if self._shown_text != self._text: # Retarget the shared label only when needed
+                self._label.config(text=self._text)
+                self._shown_text = self._text
+            self._position()
+            self._tooltip.deiconify()
+        except Exception as e: logger.warning("Error showing tooltip: %s", e)
+
+    def _hide(self):
+        if not self._widget_hover and not self._tooltip_hover and self._alive:
+            try: self._tooltip.withdraw()
+            except Exception as e: logger.warning("Error withdrawing tooltip: %s", e)
 
     # Event handlers
-    def on_enter(event):
-        nonlocal enter_id, leave_id, widget_hover
-        widget_hover = True
-        cancel_schedule(leave_id); leave_id = None
-        if not enter_id and tooltip and tooltip.winfo_exists() and tooltip.state() == 'withdrawn':
-             enter_id = schedule(show_tooltip_debounced, 700)
-    def on_leave(event):
-        nonlocal enter_id, leave_id, widget_hover
-        widget_hover = False
-        cancel_schedule(enter_id); enter_id = None
-        if not leave_id: leave_id = schedule(hide_tooltip_debounced, 200)
-    def on_tooltip_enter(event):
-        nonlocal leave_id, tooltip_hover
-        tooltip_hover = True
-        cancel_schedule(leave_id); leave_id = None
-    def on_tooltip_leave(event):
-         nonlocal leave_id, tooltip_hover
-         tooltip_hover = False
-         if not leave_id: leave_id = schedule(hide_tooltip_debounced, 200)
-
-    # Widget Destroy callback to clean up the tooltip
-    # Use lambda to capture the current tooltip reference
-    def on_widget_destroy(event, t=tooltip):
-         # logger.debug(f"Widget {event.widget} destroyed, cleaning up tooltip {t}")
-         if t and t.winfo_exists(): t.destroy()
-
-    # Bind events carefully, checking widget existence again
-    if widget and widget.winfo_exists():
-        try:
-            widget.bind("<Enter>", on_enter, add='+')
-            widget.bind("<Leave>", on_leave, add='+')
-            tooltip.bind("<Enter>", on_tooltip_enter, add='+')
-            tooltip.bind("<Leave>", on_tooltip_leave, add='+')
-            # Ensure tooltip is destroyed if parent widget is destroyed
-            widget.bind("<Destroy>", on_widget_destroy, add='+')
-        except tk.TclError as e:
-             logger.warning(f"Could not bind tooltip events for {widget}: {e}. Cleaning up tooltip.")
-             if tooltip and tooltip.winfo_exists(): tooltip.destroy()
-             return None
-    else:
-        # If widget somehow became invalid between start and now
-        logger.warning("Tooltip target widget became invalid before bindings could be set.")
-        if tooltip and tooltip.winfo_exists(): tooltip.destroy()
+    def _on_enter(self, widget, text):
+        if self._ensure_window(widget) is None: return
+        if self._pending_kind == "show":
+            # Pointer sweeping across widgets: let the pending show follow it instead of
+            # paying an after_cancel + after pair for every widget crossed.
+            self._target, self._text = widget, text
+            self._widget_hover = True
+            return
+        if widget is not self._target:
+            # Moving onto another widget: drop whatever the previous target had pending
+            # and take the shared window over (hiding it if it is showing the old text).
+            self._cancel()
+            self._target, self._text = widget, text
+            self._tooltip_hover = False
+            self._tooltip.withdraw()
+        else:
+            self._cancel("hide")
+        self._widget_hover = True
+        if self._tooltip.state() == 'withdrawn':
+            self._schedule("show", self._show, TOOLTIP_SHOW_DELAY_MS)
+
+    def _on_leave(self, widget):
+        if widget is not self._target: return
+        self._widget_hover = False
+        if self._pending_kind == "show": return # _show() re-checks hover when it fires
+        if self._alive and self._tooltip.state() != 'withdrawn':
+            self._schedule("hide", self._hide, TOOLTIP_HIDE_DELAY_MS)
+
+    def _on_tooltip_enter(self, event):
+        self._tooltip_hover = True
+        self._cancel("hide")
+
+    def _on_tooltip_leave(self, event):
+        self._tooltip_hover = False
+        self._schedule("hide", self._hide, TOOLTIP_HIDE_DELAY_MS)
+
+    # Cleanup
+    def _on_widget_destroy(self, event, widget):
+        if event.widget is not widget: return # <Destroy> also fires for child widgets
+        widget._tip_alive = False
+        if widget is not self._target: return
+        self._cancel()
+        self._target = self._text = None
+        self._widget_hover = self._tooltip_hover = False
+        if self._alive:
+            try: self._tooltip.withdraw()
+            except tk.TclError: pass
+
+    def _on_tooltip_destroy(self, event):
+        if event.widget is not self._tooltip: return
+        self._alive = False
+        self._after_id = self._pending_kind = None
+        self._target = self._text = None
+
+
+_tooltip_manager = _TooltipManager()
+
+def create_tooltip(widget, text):
+    """
+    Attach a tooltip to a given widget with improved safety. All widgets share one
+    tooltip window, which is only created the first time the pointer enters one of them.
+    """
+    # Basic validation of the widget itself
+    if not isinstance(widget, tk.Widget) or not widget.winfo_exists():
+        logger.warning("Cannot create tooltip for invalid or destroyed widget: %s", widget)
         return None
 
-    return tooltip # Return the tooltip object for potential external management
+    # Bind events carefully (the shared tooltip window binds its own events when created)
+    try:
+        _tooltip_manager.register(widget, text)
+    except tk.TclError as e:
+         logger.warning("Could not bind tooltip events for %s: %s.", widget, e)
+         return None
+
+    return widget # Tooltip registered on this widget
 
 
 # --- Main Application Class ---
@@ -226,13 +565,34 @@ class PlanetTrackerApp:
 
     def __init__(self, root):
         self.root = root
-        self.groq_client = None
+        self.groq_client = None # Created on first use by _get_groq_client()
+        self._groq_api_key = None
+        self._groq_client_lock = threading.Lock() # Verification and chat queries run on pool threads
+        self._llm_cache = OrderedDict() # Normalized question -> (monotonic time, reply); LRU order
+        self._llm_cache_lock = threading.Lock()
+        self._tpm_bucket = _TokenBucket(GROQ_TPM_LIMIT, GROQ_TPM_LIMIT / 60.0)
+        # Local chat commands: first word -> (argument check or None, handler), see _handle_chat_message
+        self._chat_commands = {
+            "help": (None, self._cmd_help),
+            "commands": (None, self._cmd_help),
+            "info": (bool, self._cmd_info), # Needs a body name
+            "update": (lambda args: "plot" in args, self._cmd_update_plot),
+            "animate": (None, self._cmd_animate),
+            "upcoming": (lambda args: "events" in args, self._cmd_upcoming_events),
+            "clear": (None, self._cmd_clear),
+        }
         self.llm_enabled = LLM_ENABLED # Initial value from global scope
-        self.job_running_lock = threading.Lock()
+        self._job_busy = False # Set/cleared only on the Tk main thread, so no lock is needed
         self.current_theme = "dark"
         self.orbit_positions_dict = {}
+        self._orbit_buffer = ((), np.empty((0, 3, 0))) # (names, contiguous (P, 3, N) array) behind orbit_positions_dict
         self.plot = None
         self.selected_planets = {}
+        self._planet_visible = {} # Plain-bool mirror of selected_planets (kept in sync by var traces)
+        # Case-insensitive body lookup for the chat 'info' command; the body list never changes at runtime
+        all_body_names = planet_data.get_all_planet_names() if planet_data else []
+        self._planet_name_lookup = {p.lower(): p for p in all_body_names}
+        self._known_bodies_text = ", ".join(all_body_names)
         self.planet_colors = {}
         self.color_swatches = {}
 
@@ -240,6 +600,7 @@ class PlanetTrackerApp:
         # Ensure initial types/values match expected widget usage
         self.time_var = tk.DoubleVar(value=ts.now().tt) # Default to current time JD
         self.time_display = tk.StringVar(value="Initializing...") # Set properly later
+        self._last_time_text = None # Text last written to time_display (see _set_time_display)
         self.orbit_start_var = tk.StringVar(value="2025-01-01") # Sensible default
         self.orbit_end_var = tk.StringVar(value="2026-01-01")   # Sensible default
         self.zoom_var = tk.DoubleVar(value=1.0)
@@ -250,7 +611,17 @@ class PlanetTrackerApp:
         self.speed_var = tk.DoubleVar(value=50.0) # Animation speed (ms)
         self.theme_var = tk.StringVar(value=self.current_theme)
         self.status_var = tk.StringVar(value="Initializing application...")
+        self._pending_status = None # Latest status requested by any thread, applied by _flush_status
+        self._status_flush_scheduled = False
         self.info_var = tk.StringVar(value="Select body or use chat for info...") # Panel in Tab 4
+        self._info_text_cache = {} # (body, rounded TT JD) -> rendered info panel text
+        self._notification = None # Currently shown non-blocking notification window, if any
+        self._chat_scroll_after_id = None # Pending throttled chat auto-scroll (after id)
+        self._chat_queue = deque() # (text, tag) appends waiting for _flush_chat_queue; filled from any thread
+        self._chat_flush_scheduled = False
+        self._chat_follow = False # Scroll to the end on the next flush even if the user had scrolled up
+        self._last_submit_ts = 0.0 # time.monotonic() of the last accepted chat submit
+        self._chat_input_locked = False # Chat entry disabled while an LLM reply is in flight
 
         # --- Placeholder Widget References (assigned in _create_widgets) ---
         self.content_frame = None
@@ -259,9 +630,16 @@ class PlanetTrackerApp:
         self.chat_input = None
         self.progress_bar = None
         self.right_notebook = None
+        self._tab_builders = {} # Tab widget path -> builder, for tabs not yet populated
         self.time_slider = None # Reference for slider bindings
         self.style = None
         self.themes = {} # Populated in _initialize_app
+        self._applied_theme = None # Theme last pushed to the widgets (None until first apply)
+        self._style_tables = {} # Theme name -> ttk style table, see _build_style_table
+        self._themed_tk_widgets = [] # (plain tk widget, {option: theme key}) registered at creation; ttk widgets follow self.style
+        self._slider_label_after_id = None # Pending coalesced time-label refresh (after id)
+        self._slider_preview_after_id = None # Pending debounced plot update after slider release (after id)
+        self._slider_pending_jd = None # Latest slider value not yet shown in the label
 
         logger.info("Starting Planet Tracker Application...")
         self._initialize_app_core() # Setup non-widget components (LLM, styles, plot)
@@ -287,10 +665,10 @@ class PlanetTrackerApp:
             self.style.theme_use('clam')
             logger.debug("Using 'clam' ttk theme.")
         except tk.TclError:
-            logger.warning(f"Failed to set 'clam' theme (may not be available on this system: {sys.platform}), using default ttk theme.")
+            logger.warning("Failed to set 'clam' theme (may not be available on this system: %s), using default ttk theme.", sys.platform)
             # Use default theme if clam fails
             default_theme = self.style.theme_use()
-            logger.info(f"Using default ttk theme: '{default_theme}'")
+            logger.info("Using default ttk theme: '%s'", default_theme)
 
 
         # Theme definitions (using V2 colors)
@@ -314,6 +692,8 @@ class PlanetTrackerApp:
                       "prog_trough": "#d0d0d0", "prog_bar": "#007f7f"}
         }
 
+        self._style_tables = {name: self._build_style_table(t) for name, t in self.themes.items()}
+
         # Base style configuration (applied more specifically in _apply_theme)
         self.style.configure("TNotebook", tabmargins=[2, 5, 2, 0])
         self.style.configure("TNotebook.Tab", padding=[10, 5], font=("Arial", 10))
@@ -323,7 +703,8 @@ class PlanetTrackerApp:
         self.style.configure("custom.Horizontal.TProgressbar", thickness=10)
 
         # --- Groq Client Setup ---
-        global LLM_ENABLED # Allow modification of global flag
+        global LLM_ENABLED # Allow modification of global flag (written once, below)
+        llm_enabled = False # Resolved locally, then published to the global + instance flag
         groq_api_key = os.getenv("GROQ_API_KEY")
         # Provide a clear placeholder if no key is intended
         hardcoded_default_key = "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" # Set to None explicitly, or replace "gsk_..." with your placeholder/actual default ONLY FOR LOCAL TESTING
@@ -337,35 +718,20 @@ class PlanetTrackerApp:
             # Ensure groq_api_key is None if no key was found
             groq_api_key = None
 
-        # Initialize client only if library exists and a key was found
-        if Groq and groq_api_key:
-            logger.info("Attempting to initialize Groq client...")
-            try:
-                self.groq_client = Groq(api_key=groq_api_key)
-                # Quick check: list available models to verify key/connection
-                models_list = self.groq_client.models.list()
-                if models_list.data:
-                    logger.info(f"Groq client initialized successfully. Available models include: {models_list.data[0].id}")
-                    LLM_ENABLED = True # Update global flag
-                else:
-                     logger.warning("Groq client initialized, but failed to retrieve model list. Check API key permissions.")
-                     LLM_ENABLED = False # Treat as disabled if models cannot be listed
-            except APIError as e:
-                logger.error(f"Groq API Error during initialization: {e.status_code} - {getattr(e, 'body', 'No body details')}")
-                messagebox.showerror("LLM Initialization Error", f"Failed to initialize Groq API (Error {e.status_code}).\nCheck your API key and connection.\nLLM features disabled.", parent=self.root)
-                LLM_ENABLED = False
-            except Exception as e:
-                logger.error(f"Unexpected error initializing Groq client: {e}", exc_info=True)
-                messagebox.showerror("LLM Initialization Error", f"Unexpected error initializing Groq:\n{e}\nLLM features disabled.", parent=self.root)
-                LLM_ENABLED = False
-        elif not Groq:
+        # Enable only if the library exists and a key was found. The client itself (and the
+        # groq import) is created lazily by _get_groq_client; the key/connection check runs in
+        # the background from _post_init_setup and disables the LLM again if it fails.
+        if GROQ_AVAILABLE and groq_api_key:
+            self._groq_api_key = groq_api_key
+            llm_enabled = True
+        elif not GROQ_AVAILABLE:
              # Already logged warning about library missing
-             LLM_ENABLED = False
+             llm_enabled = False
         elif not groq_api_key:
             # Already logged warning about missing key
-             LLM_ENABLED = False
+             llm_enabled = False
 
-        self.llm_enabled = LLM_ENABLED # Set instance variable based on final status
+        LLM_ENABLED = self.llm_enabled = llm_enabled # Set global + instance flag based on final status
 
         # --- Initialize PlanetPlot ---
         try:
@@ -375,60 +741,86 @@ class PlanetTrackerApp:
              self.plot = PlanetPlot(self.root, planet_data) # Pass the initialized singleton
              logger.info("PlanetPlot instance created.")
         except Exception as e:
-            logger.critical(f"Failed to initialize PlanetPlot: {e}", exc_info=True)
+            logger.critical("Failed to initialize PlanetPlot: %s", e, exc_info=True)
             messagebox.showerror("Initialization Error", f"Could not initialize the plotting component:\n{e}", parent=self.root)
             # This is critical, application can't function without the plot module
             self.root.destroy()
             sys.exit("Fatal: PlanetPlot initialization failed.")
 
+    @staticmethod
+    def _build_style_table(t: dict) -> list:
+        """
+        Builds the ttk style settings for one theme as a list of (method, style_name, options)
+        entries, where method is "configure" or "map". Built once per theme at startup so
+        _apply_theme only replays the table.
+        """
+        # Colors used by several entries, bound once
+        bg, fg, root_bg = t["bg"], t["fg"], t["root_bg"]
+        btn_bg, btn_fg, accent, accent_fg = t["btn_bg"], t["btn_fg"], t["accent"], t["accent_fg"]
+        entry_bg, entry_fg, entry_insert = t["entry_bg"], t["entry_fg"], t["entry_insert"]
+        hdr_fg, stat_fg, prog_trough, prog_bar = t["hdr_fg"], t["stat_fg"], t["prog_trough"], t["prog_bar"]
+        return [
+            ("configure", "TFrame", dict(background=bg)),
+            ("configure", "TLabel", dict(background=bg, foreground=fg, font=("Arial", 10))),
+            ("configure", "TCheckbutton", dict(background=bg, foreground=fg, font=("Arial", 10))),
+            # Indicator color can make checkboxes match theme better
+            # ("map", "TCheckbutton", dict(indicatorcolor=[('selected', accent), ('!selected', fg)])),
+
+            ("configure", "TButton", dict(background=btn_bg, foreground=btn_fg, font=("Arial", 10, "bold"), padding=5, borderwidth=1)),
+            # Map button states for visual feedback
+            ("map", "TButton", dict(
+                background=[('active', accent), ('pressed', '!disabled', accent), ('disabled', stat_fg)],
+                foreground=[('active', accent_fg), ('pressed', '!disabled', accent_fg), ('disabled', fg)])),
+
+            ("configure", "TEntry", dict(fieldbackground=entry_bg, foreground=entry_fg, insertcolor=entry_insert)),
+            # Styling TScale is notoriously platform-dependent; basic background might work
+            ("configure", "TScale", dict(background=bg)),
+            ("map", "TScale", dict(troughcolor=[('!disabled', prog_trough)], background=[('!disabled', btn_bg)])),
+
+            # Configure specific named styles used in the app
+            ("configure", "TNotebook", dict(background=root_bg)), # Background of area behind tabs
+            ("configure", "TNotebook.Tab", dict(background=bg, foreground=fg, padding=[10, 5])),
+            ("map", "TNotebook.Tab", dict(background=[("selected", accent)], foreground=[("selected", accent_fg)])),
+
+            ("configure", "Status.TLabel", dict(background=bg, foreground=stat_fg, font=("Arial", 9, "italic"))),
+            ("configure", "Header.TLabel", dict(background=bg, foreground=hdr_fg, font=("Arial", 12, "bold"))),
+            ("configure", "ColorSwatch.TLabel", dict(background=bg)), # The swatches themselves are plain tk Labels
+
+            # Configure progress bar style
+            ("configure", "custom.Horizontal.TProgressbar", dict(troughcolor=prog_trough, background=prog_bar)),
+        ]
+
     def _apply_theme(self, theme_name: str):
         """Applies the selected theme settings to GUI widgets."""
         if theme_name not in self.themes:
-            logger.warning(f"Theme '{theme_name}' not found. Using current theme '{self.current_theme}'.")
+            logger.warning("Theme '%s' not found. Using current theme '%s'.", theme_name, self.current_theme)
             return
         if not self.style:
              logger.error("Cannot apply theme: ttk.Style object not initialized.")
              return
+        if theme_name == self._applied_theme:
+            logger.debug("Theme '%s' already applied, skipping.", theme_name)
+            return
 
-        logger.info(f"Applying theme: {theme_name}")
+        logger.info("Applying theme: %s", theme_name)
         self.current_theme = theme_name
         t = self.themes[theme_name] # Get theme colors/settings dictionary
 
         try: # Wrap in try-except as widgets might not exist during initial call or shutdown
             # Apply theme to root window and main content frame
             if self.root and self.root.winfo_exists(): self.root.configure(bg=t["root_bg"])
-            if self.content_frame and self.content_frame.winfo_exists(): self.content_frame.configure(bg=t["root_bg"])
-            if self.title_label and self.title_label.winfo_exists(): self.title_label.configure(bg=t["root_bg"], fg=t["hdr_fg"])
+            # Plain tk widgets registered in _create_widgets (ttk widgets follow the styles below)
+            for widget, option_keys in self._themed_tk_widgets:
+                try: widget.configure(**{option: t[key] for option, key in option_keys.items()})
+                except tk.TclError: pass # Widget destroyed
 
             # --- Configure ttk Widget Styles ---
-            self.style.configure("TFrame", background=t["bg"])
-            self.style.configure("TLabel", background=t["bg"], foreground=t["fg"], font=("Arial", 10))
-            self.style.configure("TCheckbutton", background=t["bg"], foreground=t["fg"], font=("Arial", 10))
-            # Indicator color can make checkboxes match theme better
-            # self.style.map("TCheckbutton", indicatorcolor=[('selected', t["accent"]), ('!selected', t['fg'])])
+            # Pre-built (method, style, options) table for this theme; see _build_style_table
+            style = self.style
+            for method, style_name, options in self._style_tables[theme_name]:
+                if method == "map": style.map(style_name, **options)
+                else: style.configure(style_name, **options)
 
-            self.style.configure("TButton", background=t["btn_bg"], foreground=t["btn_fg"], font=("Arial", 10, "bold"), padding=5, borderwidth=1)
-            # Map button states for visual feedback
-            self.style.map("TButton",
-                        background=[('active', t["accent"]), ('pressed', '!disabled', t["accent"]), ('disabled', t['stat_fg'])],
-                        foreground=[('active', t['accent_fg']), ('pressed', '!disabled', t['accent_fg']), ('disabled', t['fg'])])
-
-            self.style.configure("TEntry", fieldbackground=t["entry_bg"], foreground=t["entry_fg"], insertcolor=t["entry_insert"])
-            # Styling TScale is notoriously platform-dependent; basic background might work
-            self.style.configure("TScale", background=t["bg"])
-            self.style.map("TScale", troughcolor=[('!disabled', t['prog_trough'])], background=[('!disabled', t['btn_bg'])])
-
-            # Configure specific named styles used in the app
-            self.style.configure("TNotebook", background=t["root_bg"]) # Background of area behind tabs
-            self.style.configure("TNotebook.Tab", background=t["bg"], foreground=t["fg"], padding=[10, 5])
-            self.style.map("TNotebook.Tab", background=[("selected", t["accent"])], foreground=[("selected", t['accent_fg'])])
-
-            self.style.configure("Status.TLabel", background=t["bg"], foreground=t["stat_fg"], font=("Arial", 9, "italic"))
-            self.style.configure("Header.TLabel", background=t["bg"], foreground=t["hdr_fg"], font=("Arial", 12, "bold"))
-            self.style.configure("ColorSwatch.TLabel", background=t["bg"]) # Standard tk Label, handled below
-
-            # Configure progress bar style
-            self.style.configure("custom.Horizontal.TProgressbar", troughcolor=t['prog_trough'], background=t['prog_bar'])
             if self.progress_bar and self.progress_bar.winfo_exists():
                 self.progress_bar.configure(style="custom.Horizontal.TProgressbar")
 
@@ -436,65 +828,41 @@ class PlanetTrackerApp:
             # --- Configure Standard Tk Widgets (non-ttk) ---
             # ScrolledText (Chat Display) needs direct configuration
             if self.chat_display and self.chat_display.winfo_exists():
-                self.chat_display.configure(
-                    bg=t["text_bg"], fg=t["text_fg"],
+                chat_display, text_fg = self.chat_display, t["text_fg"]
+                chat_display.configure(
+                    bg=t["text_bg"], fg=text_fg,
                     insertbackground=t["entry_insert"], # Cursor color
                     selectbackground=t["accent"],      # Selection background color
                     selectforeground=t["accent_fg"]     # Selection text color
                 )
-                # Update chat tag colors to match theme
-                user_fg = t.get("hdr_fg", "#a0c0ff") # User messages distinct color
-                self.chat_display.tag_configure("user_tag", foreground=user_fg)
-                self.chat_display.tag_configure("bot_tag", foreground=t["text_fg"])
-                self.chat_display.tag_configure("info_tag", foreground=t["stat_fg"])
-                # error_tag foreground remains hardcoded red - usually appropriate
-
-            # Color swatches (tk.Label)
-            if self.color_swatches:
-                 for planet, swatch in self.color_swatches.items():
-                     if swatch and swatch.winfo_exists():
-                         current_color = self.planet_colors.get(planet, '#808080') # Use stored color
-                         swatch.configure(background=current_color)
-
-
-            # --- Refresh Widget Styles within Notebook Tabs ---
-            # Required for theme changes to affect existing widgets in inactive tabs
-            if self.right_notebook and self.right_notebook.winfo_exists():
-                self.root.update_idletasks() # Ensure geometry is calculated before iterating
-                for tab_id_widget in self.right_notebook.tabs(): # Iterate through widget names of tabs
-                    try:
-                        frame_widget = self.root.nametowidget(tab_id_widget)
-
-                        if frame_widget and frame_widget.winfo_exists():
-                             frame_widget.configure(style="TFrame") # Update tab frame style
-                             # Recursively update children widgets
-                             for widget in frame_widget.winfo_children():
-                                 if widget.winfo_exists():
-                                     try: # Apply style based on widget class, ignore errors for non-ttk widgets
-                                         style_name = widget.winfo_class()
-                                         if style_name.startswith("T"): # Basic check for ttk widget
-                                             widget.configure(style=style_name)
-                                         elif isinstance(widget, tk.Label) and style_name == "Label":
-                                             # Handle specific tk Labels if needed, e.g., headers/status within tabs
-                                             # Check if it uses a named style like Header or Status
-                                             if widget.winfo_name() == "header_label": # Hypothetical check by name if needed
-                                                 widget.configure(style="Header.TLabel") # Re-apply named style
-                                             elif widget.cget("style") in ["Header.TLabel", "Status.TLabel"]:
-                                                  pass # Already handled by named styles
-                                             else:
-                                                 # Apply base tk Label theming (this part might need refinement)
-                                                 widget.configure(bg=t['bg'], fg=t['fg']) # Basic colors
-                                     except tk.TclError: pass # Ignore style errors for tk or complex widgets
-                    except (tk.TclError, KeyError) as e: # Catch errors finding/configuring widget
-                         logger.debug(f"Error processing tab {tab_id_widget} during theme apply: {e}")
-                    except Exception as e: logger.error(f"Error reapplying theme to widgets in tab {tab_id_widget}: {e}", exc_info=False)
-
-            logger.debug(f"Theme '{theme_name}' applied successfully.")
+                # Update chat tag colors to match theme (error_tag stays red, see _CHAT_TAGS)
+                for tag, theme_key in _CHAT_THEMED_TAGS:
+                    chat_display.tag_configure(tag, foreground=t[theme_key])
+
+            # Color swatches (tk.Label) show planet colors, which do not depend on the theme;
+            # their backgrounds are only touched when a planet color changes.
+
+            self._applied_theme = theme_name
+            logger.debug("Theme '%s' applied successfully.", theme_name)
 
         except Exception as e:
              # Catch errors during theme application (e.g., if a widget reference is invalid)
-             logger.error(f"Error occurred during theme application for '{theme_name}': {e}", exc_info=True)
+             logger.error("Error occurred during theme application for '%s': %s", theme_name, e, exc_info=True)
+
+
+    @staticmethod
+    def _hsep(parent) -> ttk.Separator:
+        """Packs the horizontal separator used between sections of a panel/tab."""
+        sep = ttk.Separator(parent, orient="horizontal")
+        sep.pack(fill="x", pady=15)
+        return sep
 
+    @staticmethod
+    def _header(parent, text: str, pady=(0, 5)) -> ttk.Label:
+        """Packs a left-aligned section header label (Header.TLabel style)."""
+        label = ttk.Label(parent, text=text, style="Header.TLabel")
+        label.pack(pady=pady, anchor="w")
+        return label
 
     def _create_widgets(self):
         """Creates and lays out all GUI widgets."""
@@ -502,7 +870,7 @@ class PlanetTrackerApp:
 
         # --- Main Content Frame ---
         self.content_frame = tk.Frame(self.root) # Use standard Frame for root container
-        # Apply background color from theme in _apply_theme
+        self._themed_tk_widgets.append((self.content_frame, {"bg": "root_bg"})) # Colored by _apply_theme
         self.content_frame.pack(fill="both", expand=True, padx=10, pady=10)
         # Configure grid weights for responsiveness
         self.content_frame.grid_rowconfigure(1, weight=1)    # Content row expands vertically
@@ -512,13 +880,13 @@ class PlanetTrackerApp:
 
         # --- Title ---
         self.title_label = tk.Label(self.content_frame, text="Planet Tracker: Galactic Nexus", font=("Arial", 24, "bold"))
-        # Theme colors applied in _apply_theme
+        self._themed_tk_widgets.append((self.title_label, {"bg": "root_bg", "fg": "hdr_fg"})) # Colored by _apply_theme
         self.title_label.grid(row=0, column=0, columnspan=3, pady=(0, 15), sticky="ew")
 
         # --- Left Panel: Planet Selection ---
         left_panel = ttk.Frame(self.content_frame, style="TFrame", padding=10)
         left_panel.grid(row=1, column=0, sticky="nsew", padx=(0, 5))
-        ttk.Label(left_panel, text="Celestial Bodies", style="Header.TLabel").pack(pady=(0,10), anchor="w")
+        self._header(left_panel, "Celestial Bodies", pady=(0, 10))
 
         # Populate from PlanetData singleton
         # Ensure planet_data is valid before using
@@ -531,7 +899,11 @@ class PlanetTrackerApp:
             all_body_names = planet_data.get_all_planet_names()
 
         self.selected_planets = {planet: tk.BooleanVar(value=True) for planet in all_body_names}
-        self.planet_colors = {planet: planet_data.get_planet_color(planet) for planet in all_body_names} if planet_data else {}
+        # Worker threads read the selection from this mirror instead of calling var.get() per body
+        self._planet_visible = dict.fromkeys(all_body_names, True)
+        for planet, var in self.selected_planets.items():
+            var.trace_add("write", lambda *_args, p=planet: self._sync_planet_visible(p))
+        self.planet_colors = planet_data.get_all_planet_colors() if planet_data else {} # Fresh dict, safe to modify
         self.color_swatches = {} # Initialize empty dict for swatches
 
         # Scrollable frame for planet list (using basic Frame + potential future Scrollbar)
@@ -539,54 +911,27 @@ class PlanetTrackerApp:
         planet_list_container = ttk.Frame(left_panel)
         planet_list_container.pack(fill="both", expand=True)
 
+        planet_colors, color_swatches = self.planet_colors, self.color_swatches # Bound once for the loop
         for planet, var in self.selected_planets.items():
             p_frame = ttk.Frame(planet_list_container, style="TFrame") # Frame for each planet row
-            p_frame.pack(fill="x", pady=2)
+            p_frame.pack(**PLANET_ROW_PACK)
 
-            # Swatch (use standard tk Label for simple colored square)
-            swatch = tk.Label(p_frame, text="", width=2, relief="solid", borderwidth=1)
-            swatch.configure(background=self.planet_colors.get(planet, "#808080")) # Use .get() with fallback
-            swatch.pack(side="left", padx=(0, 5))
-            self.color_swatches[planet] = swatch # Store reference to the swatch widget
+            # Swatch (use standard tk Label for simple colored square); color set at creation
+            try: swatch_color = planet_colors[planet] # Every body has a color; miss is the rare case
+            except KeyError: swatch_color = "#808080"
+            swatch = tk.Label(p_frame, background=swatch_color, **PLANET_SWATCH_KW)
+            swatch.pack(**PLANET_SWATCH_PACK)
+            color_swatches[planet] = swatch # Store reference to the swatch widget
 
             # Checkbox
             cb = ttk.Checkbutton(p_frame, text=planet, variable=var, style="TCheckbutton")
-            cb.pack(side="left", expand=True, fill="x", padx=(0, 5))
-            create_tooltip(cb, f"Toggle visibility of {planet}")
-
-            # Color Picker Button Logic (using closure to capture planet name and swatch)
-            def _create_color_handler(p_name, swatch_widget):
-                def _set_color():
-                    initial_color = self.planet_colors.get(p_name, '#808080') # Current color as initial
-                    # Use colorchooser from tkinter
-                    try:
-                         # Provide root window as parent for modal behavior
-                         result = colorchooser.askcolor(parent=self.root, title=f"Choose color for {p_name}", initialcolor=initial_color)
-                         chosen_color_info = result if result and result[1] else None # askcolor returns (rgb_tuple, hex_string) or None
-
-                         if chosen_color_info:
-                              chosen_hex = chosen_color_info[1] # Get the hex string (#RRGGBB)
-                              self.planet_colors[p_name] = chosen_hex
-                              if swatch_widget.winfo_exists(): swatch_widget.configure(background=chosen_hex)
-                              logger.info(f"Color updated for {p_name}: {chosen_hex}")
-                              # Potentially trigger plot update if desired, or wait for explicit update
-                              # self._run_long_task(self._update_preview)
-                    except tk.TclError as e:
-                         # Handles cases like window manager issues or dialog being closed abruptly
-                         logger.error(f"TclError opening color chooser for {p_name}: {e}", exc_info=True)
-                         if self.root and self.root.winfo_exists(): # Show error if main window still exists
-                             messagebox.showerror("Color Chooser Error", f"Could not open color chooser for {p_name}.\n({e})", parent=self.root)
-                    except Exception as e: # Catch any other unexpected error
-                         logger.error(f"Unexpected error during color selection for {p_name}: {e}", exc_info=True)
-                         if self.root and self.root.winfo_exists():
-                             messagebox.showerror("Error", f"An unexpected error occurred during color selection for {p_name}.", parent=self.root)
-
-                return _set_color
-
-            color_handler = _create_color_handler(planet, swatch)
-            color_btn = ttk.Button(p_frame, text="Set", width=4, command=color_handler, style="TButton")
+            cb.pack(**PLANET_CHECK_PACK)
+            create_tooltip(cb, PLANET_TOGGLE_TIP.format(planet))
+
+            color_btn = ttk.Button(p_frame, command=lambda p=planet, sw=swatch: self._open_color_chooser(p, sw),
+                                   **PLANET_SET_BTN_KW)
             color_btn.pack(side="right") # Align to the right of the row
-            create_tooltip(color_btn, f"Choose display color for {planet}")
+            create_tooltip(color_btn, PLANET_COLOR_TIP.format(planet))
 
         # --- Right Panel: Controls & Info (Tabs) ---
         right_panel = ttk.Frame(self.content_frame, style="TFrame", padding=(5, 0))
@@ -612,49 +957,28 @@ class PlanetTrackerApp:
         self.right_notebook.add(self.tab_info_events, text=' Info / Events ')
 
         # --- Populate Tab 1: Time & Orbit Range ---
-        ttk.Label(self.tab_time_orbits, text="Time Navigation", style="Header.TLabel").pack(pady=(0, 5), anchor="w")
+        self._header(self.tab_time_orbits, "Time Navigation")
         # Set initial time display based on variable value (will be accurate JD from calculations module)
-        try: self.time_display.set(ts.tt(jd=self.time_var.get()).utc_strftime('%Y-%m-%d %H:%M UTC'))
-        except Exception as e: logger.error(f"Failed to set initial time display value: {e}"); self.time_display.set("Error")
+        try: self._set_time_display(_format_time_label(self.time_var.get()))
+        except Exception as e: logger.error("Failed to set initial time display value: %s", e); self._set_time_display("Error")
         ttk.Label(self.tab_time_orbits, textvariable=self.time_display, font=("Arial", 10)).pack(pady=(0, 5), anchor="w")
 
-        # Time Slider - Determine bounds from ephemeris safely
-        try:
-            # Use the IMPORTED ephemeris bounds now
-            t_slider_start_obj = ts.tt(jd=ephem_start_jd) # Use actual ephem bounds
-            t_slider_end_obj = ts.tt(jd=ephem_end_jd)
-            slider_start_yr = t_slider_start_obj.utc_datetime().year
-            slider_end_yr = t_slider_end_obj.utc_datetime().year
-            tooltip_text = f"Slide to navigate time\n({slider_start_yr} – {slider_end_yr})"
-            slider_min = ephem_start_jd
-            slider_max = ephem_end_jd
-        except Exception as e:
-            # Should not happen now if imports worked, but keep fallback
-            logger.error(f"Could not determine slider range from imported ephemeris bounds: {e}", exc_info=True)
-            slider_min = ts.from_datetime(EPHEMERIS_START).tt
-            slider_max = ts.from_datetime(EPHEMERIS_END).tt
-            tooltip_text = f"Slide to navigate time\n({EPHEMERIS_START.year} – {EPHEMERIS_END.year})"
-
+        # Time Slider - bounds come from the ephemeris (computed once, see SLIDER_MIN_JD)
         # Add handler to update the time display label WHILE sliding
-        def _update_time_display_from_slider(value):
-             if self.real_time_var.get(): return
-             if self.root and self.root.winfo_exists():
-                 self.root.after(0, self._update_time_label_only, float(value))
-
-        # Create the slider
-        self.time_slider = ttk.Scale(self.tab_time_orbits, from_=slider_min, to=slider_max,
+        # Create the slider (drag events are coalesced by _on_time_slider_move)
+        self.time_slider = ttk.Scale(self.tab_time_orbits, from_=SLIDER_MIN_JD, to=SLIDER_MAX_JD,
                                      variable=self.time_var, orient=tk.HORIZONTAL,
                                      style="TScale", length=250,
-                                     command=_update_time_display_from_slider)
+                                     command=self._on_time_slider_move)
         self.time_slider.pack(pady=(5, 15), fill="x")
-        create_tooltip(self.time_slider, tooltip_text)
+        create_tooltip(self.time_slider, SLIDER_TOOLTIP)
 
         # Binding: Trigger the *heavy* plot update only on slider release
         self.time_slider.bind("<ButtonRelease-1>", self._on_time_slider_release)
 
         # --- Orbit Display Range Section ---
-        ttk.Separator(self.tab_time_orbits, orient="horizontal").pack(fill="x", pady=15)
-        ttk.Label(self.tab_time_orbits, text="Orbit Display Range", style="Header.TLabel").pack(pady=5, anchor="w")
+        self._hsep(self.tab_time_orbits)
+        self._header(self.tab_time_orbits, "Orbit Display Range", pady=5)
 
         ttk.Label(self.tab_time_orbits, text="Start Date (YYYY-MM-DD):").pack(anchor="w")
         orbit_start_entry = ttk.Entry(self.tab_time_orbits, textvariable=self.orbit_start_var, width=15, style="TEntry")
@@ -666,8 +990,84 @@ class PlanetTrackerApp:
         orbit_end_entry.pack(pady=(0,5), anchor="w")
         create_tooltip(orbit_end_entry, "End date for calculating and displaying orbit lines (inclusive).")
 
-        # --- Populate Tab 2: View & Animation ---
-        ttk.Label(self.tab_view_anim, text="Plot View Settings", style="Header.TLabel").pack(pady=(0, 5), anchor="w")
+        # --- Tabs 2-4: populated on first visit (see _on_tab_changed) ---
+        # Their widgets only read/write Tk variables created in __init__, so nothing else
+        # depends on them existing before the user opens the tab.
+        self._tab_builders = {
+            str(self.tab_view_anim): self._populate_view_anim_tab,
+            str(self.tab_settings_export): self._populate_settings_export_tab,
+            str(self.tab_info_events): self._populate_info_events_tab,
+        }
+        self.right_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # --- Status Bar & Progress Bar Area (Bottom of Right Panel) ---
+        status_frame = ttk.Frame(right_panel, style="TFrame")
+        status_frame.grid(row=1, column=0, sticky="ew", pady=(5, 0))
+        status_frame.grid_columnconfigure(0, weight=1) # Status label expands
+        status_frame.grid_columnconfigure(1, weight=0) # Progress bar fixed width
+
+        status_label = ttk.Label(status_frame, textvariable=self.status_var, style="Status.TLabel", anchor="w")
+        status_label.grid(row=0, column=0, sticky="ew", padx=(5, 0))
+
+        # Progress bar - Initially hidden, shown during long tasks
+        self.progress_bar = ttk.Progressbar(status_frame, orient=tk.HORIZONTAL, mode='indeterminate', length=100, style="custom.Horizontal.TProgressbar")
+        # Gridded/ungridded dynamically by _run_long_task / _cleanup_task
+
+
+        # --- Center Panel: Chatbot Interface ---
+        chat_frame = ttk.Frame(self.content_frame, style="TFrame", padding=10)
+        chat_frame.grid(row=1, column=1, sticky="nsew", padx=(5, 5))
+        chat_frame.grid_rowconfigure(0, weight=1) # Chat display expands vertically
+        chat_frame.grid_rowconfigure(1, weight=0) # Input area fixed height
+        chat_frame.grid_columnconfigure(0, weight=1) # Display expands horizontally
+
+        # Use ScrolledText widget for automatic scrollbars
+        self.chat_display = scrolledtext.ScrolledText(
+             chat_frame, wrap=tk.WORD, state='disabled', # Start disabled, enable to add text
+             font=("Arial", 10), relief="solid", borderwidth=1, padx=5, pady=5,
+             # Background/foreground set by _apply_theme
+        )
+        self.chat_display.grid(row=0, column=0, sticky="nsew", pady=(0, 5))
+        # Wheel scrolling is bound on the chat display and its scrollbar (Windows/macOS
+        # deliver <MouseWheel>, X11 delivers <Button-4>/<Button-5>). Widget-local bindings
+        # mean Tk does the hit test; no winfo_containing or master walk per event.
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.chat_display.bind(sequence, self._on_mousewheel)
+            self.chat_display.vbar.bind(sequence, self._on_mousewheel)
+
+        # Define text tags for styling messages (colors applied by theme)
+        for tag, options, _theme_key in _CHAT_TAGS:
+            self.chat_display.tag_configure(tag, **options)
+        # Appends insert at a named mark (a hash lookup in Tk) rather than resolving 'end' each time;
+        # right gravity keeps it after inserted text, and it survives 'clear' (collapses to 1.0)
+        self.chat_display.mark_set(CHAT_END_MARK, tk.END)
+        self.chat_display.mark_gravity(CHAT_END_MARK, tk.RIGHT)
+
+        # Input Frame for Entry and Send Button
+        input_frame = ttk.Frame(chat_frame, style="TFrame")
+        input_frame.grid(row=1, column=0, sticky="ew")
+        input_frame.grid_columnconfigure(0, weight=1) # Entry expands
+        input_frame.grid_columnconfigure(1, weight=0) # Button fixed width
+
+        self.chat_input = ttk.Entry(input_frame, font=("Arial", 11), style="TEntry")
+        self.chat_input.grid(row=0, column=0, sticky="ew", padx=(0,5), ipady=3) # Internal padding
+        # Bind Enter key to send message function
+        self.chat_input.bind("<Return>", self._handle_chat_message)
+
+        send_button = ttk.Button(input_frame, text="Send", command=self._handle_chat_message, style="TButton")
+        send_button.grid(row=0, column=1) # Automatically aligns right due to previous column weight
+
+        logger.debug("Widget creation complete.")
+
+    def _on_tab_changed(self, event=None):
+        """Builds a notebook tab's widgets the first time it is selected."""
+        builder = self._tab_builders.pop(self.right_notebook.select(), None)
+        if builder is not None:
+            builder()
+
+    def _populate_view_anim_tab(self):
+        """Tab 2: View & Animation."""
+        self._header(self.tab_view_anim, "Plot View Settings")
 
         ttk.Label(self.tab_view_anim, text="Planet Size Zoom:").pack(anchor="w")
         zoom_slider = ttk.Scale(self.tab_view_anim, from_=0.1, to=5.0, orient=tk.HORIZONTAL, variable=self.zoom_var, style="TScale", length=200)
@@ -684,8 +1084,8 @@ class PlanetTrackerApp:
         azim_scale.pack(pady=(0, 5), fill="x")
         create_tooltip(azim_scale, "Set plot camera horizontal rotation angle (degrees around Z axis).")
 
-        ttk.Separator(self.tab_view_anim, orient="horizontal").pack(fill="x", pady=15)
-        ttk.Label(self.tab_view_anim, text="Animation & Time Mode", style="Header.TLabel").pack(pady=(0, 5), anchor="w")
+        self._hsep(self.tab_view_anim)
+        self._header(self.tab_view_anim, "Animation & Time Mode")
 
         # Command links to handler methods
         animate_cb = ttk.Checkbutton(self.tab_view_anim, text="Generate Animation", variable=self.animate_var,
@@ -703,8 +1103,9 @@ class PlanetTrackerApp:
         speed_slider.pack(pady=(0, 5), fill="x")
         create_tooltip(speed_slider, "Adjust animation playback frame duration (Lower = Faster). Affects generation process.")
 
-        # --- Populate Tab 3: Settings & Export ---
-        ttk.Label(self.tab_settings_export, text="Appearance", style="Header.TLabel").pack(pady=(0, 5), anchor="w")
+    def _populate_settings_export_tab(self):
+        """Tab 3: Settings & Export."""
+        self._header(self.tab_settings_export, "Appearance")
         ttk.Label(self.tab_settings_export, text="UI Theme:").pack(anchor="w")
         theme_menu = ttk.OptionMenu(self.tab_settings_export, self.theme_var, self.current_theme,
                                     *list(self.themes.keys()), # Use themes defined in init
@@ -712,8 +1113,8 @@ class PlanetTrackerApp:
         theme_menu.pack(pady=(0, 15), anchor="w")
         create_tooltip(theme_menu, "Switch UI color theme (Dark/Light).")
 
-        ttk.Separator(self.tab_settings_export, orient="horizontal").pack(fill="x", pady=15)
-        ttk.Label(self.tab_settings_export, text="Plot Actions", style="Header.TLabel").pack(pady=5, anchor="w")
+        self._hsep(self.tab_settings_export)
+        self._header(self.tab_settings_export, "Plot Actions", pady=5)
         plot_btn_frame = ttk.Frame(self.tab_settings_export, style="TFrame")
         plot_btn_frame.pack(fill="x", pady=5)
 
@@ -729,8 +1130,8 @@ class PlanetTrackerApp:
         export_data_btn.pack(side="top", fill="x", pady=3)
         create_tooltip(export_data_btn, "Save calculated orbit positions from the last plot update to a CSV file.")
 
-        ttk.Separator(self.tab_settings_export, orient="horizontal").pack(fill="x", pady=15)
-        ttk.Label(self.tab_settings_export, text="Application Settings", style="Header.TLabel").pack(pady=5, anchor="w")
+        self._hsep(self.tab_settings_export)
+        self._header(self.tab_settings_export, "Application Settings", pady=5)
         settings_btn_frame = ttk.Frame(self.tab_settings_export, style="TFrame")
         settings_btn_frame.pack(fill="x", pady=5)
 
@@ -742,74 +1143,23 @@ class PlanetTrackerApp:
         load_btn.pack(side="left", padx=(5,0), expand=True, fill='x')
         create_tooltip(load_btn, "Load settings from a previously saved JSON file.")
 
-        # --- Populate Tab 4: Info & Events ---
-        ttk.Label(self.tab_info_events, text="Body Information", style="Header.TLabel").pack(pady=(0, 5), anchor="w")
+    def _populate_info_events_tab(self):
+        """Tab 4: Info & Events."""
+        self._header(self.tab_info_events, "Body Information")
         # Wraplength ensures text wraps within the tab width
         info_label_widget = ttk.Label(self.tab_info_events, textvariable=self.info_var, justify=tk.LEFT, wraplength=280, style="TLabel", font=("Arial", 9)) # Slightly smaller font
         info_label_widget.pack(pady=(0,15), fill="x", anchor="w")
 
-        ttk.Separator(self.tab_info_events, orient="horizontal").pack(fill="x", pady=15)
-        ttk.Label(self.tab_info_events, text="Astronomical Events", style="Header.TLabel").pack(pady=5, anchor="w")
+        self._hsep(self.tab_info_events)
+        self._header(self.tab_info_events, "Astronomical Events", pady=5)
 
-        # Run event calculation in a thread to avoid blocking GUI
+        # Run event calculation through the shared task runner (busy guard, progress bar, status)
         # Lambda ensures current state of `respond_in_chat=False` is captured
         events_btn = ttk.Button(self.tab_info_events, text="Show Upcoming Events (Next Year)",
-                               command=lambda: threading.Thread(target=self._show_upcoming_events, args=(False,), daemon=True).start(),
+                               command=lambda: self._run_long_task(self._show_upcoming_events, (False,)),
                                style="TButton")
         events_btn.pack(pady=10, fill="x")
-        create_tooltip(events_btn, "Calculate major conjunctions/oppositions for selected planets within the next year.\n(Shows results in a popup message box)")
-
-
-        # --- Status Bar & Progress Bar Area (Bottom of Right Panel) ---
-        status_frame = ttk.Frame(right_panel, style="TFrame")
-        status_frame.grid(row=1, column=0, sticky="ew", pady=(5, 0))
-        status_frame.grid_columnconfigure(0, weight=1) # Status label expands
-        status_frame.grid_columnconfigure(1, weight=0) # Progress bar fixed width
-
-        status_label = ttk.Label(status_frame, textvariable=self.status_var, style="Status.TLabel", anchor="w")
-        status_label.grid(row=0, column=0, sticky="ew", padx=(5, 0))
-
-        # Progress bar - Initially hidden, shown during long tasks
-        self.progress_bar = ttk.Progressbar(status_frame, orient=tk.HORIZONTAL, mode='indeterminate', length=100, style="custom.Horizontal.TProgressbar")
-        # Gridded/ungridded dynamically by _run_long_task / _cleanup_task
-
-
-        # --- Center Panel: Chatbot Interface ---
-        chat_frame = ttk.Frame(self.content_frame, style="TFrame", padding=10)
-        chat_frame.grid(row=1, column=1, sticky="nsew", padx=(5, 5))
-        chat_frame.grid_rowconfigure(0, weight=1) # Chat display expands vertically
-        chat_frame.grid_rowconfigure(1, weight=0) # Input area fixed height
-        chat_frame.grid_columnconfigure(0, weight=1) # Display expands horizontally
-
-        # Use ScrolledText widget for automatic scrollbars
-        self.chat_display = scrolledtext.ScrolledText(
-             chat_frame, wrap=tk.WORD, state='disabled', # Start disabled, enable to add text
-             font=("Arial", 10), relief="solid", borderwidth=1, padx=5, pady=5,
-             # Background/foreground set by _apply_theme
-        )
-        self.chat_display.grid(row=0, column=0, sticky="nsew", pady=(0, 5))
-
-        # Define text tags for styling messages (colors applied by theme)
-        self.chat_display.tag_configure("user_tag", font=("Arial", 10, "bold")) # Bold for user input
-        self.chat_display.tag_configure("bot_tag") # Default style for bot
-        self.chat_display.tag_configure("error_tag", foreground="red") # Red for errors
-        self.chat_display.tag_configure("info_tag", font=("Arial", 10, "italic")) # Italic for info messages
-
-        # Input Frame for Entry and Send Button
-        input_frame = ttk.Frame(chat_frame, style="TFrame")
-        input_frame.grid(row=1, column=0, sticky="ew")
-        input_frame.grid_columnconfigure(0, weight=1) # Entry expands
-        input_frame.grid_columnconfigure(1, weight=0) # Button fixed width
-
-        self.chat_input = ttk.Entry(input_frame, font=("Arial", 11), style="TEntry")
-        self.chat_input.grid(row=0, column=0, sticky="ew", padx=(0,5), ipady=3) # Internal padding
-        # Bind Enter key to send message function
-        self.chat_input.bind("<Return>", self._handle_chat_message)
-
-        send_button = ttk.Button(input_frame, text="Send", command=self._handle_chat_message, style="TButton")
-        send_button.grid(row=0, column=1) # Automatically aligns right due to previous column weight
-
-        logger.debug("Widget creation complete.")
+        create_tooltip(events_btn, "Calculate major conjunctions/oppositions for selected planets within the next year.\n(Shows results in a notification; click it to close)")
 
     def _post_init_setup(self):
         """Perform setup tasks after all widgets are created and theme applied."""
@@ -823,134 +1173,238 @@ class PlanetTrackerApp:
         # Ensure status bar is correctly initialized
         self.set_status("Ready.")
 
+        # Touch the ephemeris and Skyfield's lazy paths off the UI thread so the first
+        # plot/event request does not pay for them
+        _background_pool.submit(warm_up)
+        # Verify the Groq key/connection without blocking startup on the network
+        if self.llm_enabled: _background_pool.submit(self._verify_groq_client)
+
         # Set focus to chat input initially for convenience
         if self.chat_input and self.chat_input.winfo_exists():
             self.chat_input.focus_set()
         logger.debug("Post-initialization setup complete.")
 
 
+    def _get_groq_client(self):
+        """Returns the Groq client, importing groq and creating it on first call (any thread)."""
+        with self._groq_client_lock:
+            if self.groq_client is None and self._groq_api_key and _load_groq():
+                logger.info("Attempting to initialize Groq client...")
+                self.groq_client = Groq(api_key=self._groq_api_key, timeout=GROQ_TIMEOUT_S, max_retries=GROQ_MAX_RETRIES)
+            return self.groq_client
+
+    def _verify_groq_client(self):
+        """Lists the available Groq models to verify key/connection (runs in background thread)."""
+        try:
+            client = self._get_groq_client()
+        except Exception as e:
+            logger.error("Unexpected error initializing Groq client: %s", e, exc_info=True)
+            client = None
+        if client is None:
+            reason = "Could not create the Groq client."
+            if self.root and self.root.winfo_exists():
+                self.root.after(0, self._disable_llm, reason)
+            return
+        try:
+            models_list = client.models.list()
+            if models_list.data:
+                logger.info("Groq client initialized successfully. Available models include: %s", models_list.data[0].id)
+                return
+            logger.warning("Groq client initialized, but failed to retrieve model list. Check API key permissions.")
+            reason = "No models available for this API key."
+        except APIError as e:
+            logger.error("Groq API Error during initialization: %s - %s", e.status_code, getattr(e, 'body', 'No body details'))
+            reason = f"Failed to initialize Groq API (Error {e.status_code}). Check your API key and connection."
+        except Exception as e:
+            logger.error("Unexpected error verifying Groq client: %s", e, exc_info=True)
+            reason = f"Unexpected error initializing Groq: {e}"
+        if self.root and self.root.winfo_exists():
+            self.root.after(0, self._disable_llm, reason)
+
+    def _disable_llm(self, reason: str):
+        """Turns the LLM assistant off after a failed verification (main thread)."""
+        global LLM_ENABLED
+        LLM_ENABLED = False
+        self.llm_enabled = False
+        self._show_notification("LLM Initialization Error", f"{reason}\nLLM features disabled.", "error")
+
+
     # --- Utility Functions (Threading, Status, Progress, GUI Updates) ---
 
     def _run_long_task(self, target_func: Callable, args: tuple = ()):
         """Manages running a potentially long task in a background thread with GUI feedback."""
-        if not self.job_running_lock.acquire(blocking=False):
-            # If lock is already held, inform user and prevent starting new task
+        if self._job_busy:
+            # If a task is already running, inform user and prevent starting new task
             self.add_chat_message("Nexus", "System busy processing another request. Please wait.", tag="error_tag")
-            task_name = target_func.__name__.replace('_', ' ').title()
-            logger.warning(f"Task '{task_name}' blocked: Another task is already running.")
+            logger.warning("Task '%s' blocked: Another task is already running.", _task_display_name(target_func))
             # Specific handling for animation toggle failure
             if target_func == self._compute_animation_frames and self.root.winfo_exists():
                  self.root.after(100, lambda: self.animate_var.set(False)) # Untick the box
             return # Do not start the new task
+        self._job_busy = True
 
         # Show and start the progress bar
         if self.progress_bar and self.progress_bar.winfo_exists():
              try:
                  self.progress_bar.grid(row=0, column=1, sticky="e", padx=5) # Place it
                  self.progress_bar.start(10) # Start indeterminate animation
-             except tk.TclError as e: logger.warning(f"Error starting progress bar: {e}")
+             except tk.TclError as e: logger.warning("Error starting progress bar: %s", e)
         else: logger.warning("Progress bar widget not available for task start.")
 
         # Provide immediate feedback on what's starting
-        readable_name = target_func.__name__.replace('_', ' ').replace('compute ', '').replace('update ', '').replace('get ', '').capitalize()
-        if readable_name.startswith('Show'): readable_name = readable_name.split(' ')[1] # e.g. Upcoming events
-        if readable_name.endswith(' preview'): readable_name = readable_name.replace(' preview', ' plot')
+        readable_name = _task_display_name(target_func)
         self.set_status(f"Processing: {readable_name}...")
-        logger.info(f"Starting background task: {target_func.__name__} with args: {args if args else '()'}")
+        logger.info("Starting background task: %s with args: %s", target_func.__name__, args) # %s formats () as '()'
+
+        # Use a descriptive thread name for logging/debugging
+        thread_name = f"Task-{readable_name.split(' ')[0]}"[:15] # Max thread name length often limited
 
         # --- Worker Thread Definition ---
+        root, task_func_name = self.root, target_func.__name__ # Bound once for the closure below
+        is_animation = target_func == self._compute_animation_frames
         def task_wrapper():
+            threading.current_thread().name = thread_name # Pool threads are reused; name them per task
             final_status = "Task Completed" # Default status
-            task_start_time = datetime.now()
+            task_start_time = time.perf_counter() # Monotonic interval timer
             try:
                 # Execute the target function
                 result = target_func(*args)
                 # Optionally use result to set final status if function returns string
                 if isinstance(result, str): final_status = result
-                logger.info(f"Background task {target_func.__name__} finished successfully in {(datetime.now() - task_start_time).total_seconds():.2f}s.")
+                logger.info("Background task %s finished successfully in %.2fs.", task_func_name, time.perf_counter() - task_start_time)
             except Exception as e:
-                logger.error(f"Error in background task {target_func.__name__}: {e}", exc_info=True)
+                logger.error("Error in background task %s: %s", task_func_name, e, exc_info=True)
                 final_status = f"Error during {readable_name}: Check logs."
                 # Show error in chat (via main thread)
-                if self.root and self.root.winfo_exists():
+                if root and root.winfo_exists():
                      self.add_chat_message("Nexus", f"Error processing '{readable_name}'. Please check logs.", tag="error_tag")
                 # Specific cleanup for failed animation toggle
-                if target_func == self._compute_animation_frames and self.root and self.root.winfo_exists():
-                    self.root.after(100, lambda: self.animate_var.set(False)) # Untick the box on failure
+                if is_animation and root and root.winfo_exists():
+                    root.after(100, lambda: self.animate_var.set(False)) # Untick the box on failure
             finally:
                 # --- Cleanup (always run) ---
                 # Schedule GUI cleanup (stop progress bar, set status) on main thread
-                if self.root and self.root.winfo_exists():
+                if root and root.winfo_exists():
                      # Pass final status message to the cleanup function
-                     self.root.after(0, self._cleanup_task, final_status)
-                # Always release the lock, even if root is destroyed
-                # (needs try-except in case thread finished after lock already released, e.g. by shutdown)
-                try:
-                    if self.job_running_lock.locked():
-                        self.job_running_lock.release()
-                        # logger.debug(f"Job lock released by task {target_func.__name__}")
-                except threading.ThreadError as te:
-                    # This can happen if lock was already released (e.g., multiple finally blocks, shutdown race)
-                    logger.warning(f"Ignoring ThreadError on lock release (task: {target_func.__name__}): {te}")
+                     root.after(0, self._cleanup_task, final_status)
+                # The busy flag is cleared by _cleanup_task on the main thread
                 # Log task completion time from background thread
-                task_end_time = datetime.now()
-                duration = (task_end_time - task_start_time).total_seconds()
-                logger.debug(f"Task wrapper for {target_func.__name__} finished in {duration:.2f}s. Final status to be set: '{final_status}'")
+                if logger.isEnabledFor(logging.DEBUG):
+                    duration = time.perf_counter() - task_start_time
+                    logger.debug("Task wrapper for %s finished in %.2fs. Final status to be set: '%s'", task_func_name, duration, final_status)
         # --- End Worker Thread Definition ---
 
-        # Create and start the daemon thread
-        thread = threading.Thread(target=task_wrapper, daemon=True)
-        # Use a descriptive thread name for logging/debugging
-        thread.name = f"Task-{readable_name.split(' ')[0]}"[:15] # Max thread name length often limited
-        thread.start()
+        # Hand the task to the persistent background pool
+        _background_pool.submit(task_wrapper)
 
 
     def _cleanup_task(self, final_status: str):
         """Hides progress bar, sets final status message. Called via root.after from task thread."""
+        self._job_busy = False # Allow the next task to start
         # Check widget existence before manipulating GUI elements
-        if self.progress_bar and self.progress_bar.winfo_exists():
-            if self.progress_bar.winfo_ismapped(): # Check if it's currently visible
+        progress_bar = self.progress_bar
+        if progress_bar and progress_bar.winfo_exists():
+            if progress_bar.winfo_ismapped(): # Check if it's currently visible
                 try:
-                    self.progress_bar.stop()
-                    self.progress_bar.grid_forget() # Hide it
-                except tk.TclError as e: logger.warning(f"Error stopping/hiding progress bar: {e}")
+                    progress_bar.stop()
+                    progress_bar.grid_forget() # Hide it
+                except tk.TclError as e: logger.warning("Error stopping/hiding progress bar: %s", e)
         else: logger.debug("Progress bar doesn't exist or was destroyed before cleanup.")
 
+        # Re-open chat input locked for an LLM query
+        if self._chat_input_locked:
+            self._chat_input_locked = False
+            chat_input = self.chat_input
+            if chat_input and chat_input.winfo_exists():
+                chat_input.configure(state="normal")
+                chat_input.focus_set()
+
         # Set the final status message provided by the task
         self.set_status(final_status)
-        logger.info(f"Task cleanup complete. Final status: '{final_status}'")
+        logger.info("Task cleanup complete. Final status: '%s'", final_status)
 
 
     def set_status(self, message: str):
-        """Safely updates the status bar label from any thread using root.after."""
+        """
+        Safely updates the status bar label from any thread. Messages arriving
+        faster than the main loop goes idle are coalesced; only the latest is shown.
+        """
+        self._pending_status = message
+        if self._status_flush_scheduled: return # A flush is already queued; it will pick this message up
         # Schedule the update on the main thread to avoid Tkinter errors
-        if self.root and self.root.winfo_exists() and self.status_var:
-             # Use default args in lambda to capture current message value
-             self.root.after(0, lambda msg=message: self.status_var.set(msg))
+        root = self.root
+        if root and self.status_var and root.winfo_exists():
+             self._status_flush_scheduled = True
+             root.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Applies the latest pending status message (main thread only)."""
+        self._status_flush_scheduled = False # Cleared before reading, so a newer message reschedules
+        message, status_var = self._pending_status, self.status_var
+        if message is not None and message != status_var.get(): # Skip redundant label redraws
+            status_var.set(message)
 
 
     def _update_time_label_only(self, slider_jd_value: float):
         """Updates only the time display label, e.g., during slider movement."""
         try:
-            current_t = ts.tt(jd=slider_jd_value)
-            time_str = current_t.utc_strftime('%Y-%m-%d %H:%M UTC')
+            time_str = _format_time_label(slider_jd_value) # Minute resolution, cached
             prefix = "(Real-Time) " if self.real_time_var.get() else ""
-            # Check widget existence before setting
+            # Check widget existence before setting (unchanged text is skipped by _set_time_display)
             if self.time_display and self.root.winfo_exists():
-                self.time_display.set(f"{prefix}{time_str}")
+                self._set_time_display(f"{prefix}{time_str}")
         except Exception as e:
-            logger.error(f"Error updating time display label: {e}")
-            if self.time_display: self.time_display.set("Error updating time")
-
+            logger.error("Error updating time display label: %s", e)
+            if self.time_display: self._set_time_display("Error updating time")
+
+    def _set_time_display(self, text: str):
+        """Writes the time label variable, skipping the write when the text is unchanged."""
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self.time_display.set(text)
+
+
+    def _on_time_slider_move(self, value):
+        """
+        Slider command callback. Dragging fires this for every pixel of movement, so
+        only the latest value is remembered and the label is refreshed at most once
+        per SLIDER_LABEL_UPDATE_MS.
+        """
+        if self.real_time_var.get(): return
+        self._slider_pending_jd = float(value)
+        if self._slider_label_after_id is None and self.root and self.root.winfo_exists():
+            self._slider_label_after_id = self.root.after(SLIDER_LABEL_UPDATE_MS, self._flush_slider_label)
+
+    def _flush_slider_label(self):
+        """Applies the most recent coalesced slider value to the time label."""
+        if self._slider_label_after_id is not None:
+            try: self.root.after_cancel(self._slider_label_after_id)
+            except tk.TclError: pass # Already fired
+            self._slider_label_after_id = None
+        if self._slider_pending_jd is not None:
+            self._update_time_label_only(self._slider_pending_jd)
+            self._slider_pending_jd = None
 
     def _on_time_slider_release(self, event=None):
-         """Callback when the time slider is released - triggers plot update."""
+         """Callback when the time slider is released - schedules a (debounced) plot update."""
+         self._flush_slider_label() # Show the final position right away
          if not self.real_time_var.get(): # Only trigger update if not in real-time mode
-              logger.debug(f"Time slider released at value {self.time_var.get():.4f}. Triggering plot update.")
-              self._trigger_plot_update()
+              if logger.isEnabledFor(logging.DEBUG): # Avoid the Tcl variable read when debug is off
+                   logger.debug("Time slider released at value %.4f. Scheduling plot update.", self.time_var.get())
+              # Restart the timer on every release so a burst of releases recomputes only once
+              if self._slider_preview_after_id is not None:
+                   try: self.root.after_cancel(self._slider_preview_after_id)
+                   except tk.TclError: pass # Already fired
+              self._slider_preview_after_id = self.root.after(SLIDER_PREVIEW_DEBOUNCE_MS, self._fire_slider_preview)
          else:
               logger.debug("Time slider released, but ignored because Real-Time mode is active.")
 
+    def _fire_slider_preview(self):
+         """Runs the plot update for the latest slider position once releases have settled."""
+         self._slider_preview_after_id = None
+         if not self.real_time_var.get(): # Real-time mode may have been switched on meanwhile
+              self._trigger_plot_update()
+
     def _trigger_plot_update(self):
          """Initiates the static plot update via the background task runner."""
          logger.info("Update Static Plot button clicked or triggered.")
@@ -959,168 +1413,286 @@ class PlanetTrackerApp:
          if not hasattr(self, 'time_var') or self.time_var is None:
               logger.error("Cannot trigger plot update: time_var is not initialized.")
               return
-         target_time = ts.now() if self.real_time_var.get() else ts.tt(jd=self.time_var.get())
-         # Run the update function in the background thread
-         self._run_long_task(self._update_preview, args=(target_time,))
+         # Run the update function in the background thread; it builds the target Time
+         # itself from time_var/real_time_var, keeping Skyfield work off the UI thread
+         self._run_long_task(self._update_preview)
 
 
     # --- Mousewheel Scroll Handling (for Chat mainly) ---
     def _on_mousewheel(self, event):
-        """Handles mouse wheel scrolling, primarily for the chat display."""
-        if not self.root or not self.root.winfo_exists(): return # Exit if root is gone
-
-        try:
-            # Identify the widget directly under the mouse cursor
-            x, y = event.x_root, event.y_root
-            widget_under_cursor = self.root.winfo_containing(x, y)
-            if widget_under_cursor is None: return
-
-            # Check if the cursor is over the chat display or its children/scrollbar
-            target_widget = None
-            current_widget = widget_under_cursor
-            while current_widget:
-                if current_widget == self.chat_display:
-                    target_widget = self.chat_display
-                    break
-                try:
-                    # Check if widget is part of the ScrolledText complex (like the scrollbar)
-                    # This is heuristic, might need refinement based on exact widget structure
-                    if isinstance(current_widget, (ttk.Scrollbar, tk.Scrollbar)) and hasattr(current_widget.master, 'yview'):
-                         if current_widget.master == self.chat_display:
-                              target_widget = self.chat_display
-                              break
-                    current_widget = current_widget.master
-                except Exception: # Catch potential errors accessing master
-                    break # Stop traversal if error occurs
-
-            # If scroll target is the chat display, perform scroll
-            if target_widget == self.chat_display and target_widget.winfo_exists():
-                if hasattr(target_widget, 'yview_scroll'):
-                    # Determine scroll direction (platform differences)
-                    scroll_dir = 0
-                    if event.num == 4 or event.delta > 0: scroll_dir = -1 # Scroll Up
-                    elif event.num == 5 or event.delta < 0: scroll_dir = 1  # Scroll Down
-
-                    if scroll_dir != 0:
-                        target_widget.yview_scroll(scroll_dir, "units")
-                        return "break" # Prevent event from propagating further
-            # Else: could add logic here for other scrollable widgets if needed
-
-        except tk.TclError as e:
-             # Can happen if widget is destroyed during event processing
-             logger.debug(f"TclError during mousewheel event (widget likely destroyed): {e}")
-        except Exception as e:
-             logger.warning(f"Unexpected error during mousewheel event processing: {e}", exc_info=False) # Log general errors less verbosely
+        """Scrolls the chat display. Bound on the widget itself, so Tk has already done the hit-testing."""
+        # Determine scroll direction (platform differences)
+        if event.num == 4 or event.delta > 0: scroll_dir = -1 # Scroll Up
+        elif event.num == 5 or event.delta < 0: scroll_dir = 1  # Scroll Down
+        else: return
+        self.chat_display.yview_scroll(scroll_dir, "units")
+        return "break" # Prevent the default class binding from scrolling again
 
 
     # --- Chatbot Logic ---
     def add_chat_message(self, sender: str, message: str, tag: Optional[str] = None):
         """Adds a formatted message to the chat display (thread-safe)."""
+        # Determine prefix and default tag based on sender (anything but "User" is the assistant)
+        prefix, default_tag = _SENDER_META.get(sender, _SENDER_META["Nexus"])
+        # Use provided tag or default based on sender
+        line_tag = tag or default_tag
+        # Strip message just in case, add double newline for visual spacing
+        self.append_chat_text(prefix + message.strip() + "\n\n", line_tag)
+
+
+    def _scroll_chat_to_end(self):
+        """Runs the throttled auto-scroll of the chat display (main thread)."""
+        self._chat_scroll_after_id = None
+        if self.chat_display and self.chat_display.winfo_exists():
+            self.chat_display.yview_moveto(1.0) # Plain scroll; no 'see' visibility computation
+
+    def append_chat_text(self, text: str, tag: str):
+        """Appends raw text with a single tag to the end of the chat display (thread-safe)."""
         if not self.chat_display or not self.chat_display.winfo_exists():
             logger.warning("Chat display not available, cannot add message.")
             return
 
-        def _update_chat_on_main_thread():
-            # Double-check widget existence inside the scheduled call
-            if not self.chat_display or not self.chat_display.winfo_exists(): return
-
-            current_state = self.chat_display.cget('state') # Remember current state
-            try:
-                 self.chat_display.configure(state='normal') # Enable editing
-                 # Determine prefix and tag based on sender
-                 prefix = "You: " if sender == "User" else "Nexus: "
-                 # Use provided tag or default based on sender
-                 line_tag = tag if tag else ("user_tag" if sender == "User" else "bot_tag")
-
-                 # Insert the message with prefix, ensuring newline separation
-                 # Strip message just in case, add double newline for visual spacing
-                 full_message = prefix + message.strip() + "\n\n"
-                 self.chat_display.insert(tk.END, full_message, (line_tag,)) # Apply tag
-
-                 # Scroll to the end to show the latest message
-                 self.chat_display.see(tk.END)
-
-            except tk.TclError as e:
-                 # Catch error if widget gets destroyed between check and configure/insert
-                 logger.error(f"TclError updating chat display (widget likely destroyed): {e}")
-            except Exception as e:
-                 logger.error(f"Unexpected error adding chat message: {e}", exc_info=True)
-            finally:
-                 # IMPORTANT: Always restore original state, even if errors occurred
-                 # Check existence one last time before configure
-                 if self.chat_display and self.chat_display.winfo_exists():
-                     try: self.chat_display.configure(state=current_state)
-                     except tk.TclError: pass # Ignore if destroyed right before final configure
-
+        self._chat_queue.append((text, tag))
+        if self._chat_flush_scheduled: return # The pending flush will pick this text up
         # Schedule the GUI update to run on the main Tkinter thread
         if self.root and self.root.winfo_exists():
-             self.root.after(0, _update_chat_on_main_thread)
+             self._chat_flush_scheduled = True
+             self.root.after(CHAT_FLUSH_MS, self._flush_chat_queue)
         else:
              logger.warning("Root window doesn't exist, cannot schedule chat update.")
 
+    def _flush_chat_queue(self):
+        """Inserts every queued chat append in one Text.insert call (main thread only)."""
+        self._chat_flush_scheduled = False # Cleared before draining, so a newer append reschedules
+        queue = self._chat_queue
+        insert_args = []
+        while queue:
+            text, tag = queue.popleft()
+            insert_args.append(text)
+            insert_args.append((tag,))
+        # Double-check widget existence inside the scheduled call
+        if not insert_args or not self.chat_display or not self.chat_display.winfo_exists(): return
+
+        current_state = self.chat_display.cget('state') # Remember current state
+        try:
+             # Follow new text only if the user hasn't scrolled up to read history (or just sent a message).
+             # "At the bottom" means the last line is on screen, however long the history is.
+             follow = self._chat_follow or self.chat_display.dlineinfo("end-1c") is not None
+             self._chat_follow = False
+             self.chat_display.configure(state='normal') # Enable editing
+             # Text.insert takes alternating chars/tags pairs: one Tk call for the whole batch
+             self.chat_display.insert(CHAT_END_MARK, *insert_args)
+
+             # Scroll to the end to show the latest message; bursts of appends share one scroll
+             if follow and self._chat_scroll_after_id is None:
+                 self._chat_scroll_after_id = self.root.after(CHAT_SCROLL_THROTTLE_MS, self._scroll_chat_to_end)
+
+        except tk.TclError as e:
+             # Catch error if widget gets destroyed between check and configure/insert
+             logger.error("TclError updating chat display (widget likely destroyed): %s", e)
+        except Exception as e:
+             logger.error("Unexpected error adding chat message: %s", e, exc_info=True)
+        finally:
+             # IMPORTANT: Always restore original state, even if errors occurred
+             # Check existence one last time before configure
+             if self.chat_display and self.chat_display.winfo_exists():
+                 try: self.chat_display.configure(state=current_state)
+                 except tk.TclError: pass # Ignore if destroyed right before final configure
+
 
     def _get_groq_response_worker(self, user_message: str) -> str:
         """Worker function to get LLM response. Runs in background thread via _run_long_task. Returns final status string."""
-        if not self.llm_enabled or not self.groq_client:
+        try: client = self._get_groq_client() if self.llm_enabled else None
+        except Exception as e:
+            logger.error("Unexpected error initializing Groq client: %s", e, exc_info=True)
+            client = None
+        if client is None:
             self.add_chat_message("Nexus", "LLM assistant is currently disabled.", tag="error_tag")
             logger.warning("Attempted LLM query while LLM is disabled or client uninitialized.")
             return "LLM Disabled" # Status message for _cleanup_task
 
-        # Prepare system prompt for context
-        system_prompt = (
-            "You are Nexus, a concise astronomical assistant within the 'Planet Tracker: Galactic Nexus' GUI application. "
-            "Focus on astronomy facts, planet data (like size, mass, distance), celestial events, and space concepts relevant to the solar system visualization context. "
-            "Keep answers factual and brief. Use clear, simple language. "
-            "Avoid code examples, excessive formatting (like lists unless necessary), apologies, or conversational fillers. "
-            "If information is unavailable or outside your scope, state that directly (e.g., 'Data not available'). "
-            "The user controls the application's time and view settings via the GUI, so you don't need to manipulate these."
-        )
-        logger.info(f"Sending query to Groq: '{user_message[:60]}...'")
+        if len(user_message) > GROQ_MAX_INPUT_CHARS:
+            logger.warning("Chat question of %s chars truncated to %s before sending.", len(user_message), GROQ_MAX_INPUT_CHARS)
+            self.add_chat_message("Nexus", f"(Your message was shortened to its first {GROQ_MAX_INPUT_CHARS} characters.)", tag="info_tag")
+            user_message = user_message[:GROQ_MAX_INPUT_CHARS] + GROQ_TRUNCATION_NOTE
+
+        cache_key = _normalize_query(user_message)
+        cached_reply = self._llm_cache_get(cache_key)
+        if cached_reply is not None:
+            logger.info("Answering '%s...' from the reply cache.", user_message[:60])
+            self.add_chat_message("Nexus", cached_reply)
+            return "Ready (cached)"
+
+        # Reserve the worst case (full max_tokens reply) before sending; corrected below
+        prompt_tokens = GROQ_SYSTEM_PROMPT_TOKENS + _estimate_tokens(user_message)
+        reserved_tokens = prompt_tokens + GROQ_MAX_TOKENS
+        self._tpm_bucket.acquire(reserved_tokens, on_wait=lambda: self.set_status("Queued (rate limit)..."))
+
+        logger.info("Sending query to Groq: '%s...'", user_message[:60])
         final_status = "LLM Error" # Default error status
+        response_chars = 0
+        pending_parts = [] # Streamed text not yet pushed to the chat display
+        error_reply = None # Shown after any partial reply has been flushed and closed
 
         try:
-            chat_completion = self.groq_client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                # Choose a suitable model available via Groq (check their documentation)
-                # llama3-8b-8192 is generally fast and capable for this task
-                model="llama3-8b-8192",
-                temperature=0.6, # Adjust creativity (lower is more factual)
-                max_tokens=300,  # Limit response length
+            chat_completion = client.chat.completions.create(
+                messages=[GROQ_SYSTEM_MESSAGE, {"role": "user", "content": user_message}],
+                model=GROQ_MODEL,
+                temperature=GROQ_TEMPERATURE,
+                max_tokens=GROQ_MAX_TOKENS,
+                stream=True, # Show the reply as it arrives instead of after the last token
                 # top_p=0.9,       # Alternative sampling parameter
                 # stop=None,       # Sequences to stop generation (e.g., ["\n"])
             )
-            # Extract response and add to chat display (via main thread)
-            response = chat_completion.choices[0].message.content.strip()
-            self.add_chat_message("Nexus", response) # Will be scheduled on main thread
+            # Append deltas to the chat display in batches (each append is one main-thread insert)
+            pending_chars = 0
+            response_parts = [] # Whole reply, for the cache
+            last_flush = 0.0 # perf_counter of the last append; 0 makes the first text go out at once
+            for chunk in chat_completion:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta: continue
+                if response_chars == 0:
+                    delta = delta.lstrip()
+                    if not delta: continue
+                    pending_parts.append("Nexus: ") # Prefix goes out with the first real text
+                pending_parts.append(delta)
+                response_parts.append(delta)
+                pending_chars += len(delta)
+                response_chars += len(delta)
+                now = time.perf_counter()
+                if pending_chars >= CHAT_STREAM_FLUSH_CHARS or now - last_flush >= CHAT_STREAM_FLUSH_S:
+                    self.append_chat_text("".join(pending_parts), "bot_tag")
+                    pending_parts = []
+                    pending_chars = 0
+                    last_flush = now
+
+            if response_chars == 0: pending_parts.append("Nexus: ") # Empty reply still gets its line
             final_status = "Ready" # Success status
-            logger.info(f"Received Groq response ({len(response)} chars).")
+            logger.info("Received Groq response (%s chars, streamed).", response_chars)
+            if response_chars: self._llm_cache_put(cache_key, "".join(response_parts).strip())
 
         except APIError as e:
             # Handle specific Groq API errors (rate limits, auth errors, etc.)
             error_body = getattr(e, 'body', {})
             error_message = f"Groq API Error: {e.status_code} - {error_body.get('error', {}).get('message', 'Unknown API error details')}"
             logger.error(error_message)
-            self.add_chat_message("Nexus", f"API error ({e.status_code}). Please check connection or API key and try again later.", tag="error_tag")
+            error_reply = f"API error ({e.status_code}). Please check connection or API key and try again later."
             final_status = f"LLM API Error ({e.status_code})" # Status reflects error
         except Exception as e:
             # Handle other potential errors (network issues, unexpected responses)
-            logger.error(f"LLM connection/processing error: {e}", exc_info=True)
-            self.add_chat_message("Nexus", "Sorry, there was an error contacting the assistant.", tag="error_tag")
+            logger.error("LLM connection/processing error: %s", e, exc_info=True)
+            error_reply = "Sorry, there was an error contacting the assistant."
             final_status = "LLM Connection Error"
 
+        finally:
+            # Push out whatever is still buffered, also when the stream broke off part way
+            if pending_parts or response_chars:
+                self.append_chat_text("".join(pending_parts).rstrip() + "\n\n", "bot_tag")
+            if error_reply: self.add_chat_message("Nexus", error_reply, tag="error_tag")
+            # Give back what the reply did not use (an aborted request still spent its prompt)
+            self._tpm_bucket.adjust(reserved_tokens - prompt_tokens - (response_chars // 4 + 1 if response_chars else 0))
+
         return final_status # Return status string for the _cleanup_task
 
 
+    def _llm_cache_get(self, key: str) -> Optional[str]:
+        """Returns a cached reply for a normalized question, or None if missing/expired."""
+        with self._llm_cache_lock:
+            entry = self._llm_cache.get(key)
+            if entry is None: return None
+            if time.monotonic() - entry[0] > LLM_CACHE_TTL_S:
+                del self._llm_cache[key]
+                return None
+            self._llm_cache.move_to_end(key)
+            return entry[1]
+
+    def _llm_cache_put(self, key: str, reply: str):
+        """Stores a reply, evicting the least recently used entries beyond LLM_CACHE_SIZE."""
+        with self._llm_cache_lock:
+            self._llm_cache[key] = (time.monotonic(), reply)
+            self._llm_cache.move_to_end(key)
+            while len(self._llm_cache) > LLM_CACHE_SIZE:
+                self._llm_cache.popitem(last=False)
+
+
+    # --- Local Chat Commands ---
+    # Each handler takes the lower-cased argument words and returns a synchronous reply
+    # (or None when it answers some other way, e.g. by starting a background task).
+    def _cmd_help(self, args: list) -> Optional[str]:
+        return CHAT_HELP_TEXT
+
+    def _cmd_info(self, args: list) -> Optional[str]:
+        # Ensure planet_data is available
+        if planet_data is None:
+            return "Error: Planet data module not initialized."
+        # Attempt to find matching planet name (case-insensitive)
+        query = " ".join(args).strip()
+        match = self._planet_name_lookup.get(query.lower())
+        if not match:
+            return f"Sorry, I don't have data for '{query}'. Known bodies: {self._known_bodies_text}"
+
+        # Get formatted info string
+        info_lines = [f"--- {match} ---"]
+        info_dict = planet_data.get_planet_info(match)
+        if info_dict: info_lines.extend([f"{k}: {v}" for k, v in info_dict.items()])
+        else: info_lines.append("Basic data unavailable.")
+
+        # Get orbital elements at current time
+        try:
+            current_t = ts.now() if self.real_time_var.get() else ts.tt(jd=self.time_var.get())
+            elements = get_orbital_elements_cached(match, current_t)
+            if elements and (elements['semi_major_axis'] != 0.0 or elements['eccentricity'] != 0.0):
+                info_lines.append("--- Current Orbital Elements ---")
+                info_lines.append(f"Semi-Major Axis: {elements.get('semi_major_axis', 0.0):.4f} AU")
+                info_lines.append(f"Eccentricity: {elements.get('eccentricity', 0.0):.5f}")
+            elif elements: # If elements were calculated but were zero/default
+                info_lines.append("(Orbital elements calculation returned default values)")
+
+        except Exception as e_el: logger.warning("Could not get orbital elements for %s via chat command: %s", match, e_el)
+
+        self._update_info_panel(match) # Also update the Info tab display
+        return "\n".join(info_lines)
+
+    def _cmd_update_plot(self, args: list) -> Optional[str]:
+        self.add_chat_message("Nexus", "Requesting static plot update...", tag="info_tag")
+        self._trigger_plot_update() # Uses task runner
+        return None
+
+    def _cmd_animate(self, args: list) -> Optional[str]:
+        self.add_chat_message("Nexus", f"Requesting animation generation ({self.orbit_start_var.get()} to {self.orbit_end_var.get()})...", tag="info_tag")
+        # Ensure checkbox is checked before calling handler (consistent UI)
+        if self.root.winfo_exists() and not self.animate_var.get():
+            self.animate_var.set(True)
+        self._handle_animate_toggle() # Calls _run_long_task internally
+        return None
+
+    def _cmd_upcoming_events(self, args: list) -> Optional[str]:
+        self.add_chat_message("Nexus", "Calculating upcoming events for selected planets (next year)...", tag="info_tag")
+        # Run calculation through the shared task runner, respond in chat
+        self._run_long_task(self._show_upcoming_events, (True,))
+        return None
+
+    def _cmd_clear(self, args: list) -> Optional[str]:
+        if self.chat_display and self.chat_display.winfo_exists():
+            self.chat_display.configure(state='normal')
+            self._chat_queue.clear() # Text queued before the clear goes too
+            self.chat_display.delete('1.0', tk.END)
+            self.chat_display.configure(state='disabled')
+            # Optionally add a 'Chat cleared' message
+            self.add_chat_message("Nexus", "Chat display cleared.", tag="info_tag")
+        return None
+
     def _handle_chat_message(self, event=None):
         """Handles user input from the chat entry, routing to local commands or LLM."""
         if not self.chat_input or not self.chat_input.winfo_exists(): return
         user_message = self.chat_input.get().strip()
         if not user_message: return # Ignore empty input
+        now = time.monotonic()
+        if now - self._last_submit_ts < CHAT_SUBMIT_DEBOUNCE_S: return # Double Enter/Send; keep the text
+        self._last_submit_ts = now
 
         # Add user message to display and clear input field immediately
+        self._chat_follow = True # Sending jumps back to the newest text
         self.add_chat_message("User", user_message)
         self.chat_input.delete(0, tk.END)
 
@@ -1129,95 +1701,21 @@ class PlanetTrackerApp:
         cmd_word = command_parts[0] if command_parts else ""
         args = command_parts[1:]
 
-        local_command_handled = False
-        sync_response = None # Response generated synchronously (for simple local commands)
-
         # --- Local Command Processor ---
-        try:
-            if cmd_word == "help" or cmd_word == "commands":
-                sync_response = (
-                    "Available Commands:\n"
-                    "- `help` / `commands`: Show this help message.\n"
-                    "- `info [Planet Name]`: Show data for a celestial body.\n"
-                    "- `update plot`: Update the static plot to the current time.\n"
-                    "- `animate`: Generate an animation (uses orbit range).\n"
-                    "- `upcoming events`: Show predicted events for the next year.\n"
-                    "- `clear`: Clear this chat display.\n"
-                    "Ask general astronomy questions to contact the Nexus AI (if enabled)."
-                )
-                local_command_handled = True
-
-            elif cmd_word == "info" and args:
-                 # Ensure planet_data is available
-                 if planet_data is None:
-                      sync_response = "Error: Planet data module not initialized."
-                      local_command_handled = True
-                 else:
-                     # Attempt to find matching planet name (case-insensitive)
-                     query = " ".join(args).strip()
-                     match = next((p for p in planet_data.get_all_planet_names() if query.lower() == p.lower()), None)
-                     if match:
-                         # Get formatted info string
-                         info_lines = [f"--- {match} ---"]
-                         info_dict = planet_data.get_planet_info(match)
-                         if info_dict: info_lines.extend([f"{k}: {v}" for k, v in info_dict.items()])
-                         else: info_lines.append("Basic data unavailable.")
-
-                         # Get orbital elements at current time
-                         try:
-                             current_t = ts.now() if self.real_time_var.get() else ts.tt(jd=self.time_var.get())
-                             elements = get_orbital_elements(match, current_t)
-                             if elements and (elements['semi_major_axis'] != 0.0 or elements['eccentricity'] != 0.0):
-                                 info_lines.append("--- Current Orbital Elements ---")
-                                 info_lines.append(f"Semi-Major Axis: {elements.get('semi_major_axis', 0.0):.4f} AU")
-                                 info_lines.append(f"Eccentricity: {elements.get('eccentricity', 0.0):.5f}")
-                             elif elements: # If elements were calculated but were zero/default
-                                 info_lines.append("(Orbital elements calculation returned default values)")
-
-                         except Exception as e_el: logger.warning(f"Could not get orbital elements for {match} via chat command: {e_el}")
-
-                         sync_response = "\n".join(info_lines)
-                         self._update_info_panel(match) # Also update the Info tab display
-                     else:
-                         known_bodies = planet_data.get_all_planet_names() if planet_data else []
-                         sync_response = f"Sorry, I don't have data for '{query}'. Known bodies: {', '.join(known_bodies)}"
-                     local_command_handled = True
-
-            elif cmd_word == "update" and "plot" in args:
-                self.add_chat_message("Nexus", "Requesting static plot update...", tag="info_tag")
-                self._trigger_plot_update() # Uses task runner
-                local_command_handled = True
-
-            elif cmd_word == "animate":
-                 self.add_chat_message("Nexus", f"Requesting animation generation ({self.orbit_start_var.get()} to {self.orbit_end_var.get()})...", tag="info_tag")
-                 # Ensure checkbox is checked before calling handler (consistent UI)
-                 if self.root.winfo_exists() and not self.animate_var.get():
-                     self.animate_var.set(True)
-                 self._handle_animate_toggle() # Calls _run_long_task internally
-                 local_command_handled = True
-
-            elif cmd_word == "upcoming" and "events" in args:
-                 self.add_chat_message("Nexus", "Calculating upcoming events for selected planets (next year)...", tag="info_tag")
-                 # Run calculation in thread, respond in chat
-                 threading.Thread(target=self._show_upcoming_events, args=(True,), daemon=True).start()
-                 local_command_handled = True
-
-            elif cmd_word == "clear":
-                if self.chat_display and self.chat_display.winfo_exists():
-                     self.chat_display.configure(state='normal')
-                     self.chat_display.delete('1.0', tk.END)
-                     self.chat_display.configure(state='disabled')
-                     # Optionally add a 'Chat cleared' message
-                     self.add_chat_message("Nexus", "Chat display cleared.", tag="info_tag")
-                local_command_handled = True
-
-            # Add other local commands here if needed...
-
-        except Exception as e:
-             logger.error(f"Error processing local chat command '{cmd_word}': {e}", exc_info=True)
-             sync_response = f"Internal error processing command '{cmd_word}'. Check logs."
-             self.set_status(f"Command Error: {e}")
-             local_command_handled = True # Treat error as handled locally
+        # One dict lookup; a command whose arguments don't match (e.g. 'update' without
+        # 'plot') is treated as a question for the LLM
+        command = self._chat_commands.get(cmd_word)
+        if command is not None and command[0] is not None and not command[0](args):
+            command = None
+        local_command_handled = command is not None
+        sync_response = None # Response generated synchronously (for simple local commands)
+        if command is not None:
+            try:
+                sync_response = command[1](args)
+            except Exception as e:
+                 logger.error("Error processing local chat command '%s': %s", cmd_word, e, exc_info=True)
+                 sync_response = f"Internal error processing command '{cmd_word}'. Check logs."
+                 self.set_status(f"Command Error: {e}")
 
         # --- Output Response or Query LLM ---
         if sync_response:
@@ -1227,7 +1725,11 @@ class PlanetTrackerApp:
             if self.llm_enabled:
                 # Offload LLM query to background task
                 self.add_chat_message("Nexus", "Thinking...", tag="info_tag") # Indicate pending response
+                was_busy = self._job_busy # _run_long_task refuses the query if another task is running
                 self._run_long_task(self._get_groq_response_worker, args=(user_message,))
+                if not was_busy: # Query accepted: no new input until the reply is in (re-enabled by _cleanup_task)
+                    self._chat_input_locked = True
+                    self.chat_input.configure(state="disabled")
             else:
                  # LLM is disabled, provide fallback response
                  fallback = random.choice([
@@ -1240,14 +1742,54 @@ class PlanetTrackerApp:
 
     # --- Core Application Functions / Event Handlers ---
 
+    def _open_color_chooser(self, p_name: str, swatch_widget: tk.Label):
+        """'Set' button handler: lets the user pick a display color for `p_name` and updates its swatch."""
+        try: initial_color = self.planet_colors[p_name] # Current color as initial
+        except KeyError: initial_color = '#808080'
+        # Use colorchooser from tkinter
+        try:
+             # Provide root window as parent for modal behavior
+             result = colorchooser.askcolor(parent=self.root, title=f"Choose color for {p_name}", initialcolor=initial_color)
+             chosen_color_info = result if result and result[1] else None # askcolor returns (rgb_tuple, hex_string) or None
+
+             if chosen_color_info:
+                  chosen_hex = chosen_color_info[1] # Get the hex string (#RRGGBB)
+                  self.planet_colors[p_name] = chosen_hex
+                  if swatch_widget.winfo_exists(): swatch_widget.configure(background=chosen_hex)
+                  logger.info("Color updated for %s: %s", p_name, chosen_hex)
+                  # Potentially trigger plot update if desired, or wait for explicit update
+                  # self._run_long_task(self._update_preview)
+        except tk.TclError as e:
+             # Handles cases like window manager issues or dialog being closed abruptly
+             logger.error("TclError opening color chooser for %s: %s", p_name, e, exc_info=True)
+             if self.root and self.root.winfo_exists(): # Show error if main window still exists
+                 messagebox.showerror("Color Chooser Error", f"Could not open color chooser for {p_name}.\n({e})", parent=self.root)
+        except Exception as e: # Catch any other unexpected error
+             logger.error("Unexpected error during color selection for %s: %s", p_name, e, exc_info=True)
+             if self.root and self.root.winfo_exists():
+                 messagebox.showerror("Error", f"An unexpected error occurred during color selection for {p_name}.", parent=self.root)
+
+    def _sync_planet_visible(self, planet: str):
+        """Trace callback: copies a planet checkbox's value into the _planet_visible mirror."""
+        try: self._planet_visible[planet] = self.selected_planets[planet].get()
+        except tk.TclError: pass # Variable already torn down (app closing)
+
     def _update_info_panel(self, body_name: str):
         """Updates the 'Info/Events' tab's information display panel."""
         if not body_name or planet_data is None: # Ensure name and data module are valid
-            logger.warning(f"Cannot update info panel for '{body_name}' (Invalid name or PlanetData not ready).")
+            logger.warning("Cannot update info panel for '%s' (Invalid name or PlanetData not ready).", body_name)
             if self.info_var: self.info_var.set(f"Info unavailable for {body_name}.")
             return
 
-        logger.debug(f"Updating info panel display for: {body_name}")
+        logger.debug("Updating info panel display for: %s", body_name)
+
+        # Repeated requests for the same body at (nearly) the same instant reuse the rendered text
+        current_t = ts.now() if self.real_time_var.get() else ts.tt(jd=self.time_var.get())
+        cache_key = (body_name, round(float(current_t.tt), CACHE_JD_DECIMALS))
+        final_text = self._info_text_cache.get(cache_key)
+        if final_text is not None:
+            self._set_info_text(final_text)
+            return
 
         info_lines = []
         info_dict = planet_data.get_planet_info(body_name)
@@ -1258,22 +1800,75 @@ class PlanetTrackerApp:
             info_lines = [f"--- {body_name} ---", "Detailed data not available."]
 
         # Add current orbital elements
+        elements_ok = False # Text is only cached when the elements lookup succeeded, so failures are retried
         try:
-            current_t = ts.now() if self.real_time_var.get() else ts.tt(jd=self.time_var.get())
-            elements = get_orbital_elements(body_name, current_t)
+            elements = get_orbital_elements_cached(body_name, current_t) # Same rounded-instant cache as the chat command
             # Only add elements section if calculation likely succeeded
             if elements and (elements['semi_major_axis'] != 0.0 or elements['eccentricity'] != 0.0):
+                elements_ok = True
                 info_lines.append("--- Orbital Elements (Now) ---")
                 info_lines.append(f"Semi-Major Axis: {elements['semi_major_axis']:.4f} AU")
                 info_lines.append(f"Eccentricity: {elements['eccentricity']:.5f}")
         except Exception as e:
-            logger.warning(f"Could not get orbital elements for info panel update ({body_name}): {e}")
+            logger.warning("Could not get orbital elements for info panel update (%s): %s", body_name, e)
             info_lines.append("\n(Could not retrieve current orbital elements)")
 
-        # Safely update the Tkinter variable via main thread schedule
         final_text = "\n".join(info_lines)
+        if elements_ok:
+            self._info_text_cache[cache_key] = final_text
+            if len(self._info_text_cache) > INFO_TEXT_CACHE_SIZE:
+                self._info_text_cache.pop(next(iter(self._info_text_cache))) # Drop the oldest entry
+        self._set_info_text(final_text)
+
+    def _set_info_text(self, text: str):
+        """Safely updates the info panel variable via main thread schedule."""
         if self.root and self.root.winfo_exists() and self.info_var:
-            self.root.after(0, lambda text=final_text: self.info_var.set(text))
+            self.root.after(0, lambda text=text: self.info_var.set(text))
+
+
+    def _show_notification(self, title: str, message: str, level: str = "info", persistent: bool = False):
+        """
+        Shows a small non-blocking notification window that closes itself (or on click).
+        Used instead of modal message boxes so queued status/chat updates keep flowing.
+        With `persistent`, it stays up until clicked (for results the user must be able to read).
+        Must be called on the main thread.
+        """
+        if not self.root or not self.root.winfo_exists(): return
+        # Only one notification at a time; a newer one replaces the previous
+        if self._notification is not None:
+            try: self._notification.destroy()
+            except tk.TclError: pass
+            self._notification = None
+        colors = self.themes.get(self.current_theme, {})
+        bg = colors.get("text_bg", "#ffffe0")
+        fg = "red" if level == "error" else colors.get("text_fg", "#000000")
+        try:
+            window = tk.Toplevel(self.root)
+            window.wm_overrideredirect(True) # No window decorations
+            window.attributes("-topmost", True)
+            frame = tk.Frame(window, background=bg, relief="solid", borderwidth=1)
+            frame.pack(fill="both", expand=True)
+            tk.Label(frame, text=title, background=bg, foreground=fg, font=("Arial", 10, "bold"), anchor="w").pack(fill="x", padx=10, pady=(8, 2))
+            tk.Label(frame, text=message, background=bg, foreground=fg, justify=tk.LEFT, wraplength=360, anchor="w").pack(fill="x", padx=10, pady=(0, 8))
+            if persistent:
+                tk.Label(frame, text="(Click to close)", background=bg, foreground=fg, font=("Arial", 8, "italic"), anchor="e").pack(fill="x", padx=10, pady=(0, 6))
+            # Place at the bottom-right corner of the main window
+            x = self.root.winfo_rootx() + self.root.winfo_width() - window.winfo_reqwidth() - 20
+            y = self.root.winfo_rooty() + self.root.winfo_height() - window.winfo_reqheight() - 40
+            window.wm_geometry(f"+{max(0, x)}+{max(0, y)}")
+            dismiss = lambda event=None, w=window: self._dismiss_notification(w)
+            for part in (window, frame, *frame.winfo_children()): part.bind("<Button-1>", dismiss)
+            if not persistent:
+                window.after(NOTIFICATION_ERROR_MS if level == "error" else NOTIFICATION_MS, dismiss)
+            self._notification = window
+        except tk.TclError as e:
+            logger.warning("Could not show notification '%s': %s", title, e)
+
+    def _dismiss_notification(self, window):
+        """Closes a notification window if it is still open."""
+        if self._notification is window: self._notification = None
+        try: window.destroy()
+        except tk.TclError: pass # Already closed
 
 
     def _export_plot(self):
@@ -1281,7 +1876,7 @@ class PlanetTrackerApp:
         if not self.plot or not hasattr(self.plot, 'fig') or not self.plot.fig or not self.plot.fig.data:
             msg = "No plot has been generated yet to export."
             self.set_status(msg)
-            if self.root.winfo_exists(): messagebox.showwarning("Export Plot", msg, parent=self.root)
+            self._show_notification("Export Plot", msg, "warning")
             logger.warning("Export plot called but no figure data exists.")
             return
 
@@ -1295,17 +1890,17 @@ class PlanetTrackerApp:
         if not file_path:
             self.set_status("Plot export cancelled."); return
 
-        self.set_status("Exporting plot to HTML..."); logger.info(f"Exporting plot to {file_path}")
+        self.set_status("Exporting plot to HTML..."); logger.info("Exporting plot to %s", file_path)
         try:
             # Use CDN for Plotly.js to keep file size smaller
-            self.plot.fig.write_html(file_path, include_plotlyjs='cdn')
+            self.plot.write_html(file_path)
             self.set_status("Plot exported successfully.")
             self.add_chat_message("Nexus", f"Static plot exported to {os.path.basename(file_path)}", tag="info_tag")
         except Exception as e:
-            logger.error(f"Failed to export plot to HTML: {e}", exc_info=True)
+            logger.error("Failed to export plot to HTML: %s", e, exc_info=True)
             error_msg = f"Failed to export plot:\n{e}"
             self.set_status(f"Export failed: {e}")
-            if self.root.winfo_exists(): messagebox.showerror("Export Error", error_msg, parent=self.root)
+            self._show_notification("Export Error", error_msg, "error")
 
 
     def _export_orbit_data(self):
@@ -1313,7 +1908,7 @@ class PlanetTrackerApp:
         if not self.orbit_positions_dict:
             msg = "No orbit data calculated yet. Please generate a plot or animation first."
             self.set_status(msg)
-            if self.root.winfo_exists(): messagebox.showwarning("Export Orbit Data", msg, parent=self.root)
+            self._show_notification("Export Orbit Data", msg, "warning")
             logger.warning("Export orbit data called but orbit_positions_dict is empty.")
             return
 
@@ -1326,36 +1921,35 @@ class PlanetTrackerApp:
         if not file_path:
             self.set_status("Orbit data export cancelled."); return
 
-        self.set_status("Exporting orbit data..."); logger.info(f"Exporting orbit data for {list(self.orbit_positions_dict.keys())} to {file_path}")
+        self.set_status("Exporting orbit data..."); logger.info("Exporting orbit data for %s to %s", list(self.orbit_positions_dict.keys()), file_path)
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            orbit_names, orbit_buffer = self._orbit_buffer
+            num_points = orbit_buffer.shape[2]
+            point_count = len(orbit_names) * num_points
+            # Large write buffer: the whole export is a few hundred KB produced in one writerows call
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as csvfile:
                 writer = csv.writer(csvfile)
                 # Write header row
                 writer.writerow(["Planet", "Point_Index", "X_AU", "Y_AU", "Z_AU"])
-                # Write data rows
-                point_count = 0
-                for name, positions_array in self.orbit_positions_dict.items():
-                     # Validate array shape before iterating
-                     if isinstance(positions_array, np.ndarray) and positions_array.ndim == 2 and positions_array.shape[0] == 3:
-                         num_points = positions_array.shape[1]
-                         for i in range(num_points):
-                              # Write row: Planet Name, Index, X, Y, Z
-                              writer.writerow([name, i, positions_array[0, i], positions_array[1, i], positions_array[2, i]])
-                              point_count += 1
-                     else: logger.warning(f"Skipping invalid orbit data shape for {name} during CSV export: {type(positions_array)}")
-            logger.info(f"Successfully exported {point_count} orbit data points.")
+                # Write data rows (Planet Name, Index, X, Y, Z) for all bodies in one call,
+                # reading each coordinate column straight out of the shared (P, 3, N) buffer
+                planet_col = chain.from_iterable(repeat(name, num_points) for name in orbit_names)
+                index_col = chain.from_iterable(repeat(range(num_points), len(orbit_names)))
+                x_col, y_col, z_col = (orbit_buffer[:, axis, :].ravel().tolist() for axis in range(3))
+                writer.writerows(zip(planet_col, index_col, x_col, y_col, z_col))
+            logger.info("Successfully exported %s orbit data points.", point_count)
             self.set_status("Orbit data exported successfully.")
             self.add_chat_message("Nexus", f"Orbit data exported to {os.path.basename(file_path)}", tag="info_tag")
         except IOError as e:
-            logger.error(f"IOError exporting orbit data to CSV: {e}", exc_info=True)
+            logger.error("IOError exporting orbit data to CSV: %s", e, exc_info=True)
             error_msg = f"Failed to write orbit data file:\n{e}"
             self.set_status(f"Export failed: {e}")
-            if self.root.winfo_exists(): messagebox.showerror("Export Error", error_msg, parent=self.root)
+            self._show_notification("Export Error", error_msg, "error")
         except Exception as e:
-             logger.error(f"Unexpected error exporting orbit data to CSV: {e}", exc_info=True)
+             logger.error("Unexpected error exporting orbit data to CSV: %s", e, exc_info=True)
              error_msg = f"An unexpected error occurred during CSV export:\n{e}"
              self.set_status(f"Export failed: {e}")
-             if self.root.winfo_exists(): messagebox.showerror("Export Error", error_msg, parent=self.root)
+             self._show_notification("Export Error", error_msg, "error")
 
 
     def _save_settings(self):
@@ -1385,27 +1979,36 @@ class PlanetTrackerApp:
         if not file_path:
             self.set_status("Save settings cancelled."); return
 
-        self.set_status("Saving settings..."); logger.info(f"Saving settings to {file_path}")
+        self.set_status("Saving settings..."); logger.info("Saving settings to %s", file_path)
+        temp_path = file_path + ".tmp"
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4) # Use indent for readability
+            # Serialize first (compact form) so a TypeError cannot leave a half-written file,
+            # then write to a temp file and atomically swap it into place
+            payload = json.dumps(settings, separators=(',', ':'))
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_path, file_path)
             self.set_status("Settings saved successfully.")
             self.add_chat_message("Nexus", f"Settings saved to {os.path.basename(file_path)}.", tag="info_tag")
         except IOError as e:
-            logger.error(f"IOError saving settings to JSON: {e}", exc_info=True)
+            logger.error("IOError saving settings to JSON: %s", e, exc_info=True)
             error_msg = f"Failed to save settings file:\n{e}"
             self.set_status(f"Save failed: {e}")
-            if self.root.winfo_exists(): messagebox.showerror("Save Error", error_msg, parent=self.root)
+            self._show_notification("Save Error", error_msg, "error")
         except TypeError as e: # Handle non-serializable data if any crept in
-             logger.error(f"TypeError saving settings (data not serializable?): {e}", exc_info=True)
+             logger.error("TypeError saving settings (data not serializable?): %s", e, exc_info=True)
              error_msg = f"Failed to save settings due to data type error:\n{e}"
              self.set_status(f"Save failed: {e}")
-             if self.root.winfo_exists(): messagebox.showerror("Save Error", error_msg, parent=self.root)
+             self._show_notification("Save Error", error_msg, "error")
         except Exception as e:
-             logger.error(f"Unexpected error saving settings: {e}", exc_info=True)
+             logger.error("Unexpected error saving settings: %s", e, exc_info=True)
              error_msg = f"An unexpected error occurred while saving settings:\n{e}"
              self.set_status(f"Save failed: {e}")
-             if self.root.winfo_exists(): messagebox.showerror("Save Error", error_msg, parent=self.root)
+             self._show_notification("Save Error", error_msg, "error")
+        finally:
+            if os.path.exists(temp_path): # Only left behind if the write or replace failed
+                try: os.remove(temp_path)
+                except OSError as e: logger.warning("Could not remove temporary settings file %s: %s", temp_path, e)
 
 
     def _load_settings(self):
@@ -1418,42 +2021,50 @@ class PlanetTrackerApp:
         if not file_path:
             self.set_status("Load settings cancelled."); return
 
-        self.set_status("Loading settings..."); logger.info(f"Loading settings from {file_path}")
+        self.set_status("Loading settings..."); logger.info("Loading settings from %s", file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            with open(file_path, 'rb') as f:
+                settings = json.loads(f.read()) # One read; json detects the UTF encoding from bytes
 
             # --- Apply Loaded Settings (with defaults/fallbacks) ---
             # Theme
             loaded_theme = settings.get("theme", self.current_theme) # Default to current if missing
-            if loaded_theme in self.themes:
-                 # Must set theme_var *and* call apply_theme
-                 self.theme_var.set(loaded_theme)
-                 self._apply_theme(loaded_theme) # Apply immediately
-            else: logger.warning(f"Loaded theme '{loaded_theme}' not recognized, keeping current.")
+            if loaded_theme != self._applied_theme: # Already showing this theme: nothing to do
+                if loaded_theme in self.themes:
+                     # Must set theme_var *and* call apply_theme
+                     self.theme_var.set(loaded_theme)
+                     self._apply_theme(loaded_theme) # Apply immediately
+                else: logger.warning("Loaded theme '%s' not recognized, keeping current.", loaded_theme)
 
             # Planet Selection & Colors
             loaded_selection = settings.get("planets_selected", {})
-            loaded_colors = settings.get("planet_colors", {})
+            loaded_colors = settings.get("planet_colors") or {}
+            previous_colors = self.planet_colors
             self.planet_colors = loaded_colors.copy() # Update internal color dictionary
+            color_swatches = self.color_swatches
             for p, var in self.selected_planets.items():
                  # Update checkbox state
                  var.set(loaded_selection.get(p, True)) # Default to selected if missing in file
                  # Update color swatch visually
-                 if p in self.color_swatches and self.color_swatches[p].winfo_exists():
+                 swatch = color_swatches.get(p)
+                 if swatch is not None and swatch.winfo_exists():
                      # Ensure the internal color dict has a fallback if missing from file
-                     if planet_data: # Check planet_data is available
-                          color_val = self.planet_colors.get(p, planet_data.get_planet_color(p))
-                     else: color_val = '#808080' # Ultimate fallback color
+                     color_val = loaded_colors.get(p)
+                     if color_val is None:
+                          color_val = planet_data.get_planet_color(p) if planet_data else '#808080' # Ultimate fallback color
                      self.planet_colors[p] = color_val # Make sure internal dict matches what's shown
-                     self.color_swatches[p].configure(background=color_val)
+                     # Only touch the swatch (one Tcl command) if its color actually changes
+                     if previous_colors.get(p) != color_val:
+                          swatch.configure(background=color_val)
 
             # Time & Orbit Range
-            self.time_var.set(settings.get("time_jd", ts.now().tt)) # Default to now if missing
+            time_jd = settings.get("time_jd")
+            if time_jd is None: time_jd = ts.now().tt # Default to now if missing
+            self.time_var.set(time_jd)
             self.orbit_start_var.set(settings.get("orbit_start_date", "2025-01-01"))
             self.orbit_end_var.set(settings.get("orbit_end_date", "2026-01-01"))
             # Update time display label immediately after loading time_var
-            self._update_time_label_only(self.time_var.get())
+            self._update_time_label_only(time_jd)
 
             # View Settings
             self.zoom_var.set(settings.get("view_zoom", 1.0))
@@ -1478,33 +2089,32 @@ class PlanetTrackerApp:
             # self._trigger_plot_update()
 
         except FileNotFoundError:
-             logger.error(f"Load settings failed: File not found at {file_path}")
+             logger.error("Load settings failed: File not found at %s", file_path)
              error_msg = f"Could not find settings file:\n{file_path}"
              self.set_status("Load failed: File not found.")
-             if self.root.winfo_exists(): messagebox.showerror("Load Error", error_msg, parent=self.root)
+             self._show_notification("Load Error", error_msg, "error")
         except json.JSONDecodeError as e:
-             logger.error(f"Load settings failed: Invalid JSON format in {file_path}: {e}", exc_info=True)
+             logger.error("Load settings failed: Invalid JSON format in %s: %s", file_path, e, exc_info=True)
              error_msg = f"Could not parse settings file (invalid JSON):\n{os.path.basename(file_path)}\nError: {e}"
              self.set_status("Load failed: Invalid file format.")
-             if self.root.winfo_exists(): messagebox.showerror("Load Error", error_msg, parent=self.root)
+             self._show_notification("Load Error", error_msg, "error")
         except Exception as e:
-             logger.error(f"Unexpected error loading settings from {file_path}: {e}", exc_info=True)
+             logger.error("Unexpected error loading settings from %s: %s", file_path, e, exc_info=True)
              error_msg = f"An unexpected error occurred while loading settings:\n{e}"
              self.set_status(f"Load failed: {e}")
-             if self.root.winfo_exists(): messagebox.showerror("Load Error", error_msg, parent=self.root)
+             self._show_notification("Load Error", error_msg, "error")
 
 
-    def _show_upcoming_events(self, respond_in_chat: bool = False):
-        """Calculates and displays upcoming events (runs in basic thread)."""
+    def _show_upcoming_events(self, respond_in_chat: bool = False) -> str:
+        """Calculates and displays upcoming events (runs via _run_long_task). Returns final status string."""
         # This function primarily orchestrates; calculation done in planet_calculations
         task_name = "Upcoming event calculation"
-        logger.info(f"Starting {task_name} (respond_in_chat={respond_in_chat})...")
+        logger.info("Starting %s (respond_in_chat=%s)...", task_name, respond_in_chat)
         final_status = "Ready"; event_msg = ""; event_level = "info"; event_title = "Upcoming Events"
 
         try:
-            if respond_in_chat: self.set_status("Calculating upcoming events...") # Only set status if chat response needed
             # Get list of currently selected planets from GUI
-            active_planets = [p for p, var in self.selected_planets.items() if var.get() and p not in ["Earth", "Moon"]] # Exclude Earth/Moon
+            active_planets = [p for p, visible in self._planet_visible.items() if visible and p not in ["Earth", "Moon"]] # Exclude Earth/Moon
 
             if not active_planets:
                 event_msg, final_status, event_level = "No relevant planets selected.", "Select planets first", "warning"
@@ -1520,7 +2130,7 @@ class PlanetTrackerApp:
                 t_end_search_dt_clamped = min(t_end_search_dt_unclamped, ephem_end_dt - timedelta(microseconds=1)) # Clamp slightly before end bound
                 t_end_search = ts.from_datetime(t_end_search_dt_clamped)
 
-                logger.info(f"Searching for events ({active_planets}) between {t_start_search.utc_iso()} and {t_end_search.utc_iso()}")
+                logger.info("Searching for events (%s) between %s and %s", active_planets, t_start_search.utc_iso(), t_end_search.utc_iso())
 
                 # Call the calculation function (assumed to be thread-safe internally or using Skyfield correctly)
                 events_found = find_next_events(active_planets, t_start_search, t_end_search)
@@ -1529,7 +2139,7 @@ class PlanetTrackerApp:
                     event_lines = [f"- {p}: {e} on {d.split(' ')[0]}" for p,e,d in events_found] # Show only date for brevity
                     event_msg = "Upcoming Events (Next Year):\n" + "\n".join(event_lines)
                     final_status = f"{len(events_found)} events found."
-                    logger.info(f"Found {len(events_found)} upcoming events.")
+                    logger.info("Found %s upcoming events.", len(events_found))
                 else:
                     event_msg = "No major conjunctions or oppositions found for selected planets in the next year."
                     final_status = "No upcoming events found."
@@ -1537,31 +2147,30 @@ class PlanetTrackerApp:
                 event_level = "info"
 
         except ValueError as e: # Catch potential errors from find_next_events (e.g., time range issues)
-             logger.error(f"Error during event calculation: {e}", exc_info=True)
+             logger.error("Error during event calculation: %s", e, exc_info=True)
              event_msg = f"Could not calculate events.\nError: {e}"
              final_status = "Event calculation error"
              event_level = "error"
              event_title = "Event Calculation Error"
         except Exception as e:
-             logger.error(f"Unexpected error calculating events: {e}", exc_info=True)
+             logger.error("Unexpected error calculating events: %s", e, exc_info=True)
              event_msg = f"An unexpected error occurred during event calculation.\nError: {e}"
              final_status = "Event calculation error"
              event_level = "error"
              event_title = "Event Calculation Error"
         finally:
-             # Update GUI based on response mode
-             self.set_status(final_status) # Update status bar regardless of mode
+             # Update GUI based on response mode (the status bar is set by _cleanup_task)
              if self.root and self.root.winfo_exists():
                  tag_map = {"info": "info_tag", "warning": "info_tag", "error": "error_tag"}
-                 icon_map = {"info": messagebox.INFO, "warning": messagebox.WARNING, "error": messagebox.ERROR}
 
                  if respond_in_chat:
                      # Schedule adding message to chat display
                      self.root.after(0, lambda msg=event_msg, tag=tag_map.get(event_level, "bot_tag"): self.add_chat_message("Nexus", msg, tag=tag))
                  else:
-                     # Schedule showing message box
-                     self.root.after(0, lambda msg=event_msg, title=event_title, icon=icon_map.get(event_level, messagebox.INFO):
-                                    messagebox.showinfo(title, msg, icon=icon, parent=self.root))
+                     # Schedule a non-blocking notification (a modal box would stall queued GUI updates);
+                     # it is the only place the results appear, so it stays up until dismissed
+                     self.root.after(0, self._show_notification, event_title, event_msg, event_level, True)
+        return final_status # Status string for _cleanup_task
 
 
     def _handle_animate_toggle(self):
@@ -1583,7 +2192,7 @@ class PlanetTrackerApp:
     def _toggle_real_time_mode(self):
         """Updates time display and behavior when 'Use Real-Time' checkbox changes."""
         is_real_time = self.real_time_var.get()
-        logger.info(f"Real-time mode toggled {'ON' if is_real_time else 'OFF'}.")
+        logger.info("Real-time mode toggled %s.", 'ON' if is_real_time else 'OFF')
 
         if is_real_time:
             # Use current system time
@@ -1594,7 +2203,7 @@ class PlanetTrackerApp:
                 self.time_var.set(now_t.tt) # Update underlying variable as well? Maybe not needed.
                 status_msg = "Real-time mode enabled. Using current time for updates."
             except Exception as e:
-                logger.error(f"Failed to get current time for real-time mode: {e}")
+                logger.error("Failed to get current time for real-time mode: %s", e)
                 display_text = "Error getting real-time"
                 status_msg = "Error enabling real-time mode."
             if self.time_slider and self.time_slider.winfo_exists():
@@ -1603,31 +2212,30 @@ class PlanetTrackerApp:
             # Use time from the slider
             try:
                 slider_jd = self.time_var.get()
-                slider_time = ts.tt(jd=slider_jd)
-                display_text = slider_time.utc_strftime('%Y-%m-%d %H:%M UTC')
+                display_text = _format_time_label(slider_jd) # Same cache as slider drags
                 status_msg = "Real-time mode disabled. Using time slider value."
             except Exception as e:
-                logger.error(f"Error getting time from slider value: {e}")
+                logger.error("Error getting time from slider value: %s", e)
                 display_text = "Set Time from Slider"
                 status_msg = "Error setting time from slider."
             if self.time_slider and self.time_slider.winfo_exists():
                 self.time_slider.configure(state='normal') # Enable slider
 
         # Update the display label (always happens on main thread via variable)
-        if self.time_display: self.time_display.set(display_text)
+        if self.time_display: self._set_time_display(display_text)
         self.set_status(status_msg)
 
     def _compute_animation_frames(self) -> str:
         """Computes data needed for animation (runs in background thread). Returns status string."""
         task_name = "Animation frame computation"
-        logger.info(f"Starting {task_name}...")
-        start_compute_time = datetime.now()
+        logger.info("Starting %s...", task_name)
+        start_compute_time = time.perf_counter()
         final_status = "Animation Failed" # Default status
         try:
             if not self.plot: raise RuntimeError("PlanetPlot instance is not available.")
             self.set_status("Verifying animation settings...") # Intermediate status update
 
-            active_planets = [p for p, v in self.selected_planets.items() if v.get()]
+            active_planets = [p for p, visible in self._planet_visible.items() if visible]
             if not active_planets: raise ValueError("No planets selected for animation.")
 
             t_start_str, t_end_str = self.orbit_start_var.get(), self.orbit_end_var.get()
@@ -1646,7 +2254,7 @@ class PlanetTrackerApp:
                 # Clamp end time if duration exceeds limit
                 t_end_clamped = ts.tt(jd=t_start.tt + max_anim_days)
                 clamped_end_str = t_end_clamped.utc_strftime('%Y-%m-%d')
-                logger.warning(f"Animation duration ({duration_days:.0f} days) exceeds limit ({max_anim_days:.0f} days). Clamped end date to {clamped_end_str}.")
+                logger.warning("Animation duration (%.0f days) exceeds limit (%.0f days). Clamped end date to %s.", duration_days, max_anim_days, clamped_end_str)
                 # Update GUI variable (via main thread) and message user
                 if self.root.winfo_exists():
                      self.root.after(0, lambda s=clamped_end_str: self.orbit_end_var.set(s))
@@ -1657,39 +2265,35 @@ class PlanetTrackerApp:
             self.set_status("Calculating orbits for animation...")
             orbit_steps_anim = max(100, min(730, int(duration_days * 2))) # More steps for smoother animation orbits
             anim_orbit_positions = {}
-            for name in active_planets:
-                 orbit_data = calculate_orbit(name, t_start.tt, t_end.tt, num_points=orbit_steps_anim)
+            for name, orbit_data in calculate_orbits(active_planets, t_start.tt, t_end.tt, num_points=orbit_steps_anim).items():
                  if orbit_data.size > 0: # Check if calculation succeeded
                       anim_orbit_positions[name] = orbit_data
-                 else: logger.warning(f"Failed to calculate animation orbit for {name}.")
+                 else: logger.warning("Failed to calculate animation orbit for %s.", name)
 
             self.set_status("Calculating animation frame positions...")
             # Determine number of frames (balance between smoothness and calculation time)
             # Target around 1-2 frames per day, capped at reasonable max (e.g., 1000-1500 frames)
             num_frames = max(50, min(1500, int(duration_days * 1.5)))
-            logger.info(f"Generating {num_frames} animation frames for {duration_days:.1f} day period.")
+            logger.info("Generating %s animation frames for %.1f day period.", num_frames, duration_days)
             times_anim = ts.linspace(t_start, t_end, num_frames)
-            positions_list = [] # List to hold position dict for each frame
-
-            for i, t in enumerate(times_anim):
-                # Calculate positions for all active planets at this time step
-                frame_positions = get_heliocentric_positions(active_planets, t)
-                positions_list.append(frame_positions) # Add dict to the list
-                # Update progress status periodically
-                if (i+1) % max(1, num_frames // 20) == 0: # ~20 status updates during calc
-                     self.set_status(f"Calculating animation frames ({i+1}/{num_frames})...")
-
-            # Check if positions list was populated
-            if not positions_list: raise RuntimeError("Failed to calculate any animation frame positions.")
-
-            compute_duration = (datetime.now() - start_compute_time).total_seconds()
-            logger.info(f"Frame position calculation took {compute_duration:.2f} seconds.")
+            # One vectorized Skyfield evaluation per planet covers every frame
+            position_series = get_heliocentric_positions(active_planets, times_anim)
+
+            # Check if any planet positions were calculated
+            if not position_series: raise RuntimeError("Failed to calculate any animation frame positions.")
+            # Contiguous (num_frames, n_planets, 3) array; create_animation takes frame i as frame_positions[i]
+            position_names = [name for name in active_planets if name in position_series]
+            frame_positions = np.ascontiguousarray(
+                np.stack([position_series[name] for name in position_names]).transpose(2, 0, 1))
+
+            compute_duration = time.perf_counter() - start_compute_time
+            logger.info("Frame position calculation took %.2f seconds.", compute_duration)
             self.set_status("Launching animation plot...") # Status before potentially blocking plot call
 
             # --- Prepare arguments for the plot call ---
             # Pass necessary data; ensure copies are made if needed (e.g., planet_colors)
             anim_args = (
-                positions_list, times_anim, anim_orbit_positions, active_planets,
+                frame_positions, position_names, times_anim, anim_orbit_positions, active_planets,
                 int(self.speed_var.get()), self.zoom_var.get(), self.elev_var.get(),
                 self.azim_var.get(), self.planet_colors.copy(), # Pass a copy of colors
                 self.set_status # Pass status callback for use by plot method if needed
@@ -1709,14 +2313,14 @@ class PlanetTrackerApp:
                  final_status = "Animation calculated but cannot display (window closed)."
 
         except ValueError as e: # Catch configuration or date range errors
-            logger.error(f"Animation setup error: {e}")
+            logger.error("Animation setup error: %s", e)
             final_status = f"Animation Error: {e}" # Set status bar message
             if self.root and self.root.winfo_exists(): self.add_chat_message("Nexus", final_status, tag="error_tag")
             # Ensure checkbox is unticked on error - Schedule on main thread
             if self.root and self.root.winfo_exists(): self.root.after(100, lambda: self.animate_var.set(False))
 
         except Exception as e: # Catch unexpected calculation or plotting errors
-            logger.error(f"Unexpected error during animation computation: {e}", exc_info=True)
+            logger.error("Unexpected error during animation computation: %s", e, exc_info=True)
             final_status = "Animation Failed: Check logs." # Set status bar message
             if self.root and self.root.winfo_exists(): self.add_chat_message("Nexus", final_status, tag="error_tag")
             # Ensure checkbox is unticked on error - Schedule on main thread
@@ -1729,17 +2333,17 @@ class PlanetTrackerApp:
     def _update_preview(self, target_t: Optional[Time] = None) -> str:
         """Updates the static plot view (run via _run_long_task). Returns status string."""
         task_name = "Static plot update"
-        logger.info(f"Starting {task_name}...")
+        logger.info("Starting %s...", task_name)
         final_status = "Plot Update Failed" # Default status
         try:
             if not self.plot: raise RuntimeError("PlanetPlot instance is not available.")
             self.set_status("Verifying plot settings...") # Intermediate status
 
-            active_planets = [p for p, v in self.selected_planets.items() if v.get()]
+            active_planets = [p for p, visible in self._planet_visible.items() if visible]
             if not active_planets: raise ValueError("No planets selected for plot.")
 
             # Determine the target time for the plot
-            if target_t is None: # If not passed directly (e.g., from slider release)
+            if target_t is None: # Normal path for button/slider triggered updates
                  target_t = ts.now() if self.real_time_var.get() else ts.tt(jd=self.time_var.get())
             if not isinstance(target_t, Time): raise ValueError("Invalid time specified for plot.")
 
@@ -1761,7 +2365,7 @@ class PlanetTrackerApp:
             if orbit_duration_days > max_orbit_plot_days:
                  t_end_orbit_clamped = ts.tt(jd=t_start_orbit.tt + max_orbit_plot_days)
                  clamped_end_str = t_end_orbit_clamped.utc_strftime('%Y-%m-%d')
-                 logger.warning(f"Static plot orbit range ({orbit_duration_days:.0f} days) exceeds display limit ({max_orbit_plot_days:.0f} days). Clamped end date to {clamped_end_str}.")
+                 logger.warning("Static plot orbit range (%.0f days) exceeds display limit (%.0f days). Clamped end date to %s.", orbit_duration_days, max_orbit_plot_days, clamped_end_str)
                  if self.root.winfo_exists():
                       self.root.after(0, lambda s=clamped_end_str: self.orbit_end_var.set(s))
                       self.add_chat_message("Nexus", f"Orbit range limited to {max_orbit_plot_days:.0f} days for display.", tag="info_tag")
@@ -1770,7 +2374,7 @@ class PlanetTrackerApp:
 
 
             self.set_status("Calculating current positions...")
-            positions_now = get_heliocentric_positions(active_planets, target_t)
+            positions_now = get_heliocentric_positions_cached(active_planets, target_t)
             if not positions_now:
                 # Check if any active planets were expected to have positions
                 if any(p not in ["Moon"] for p in active_planets): # Ignore if only Moon failed? Check logic
@@ -1788,12 +2392,16 @@ class PlanetTrackerApp:
             # More points for smoother static orbits if range is short
             orbit_steps_plot = max(100, min(1000, int(orbit_duration_days * 1.5)))
             current_orbit_positions = {}
-            for name in active_planets:
-                orbit_data = calculate_orbit(name, t_start_orbit.tt, t_end_orbit.tt, num_points=orbit_steps_plot)
+            for name, orbit_data in calculate_orbits(active_planets, t_start_orbit.tt, t_end_orbit.tt, num_points=orbit_steps_plot).items():
                 if orbit_data.size > 0:
                     current_orbit_positions[name] = orbit_data
-                else: logger.warning(f"Failed to calculate display orbit for {name}.")
-            self.orbit_positions_dict = current_orbit_positions.copy() # Update stored orbits for export
+                else: logger.warning("Failed to calculate display orbit for %s.", name)
+            # Keep the displayed orbits in one contiguous (P, 3, N) buffer (all share orbit_steps_plot points);
+            # the dict used by the plot holds views into it, and the CSV export writes straight from it.
+            orbit_names = tuple(current_orbit_positions)
+            orbit_buffer = np.stack([current_orbit_positions[name] for name in orbit_names]) if orbit_names else np.empty((0, 3, 0))
+            self._orbit_buffer = (orbit_names, orbit_buffer) # Single assignment so export never sees a mismatched pair
+            self.orbit_positions_dict = {name: orbit_buffer[i] for i, name in enumerate(orbit_names)} # Update stored orbits for export
 
             # Calculate approximate events at this specific time
             current_events = calculate_events(target_t) # Uses geometric check
@@ -1818,11 +2426,11 @@ class PlanetTrackerApp:
                  final_status = "Plot calculated but cannot display (window closed)."
 
         except ValueError as e: # Catch config/calculation value errors
-            logger.error(f"Static plot update failed: {e}", exc_info=False) # Log concise error
+            logger.error("Static plot update failed: %s", e, exc_info=False) # Log concise error
             final_status = f"Plot Error: {e}";
             if self.root and self.root.winfo_exists(): self.add_chat_message("Nexus", final_status, tag="error_tag")
         except Exception as e: # Catch unexpected errors
-            logger.error(f"Unexpected error during static plot update: {e}", exc_info=True)
+            logger.error("Unexpected error during static plot update: %s", e, exc_info=True)
             final_status = "Plot Update Failed: Check logs.";
             if self.root and self.root.winfo_exists(): self.add_chat_message("Nexus", final_status, tag="error_tag")
 
@@ -1842,12 +2450,12 @@ class PlanetTrackerApp:
         # Perform cleanup (e.g., stop threads? save state? close files?)
         # Daemon threads should exit automatically, but explicit cleanup is safer if needed.
 
-        # Attempt to release the task lock if held (might be locked if task hangs)
-        if self.job_running_lock.locked():
-             logger.warning("Attempting to release job lock during shutdown...")
-             try: self.job_running_lock.release()
-             except threading.ThreadError as e: logger.warning(f"Error releasing lock on shutdown: {e}")
-             except Exception as e: logger.error(f"Unexpected error releasing lock on shutdown: {e}")
+        # A task may still be running (e.g. a hung request); its result will be discarded
+        if self._job_busy:
+             logger.warning("Shutting down while a background task is still running.")
+             self._job_busy = False
+        # Drop queued work; a running task is abandoned with its daemon thread at exit
+        _background_pool.shutdown(cancel_futures=True)
 
         logger.info("Destroying main window.")
         # Check root exists before destroying
@@ -1890,7 +2498,7 @@ if __name__ == "__main__":
             sys.exit(1)
         else:
             # Handle other TclErrors
-            logger.critical(f"Unhandled TclError during application startup: {e}", exc_info=True)
+            logger.critical("Unhandled TclError during application startup: %s", e, exc_info=True)
             sys.exit(f"Application terminated due to TclError: {e}")
     except Exception as e:
         # Catch any other unexpected critical errors during app creation or mainloop startup
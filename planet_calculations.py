@@ -8,7 +8,9 @@ from skyfield.searchlib import find_discrete, find_maxima, find_minima # Import
 from functools import lru_cache
 from typing import List, Dict, Tuple, Union, Optional # Added Optional
 import logging
+import os
 import sys # Import sys for SystemExit
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging (Ensure this is configured suitably by the main application)
 logger = logging.getLogger(__name__)
@@ -25,7 +27,7 @@ try:
     # Attempt to load the ephemeris and timescale
     planets = load(EPHEMERIS_FILE)
     ts = load.timescale()
-    logger.info(f"Timescale loaded successfully.")
+    logger.info("Timescale loaded successfully.")
 
     # Use fallback if ephemeris doesn't directly expose jalpha/jomega
     # Adding a small buffer to avoid potential edge issues with calculations
@@ -37,11 +39,11 @@ try:
     try:
          start_time_obj = ts.tt(jd=ephem_start_jd)
          end_time_obj = ts.tt(jd=ephem_end_jd)
-         logger.info(f"Ephemeris '{EPHEMERIS_FILE}' loaded. Effective calculation range: "
-                     f"{start_time_obj.utc_strftime('%Y-%m-%d')} to {end_time_obj.utc_strftime('%Y-%m-%d')}")
+         logger.info("Ephemeris '%s' loaded. Effective calculation range: "
+                     "%s to %s", EPHEMERIS_FILE, start_time_obj.utc_strftime('%Y-%m-%d'), end_time_obj.utc_strftime('%Y-%m-%d'))
     except Exception as e:
-        logger.error(f"Could not format ephemeris range dates: {e}")
-        logger.info(f"Ephemeris '{EPHEMERIS_FILE}' loaded. Effective JD range: {ephem_start_jd:.2f} to {ephem_end_jd:.2f}")
+        logger.error("Could not format ephemeris range dates: %s", e)
+        logger.info("Ephemeris '%s' loaded. Effective JD range: %.2f to %.2f", EPHEMERIS_FILE, ephem_start_jd, ephem_end_jd)
 
 except FileNotFoundError:
     err_msg = f"FATAL: Ephemeris file ('{EPHEMERIS_FILE}') not found. Download it first (e.g., using skyfield.iokit.load_file)."
@@ -80,7 +82,7 @@ if 'sun' not in planets or earth_body_name is None or not moon_loaded:
 sun = planets['sun']
 earth = planets[earth_body_name]
 moon = planets['moon'] # Assign Moon object now that we know it exists
-logger.info(f"Using '{earth_body_name}' for Earth calculations.")
+logger.info("Using '%s' for Earth calculations.", earth_body_name)
 
 # --- Planet Dictionary (for body object lookup) ---
 # Map user-facing names to Skyfield body objects loaded from the ephemeris
@@ -108,20 +110,20 @@ fallback_bodies = { # Map names to fallback keys if primary isn't found
 for name, primary_key in default_bodies.items():
     if primary_key in planets:
          planet_dict[name] = {"body": planets[primary_key]}
-         logger.debug(f"Mapped '{name}' to ephemeris object '{primary_key}'.")
+         logger.debug("Mapped '%s' to ephemeris object '%s'.", name, primary_key)
     elif name in fallback_bodies and fallback_bodies[name] in planets:
          fallback_key = fallback_bodies[name]
          planet_dict[name] = {"body": planets[fallback_key]}
-         logger.info(f"Mapped '{name}' using fallback ephemeris object '{fallback_key}' (primary '{primary_key}' not found).")
+         logger.info("Mapped '%s' using fallback ephemeris object '%s' (primary '%s' not found).", name, fallback_key, primary_key)
     else:
         # Check if body name itself exists (for standard planets)
         body_exists = planets.names().get(name.lower()) is not None
         if primary_key not in planets and not body_exists:
-            logger.warning(f"Body for '{name}' (tried keys: '{primary_key}'"
-                           f"{f', fallback: \'{fallback_bodies[name]}\'' if name in fallback_bodies else ''})"
-                           f" not found in loaded ephemeris. Calculations for '{name}' will fail.")
+            logger.warning("Body for '%s' (tried keys: '%s'"
+                           "%s)"
+                           " not found in loaded ephemeris. Calculations for '%s' will fail.", name, primary_key, f', fallback: \'{fallback_bodies[name]}\'' if name in fallback_bodies else '', name)
 
-logger.info(f"Mapped {len(planet_dict)} bodies from configuration to ephemeris objects: {list(planet_dict.keys())}")
+logger.info("Mapped %s bodies from configuration to ephemeris objects: %s", len(planet_dict), list(planet_dict.keys()))
 
 # --- Constants for Application Logic ---
 # Application Date Range Constants (used for GUI constraints, user input validation)
@@ -135,19 +137,20 @@ try:
     app_end_jd = ts.from_datetime(EPHEMERIS_END).tt
     # Compare app range to buffered ephem range
     if app_start_jd < ephem_start_jd or app_end_jd > ephem_end_jd:
-         logger.warning(f"Application's configured date range ({EPHEMERIS_START.strftime('%Y-%m-%d')} to {EPHEMERIS_END.strftime('%Y-%m-%d')}) "
-                        f"partially exceeds the loaded ephemeris' effective calculation range "
-                        f"({ts.tt(jd=ephem_start_jd).utc_strftime('%Y-%m-%d')} to {ts.tt(jd=ephem_end_jd).utc_strftime('%Y-%m-%d')}). "
-                        "Calculations requested outside the ephemeris range will be clamped or may fail.")
+         logger.warning("Application's configured date range (%s to %s) "
+                        "partially exceeds the loaded ephemeris' effective calculation range "
+                        "(%s to %s). "
+                        "Calculations requested outside the ephemeris range will be clamped or may fail.", EPHEMERIS_START.strftime('%Y-%m-%d'), EPHEMERIS_END.strftime('%Y-%m-%d'), ts.tt(jd=ephem_start_jd).utc_strftime('%Y-%m-%d'), ts.tt(jd=ephem_end_jd).utc_strftime('%Y-%m-%d'))
     else:
          logger.info("Application date range is within the effective ephemeris range.")
 except Exception as e:
-    logger.error(f"Could not validate application date range against ephemeris bounds: {e}")
+    logger.error("Could not validate application date range against ephemeris bounds: %s", e)
 
 # MOON_SCALE_FACTOR Removed - Coordinate scaling distorted position.
 # Scaling for visual purposes should be done in the plotting layer (e.g., marker size).
 
 # --- Time Parsing Utility ---
+@lru_cache(maxsize=256) # Same orbit-range strings are re-parsed on every plot/animation request
 def parse_date_time(date_str: str, time_str: str = "12:00:00") -> Time:
     """
     Parses date and optional time strings into a Skyfield Time object (UTC).
@@ -157,7 +160,7 @@ def parse_date_time(date_str: str, time_str: str = "12:00:00") -> Time:
         time_str: Time string in "HH:MM" or "HH:MM:SS" format (default: "12:00:00").
 
     Returns:
-        A Skyfield Time object.
+        A Skyfield Time object (cached and shared between callers; treat as read-only).
 
     Raises:
         ValueError: If the date/time format is invalid or outside the supported ephemeris range.
@@ -187,29 +190,49 @@ def parse_date_time(date_str: str, time_str: str = "12:00:00") -> Time:
          raise ValueError(err)
     return t
 
-# --- Orbit Calculation ---
-@lru_cache(maxsize=32) # Cache recent orbit calculations
-def calculate_orbit(planet_name: str, t_start_jd_input: float, t_end_jd_input: float, num_points: int = 365) -> np.ndarray:
+# --- Warm-up ---
+def warm_up() -> None:
     """
-    Calculates heliocentric orbit positions for planets or Moon
-    between two Julian Dates (TT), clamped to ephemeris bounds.
+    Evaluates every mapped body once (geometric and apparent) at the current time.
+    Intended to run on a background thread at startup, so that ephemeris segment
+    reads and Skyfield's lazily built time/nutation data are ready before the
+    first user request. Failures are only logged.
+    """
+    try:
+        t_now = ts.now()
+        earth_observer = earth.at(t_now)
+        earth_observer.observe(sun).apparent()
+        for data in planet_dict.values():
+            (data["body"] - sun).at(t_now)
+        logger.debug("Skyfield warm-up complete for %s bodies.", len(planet_dict))
+    except Exception as e:
+        logger.warning("Skyfield warm-up failed (first calculation may be slower): %s", e)
 
-    Args:
-        planet_name: The name of the body (e.g., "Mars", "Moon").
-        t_start_jd_input: Requested start Julian Date (TT).
-        t_end_jd_input: Requested end Julian Date (TT).
-        num_points: Number of points to calculate along the orbit.
+# --- Orbit Calculation ---
+# Cache keys use the TT Julian date rounded to 4 decimals (~9 s), which is far
+# below anything visible in the plot or the printed elements.
+CACHE_JD_DECIMALS = 4
 
-    Returns:
-        A numpy array of shape (3, num_points) containing heliocentric [x, y, z] coordinates in AU,
-        or an empty array (3, 0) if calculation fails or planet is invalid.
+@lru_cache(maxsize=32)
+def _orbit_sample_times(t_start_jd: float, t_end_jd: float, num_points: int) -> Time:
     """
+    Builds the TT sample grid for an orbit line as a single vector Time object.
+
+    Cached so that every body sampled over the same (clamped) range shares one
+    Time array, and Skyfield derives its lazily computed time attributes once
+    per grid rather than once per planet.
+    """
+    return ts.tt_jd(np.linspace(t_start_jd, t_end_jd, num_points))
+
+@lru_cache(maxsize=128) # Keyed on the rounded JDs produced by calculate_orbit
+def _calculate_orbit_rounded(planet_name: str, t_start_jd_input: float, t_end_jd_input: float, num_points: int) -> np.ndarray:
+    """Cached body of calculate_orbit; returned arrays are shared and read-only."""
     if planet_name not in planet_dict:
-        logger.warning(f"Invalid planet name '{planet_name}' requested for orbit calculation.")
+        logger.warning("Invalid planet name '%s' requested for orbit calculation.", planet_name)
         return np.empty((3, 0))
 
     if num_points <= 1:
-        logger.warning(f"Cannot calculate orbit with num_points <= 1 (got {num_points}) for {planet_name}.")
+        logger.warning("Cannot calculate orbit with num_points <= 1 (got %s) for %s.", num_points, planet_name)
         return np.empty((3, 0))
     if ts is None or planets is None: # Should not happen
          logger.critical("Ephemeris/timescale not loaded, cannot calculate orbit.")
@@ -221,139 +244,155 @@ def calculate_orbit(planet_name: str, t_start_jd_input: float, t_end_jd_input: f
 
     # Check for valid duration *after* clamping
     if t_start_clamped_jd >= t_end_clamped_jd - 1e-6: # Allow very small intervals, prevent negative/zero
-        logger.warning(f"Orbit range for {planet_name} has zero or negative duration after clamping to ephemeris bounds: "
-                       f"Clamped Start JD {t_start_clamped_jd:.4f}, Clamped End JD {t_end_clamped_jd:.4f} "
-                       f"(Requested: {t_start_jd_input:.4f} to {t_end_jd_input:.4f})")
+        logger.warning("Orbit range for %s has zero or negative duration after clamping to ephemeris bounds: "
+                       "Clamped Start JD %.4f, Clamped End JD %.4f "
+                       "(Requested: %.4f to %.4f)", planet_name, t_start_clamped_jd, t_end_clamped_jd, t_start_jd_input, t_end_jd_input)
         return np.empty((3, 0))
 
-    # Convert clamped JDs to Time objects
+    # Build (or reuse) the shared vector Time grid for the clamped range
     try:
-        t_start = ts.tt(jd=t_start_clamped_jd)
-        t_end = ts.tt(jd=t_end_clamped_jd)
+        times = _orbit_sample_times(t_start_clamped_jd, t_end_clamped_jd, num_points)
     except ValueError as e:
-        logger.error(f"Failed to create Time objects from clamped JDs ({t_start_clamped_jd}, {t_end_clamped_jd}) "
-                     f"for {planet_name} orbit: {e}", exc_info=True)
+        logger.error("Failed to build orbit sample times from clamped JDs (%s, %s) "
+                     "for %s orbit with %s points: %s", t_start_clamped_jd, t_end_clamped_jd, planet_name, num_points, e, exc_info=True)
         return np.empty((3, 0))
 
-    logger.info(f"Calculating orbit for {planet_name} from {t_start.utc_iso()} to {t_end.utc_iso()} ({num_points} points).")
-    try:
-        times = ts.linspace(t_start, t_end, num_points)
-    except ValueError as e:
-        logger.error(f"Failed during ts.linspace for {planet_name} ({t_start.utc_iso()} to {t_end.utc_iso()}) "
-                     f"with {num_points} points: {e}", exc_info=True)
-        return np.empty((3, 0))
+    logger.info("Calculating orbit for %s from %s to %s (%s points).", planet_name, times[0].utc_iso(), times[-1].utc_iso(), num_points)
 
     planet_body = planet_dict[planet_name]["body"]
     positions = np.empty((3, 0)) # Initialize as empty
     try:
-        if planet_name == "Moon":
-            # Calculate Earth's heliocentric position vector at all times
-            earth_pos_helio = (earth - sun).at(times)
-            # Calculate Moon's geocentric position vector relative to Earth at all times
-            moon_pos_geo = (moon - earth).at(times)
-            # Add vectors to get Moon's heliocentric position
-            # Access .position.au which returns the (3, N) array
-            positions = earth_pos_helio.position.au + moon_pos_geo.position.au
-            logger.debug(f"Calculated heliocentric orbit for Moon (Earth vector + Moon vector).")
-        else:
-            # Standard heliocentric position relative to Sun body
-            pos_vectors = (planet_body - sun).at(times)
-            positions = pos_vectors.position.au # shape (3, N)
-            logger.debug(f"Calculated heliocentric orbit for {planet_name}")
+        # One vectorized evaluation over the whole time grid per body.
+        # For the Moon, (moon - sun) is the same Earth + geocentric-Moon vector sum,
+        # but without evaluating the shared Earth segments twice.
+        pos_vectors = (planet_body - sun).at(times)
+        positions = pos_vectors.position.au # shape (3, N)
+        logger.debug("Calculated heliocentric orbit for %s", planet_name)
 
         # Check result shape
         if not isinstance(positions, np.ndarray) or positions.ndim != 2 or positions.shape[0] != 3:
-             logger.error(f"Orbit calculation for {planet_name} resulted in unexpected position data shape: {getattr(positions,'shape',type(positions))}")
+             logger.error("Orbit calculation for %s resulted in unexpected position data shape: %s", planet_name, getattr(positions,'shape',type(positions)))
              return np.empty((3,0))
 
     except ValueError as e:
-        logger.error(f"ValueError during orbit points calculation for {planet_name}: {e}", exc_info=False)
+        logger.error("ValueError during orbit points calculation for %s: %s", planet_name, e, exc_info=False)
         return np.empty((3, 0))
     except Exception as e:
-        logger.error(f"Unexpected error calculating orbit points for {planet_name}: {e}", exc_info=True)
+        logger.error("Unexpected error calculating orbit points for %s: %s", planet_name, e, exc_info=True)
         return np.empty((3, 0))
 
     # Final validation on the computed array shape vs expected num_points
     if positions.shape[1] != num_points:
-        logger.error(f"Orbit calculation for {planet_name} resulted in wrong number of points: {positions.shape[1]} (expected {num_points})")
+        logger.error("Orbit calculation for %s resulted in wrong number of points: %s (expected %s)", planet_name, positions.shape[1], num_points)
         # Decide whether to return partial result or empty (returning empty is safer)
         return np.empty((3,0))
 
-    logger.debug(f"Orbit calculation successful for {planet_name}: shape={positions.shape}")
+    logger.debug("Orbit calculation successful for %s: shape=%s", planet_name, positions.shape)
+    positions.setflags(write=False) # Shared between callers via the cache, must not be mutated
     return positions
 
+def calculate_orbit(planet_name: str, t_start_jd_input: float, t_end_jd_input: float, num_points: int = 365) -> np.ndarray:
+    """
+    Calculates heliocentric orbit positions for planets or Moon
+    between two Julian Dates (TT), clamped to ephemeris bounds.
+
+    Args:
+        planet_name: The name of the body (e.g., "Mars", "Moon").
+        t_start_jd_input: Requested start Julian Date (TT).
+        t_end_jd_input: Requested end Julian Date (TT).
+        num_points: Number of points to calculate along the orbit.
+
+    Returns:
+        A numpy array of shape (3, num_points) containing heliocentric [x, y, z] coordinates in AU,
+        or an empty array (3, 0) if calculation fails or planet is invalid.
+        The array is read-only: results are cached per (planet, range, points), with the
+        range rounded to CACHE_JD_DECIMALS so that float noise in the slider-derived
+        dates still hits the cache.
+    """
+    return _calculate_orbit_rounded(planet_name, round(float(t_start_jd_input), CACHE_JD_DECIMALS),
+                                    round(float(t_end_jd_input), CACHE_JD_DECIMALS), num_points)
+
+def calculate_orbits(planet_names: List[str], t_start_jd: float, t_end_jd: float, num_points: int = 365) -> Dict[str, np.ndarray]:
+    """
+    Runs calculate_orbit for several bodies over the same range concurrently.
+
+    Returns a dictionary mapping each name (in input order) to its orbit array,
+    which is empty (3, 0) for bodies whose calculation failed.
+    """
+    if not planet_names: return {}
+    # Bodies are independent and Skyfield/NumPy spend most of the time outside the
+    # GIL; a short-lived local pool avoids competing with the caller's own pool.
+    max_workers = min(len(planet_names), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Orbit") as executor:
+        futures = [executor.submit(calculate_orbit, name, t_start_jd, t_end_jd, num_points) for name in planet_names]
+        return {name: future.result() for name, future in zip(planet_names, futures)}
+
 # --- Instantaneous Position Calculation ---
+def _describe_time(t: Time) -> str:
+    """Readable description of a scalar or vector Time for log messages."""
+    t_shape = np.shape(t.tt)
+    if not t_shape: return t.utc_iso()
+    return f"{t_shape[0]} times from {t[0].utc_iso()} to {t[-1].utc_iso()}" # Never format every time of a vector
+
 def get_heliocentric_positions(selected_planets: List[str], t: Time) -> Dict[str, np.ndarray]:
     """
     Calculates heliocentric positions for selected planets (including Moon)
     at a specific time `t`, checking ephemeris bounds.
 
+    `t` may also be a vector Time (e.g. from ts.linspace); each body is then
+    evaluated once for the whole series instead of once per time step.
+
     Args:
         selected_planets: List of planet names (must be keys in `planet_dict`).
-        t: Skyfield Time object for the desired time.
+        t: Skyfield Time object for the desired time (scalar or vector).
 
     Returns:
         A dictionary mapping planet names to their heliocentric [x, y, z] position vectors
-        (np.ndarray, shape (3,)) in AU. Returns an empty dictionary if the time `t`
-        is invalid or outside ephemeris range.
+        (np.ndarray, shape (3,), or (3, N) for a vector Time) in AU. Returns an empty
+        dictionary if the time `t` is invalid or outside ephemeris range.
     """
     positions = {}
     if not isinstance(t, Time):
-        logger.error(f"Invalid time object provided to get_heliocentric_positions: {type(t)}")
+        logger.error("Invalid time object provided to get_heliocentric_positions: %s", type(t))
         return {}
     if ts is None or planets is None or earth is None or sun is None or moon is None: # Check all needed globals
         logger.critical("Core objects (ts, planets, earth, sun, moon) not loaded. Cannot get positions.")
         return {}
 
+    t_shape = np.shape(t.tt)
+    # UTC formatting is costly; only describe the time when something will actually be logged
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     # Check if time t is within the effective ephemeris range (critical)
-    if not (ephem_start_jd <= t.tt <= ephem_end_jd):
-        logger.error(f"Time {t.utc_iso()} (JD {t.tt:.4f}) is outside loaded ephemeris effective range. Cannot calculate positions.")
+    if not np.all((ephem_start_jd <= t.tt) & (t.tt <= ephem_end_jd)):
+        logger.error("Time %s is outside loaded ephemeris effective range. Cannot calculate positions.", _describe_time(t))
         return {}
 
-    # Pre-calculate Earth's heliocentric position at time t if Moon is requested
-    earth_pos_helio_au = None
-    if "Moon" in selected_planets:
-        try:
-             earth_pos_helio_au = (earth - sun).at(t).position.au
-        except Exception as e:
-             logger.error(f"Failed to calculate Earth's heliocentric position for Moon calculation at {t.utc_iso()}: {e}")
-             return {} # Cannot calculate Moon without Earth position
-
+    expected_shape = (3,) + t_shape
     for name in selected_planets:
         if name not in planet_dict:
-            logger.warning(f"Planet '{name}' not found in planet_dict, skipped in get_heliocentric_positions.")
+            logger.warning("Planet '%s' not found in planet_dict, skipped in get_heliocentric_positions.", name)
             continue
 
         planet_body = planet_dict[name]["body"]
         pos_au = None # Initialize position for this body
         try:
-            if name == "Moon":
-                # Use pre-calculated Earth position if available
-                if earth_pos_helio_au is None:
-                     logger.warning("Skipping Moon position as Earth position calculation failed earlier.")
-                     continue
-                # Calculate Moon's position relative to Earth
-                moon_pos_geo_vector = (moon - earth).at(t)
-                moon_pos_geo_au = moon_pos_geo_vector.position.au
-                # Add vectors to get Moon's heliocentric position
-                pos_au = earth_pos_helio_au + moon_pos_geo_au
-                logger.debug(f"Calculated heliocentric position for Moon at {t.utc_iso()}")
-            else:
-                # Standard Heliocentric relative to Sun
-                pos_vector = (planet_body - sun).at(t)
-                pos_au = pos_vector.position.au # pos_au is a (3,) numpy array
-                logger.debug(f"Calculated heliocentric position for {name} at {t.utc_iso()}")
+            # Heliocentric relative to Sun. For the Moon, (moon - sun) is the same
+            # Earth + geocentric-Moon vector sum as computing the two separately.
+            pos_vector = (planet_body - sun).at(t)
+            pos_au = pos_vector.position.au # (3,) numpy array, or (3, N) for a vector Time
+            if debug_enabled: logger.debug("Calculated heliocentric position for %s at %s", name, _describe_time(t))
 
             # Validate shape and store
-            if isinstance(pos_au, np.ndarray) and pos_au.shape == (3,):
+            if isinstance(pos_au, np.ndarray) and pos_au.shape == expected_shape:
                  positions[name] = pos_au
             else:
-                 logger.error(f"Position calculation for {name} at {t.utc_iso()} returned invalid shape/type: {getattr(pos_au, 'shape', type(pos_au))}")
+                 logger.error("Position calculation for %s at %s returned invalid shape/type: %s", name, _describe_time(t), getattr(pos_au, 'shape', type(pos_au)))
         except ValueError as e:
-             logger.error(f"ValueError calculating position for {name} at {t.utc_iso()}: {e}", exc_info=False)
+             logger.error("ValueError calculating position for %s at %s: %s", name, _describe_time(t), e, exc_info=False)
              continue # Continue to next planet
         except Exception as e:
-            logger.error(f"Unexpected error calculating position for {name} at {t.utc_iso()}: {e}", exc_info=True)
+            logger.error("Unexpected error calculating position for %s at %s: %s", name, _describe_time(t), e, exc_info=True)
             continue # Continue to next planet
 
     return positions
@@ -378,10 +417,10 @@ def get_orbital_elements(planet_name: str, t: Time) -> Dict[str, float]:
     default_elements = {"semi_major_axis": 0.0, "eccentricity": 0.0}
 
     if planet_name not in planet_dict:
-        logger.warning(f"Invalid planet name '{planet_name}' for orbital elements calculation.")
+        logger.warning("Invalid planet name '%s' for orbital elements calculation.", planet_name)
         return default_elements
     if not isinstance(t, Time):
-        logger.error(f"Invalid time object provided for orbital elements: {type(t)}")
+        logger.error("Invalid time object provided for orbital elements: %s", type(t))
         return default_elements
     # Check prerequisites
     if ts is None or planets is None or sun is None or earth is None or moon is None:
@@ -390,7 +429,7 @@ def get_orbital_elements(planet_name: str, t: Time) -> Dict[str, float]:
 
     # Check if time t is within the effective ephemeris range (critical)
     if not (ephem_start_jd <= t.tt <= ephem_end_jd):
-        logger.error(f"Time {t.utc_iso()} (JD {t.tt:.4f}) is outside loaded ephemeris effective range. Cannot calculate elements for {planet_name}.")
+        logger.error("Time %s (JD %.4f) is outside loaded ephemeris effective range. Cannot calculate elements for %s.", t.utc_iso(), t.tt, planet_name)
         return default_elements
 
     planet_body = planet_dict[planet_name]["body"]
@@ -398,7 +437,8 @@ def get_orbital_elements(planet_name: str, t: Time) -> Dict[str, float]:
         # Determine the center body for element calculation
         center_body = earth if planet_name == "Moon" else sun
         center_name = "Earth" if planet_name == "Moon" else "Sun"
-        logger.debug(f"Calculating orbital elements for {planet_name} relative to {center_name} at {t.utc_iso()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calculating orbital elements for %s relative to %s at %s", planet_name, center_name, t.utc_iso())
 
         relative_vector = (planet_body - center_body).at(t)
         elements = osculating_elements_of(relative_vector)
@@ -407,28 +447,80 @@ def get_orbital_elements(planet_name: str, t: Time) -> Dict[str, float]:
         ecc = elements.eccentricity
         # Basic validation
         if not (isinstance(semi_major_axis_au, float) and semi_major_axis_au >= 0):
-             logger.warning(f"Calculated semi-major axis for {planet_name} is invalid: {semi_major_axis_au}")
+             logger.warning("Calculated semi-major axis for %s is invalid: %s", planet_name, semi_major_axis_au)
              semi_major_axis_au = 0.0 # Fallback
         # Eccentricity check: usually < 1 for bound orbits, but elements can be slightly >= 1 near parabola
         if not (isinstance(ecc, float) and ecc >= 0.0):
-            logger.warning(f"Calculated eccentricity for {planet_name} is negative or invalid: {ecc}")
+            logger.warning("Calculated eccentricity for %s is negative or invalid: %s", planet_name, ecc)
             ecc = 0.0 # Fallback
         elif ecc > 1.1: # Warn if clearly hyperbolic/unusual for typical request
-             logger.warning(f"Calculated eccentricity for {planet_name} is high (hyperbolic?): {ecc:.5f}")
+             logger.warning("Calculated eccentricity for %s is high (hyperbolic?): %.5f", planet_name, ecc)
 
 
         return {"semi_major_axis": semi_major_axis_au, "eccentricity": ecc}
 
     except ValueError as e: # Skyfield internal value error
-         logger.error(f"ValueError calculating elements for {planet_name} at {t.utc_iso()}: {e}", exc_info=False)
+         logger.error("ValueError calculating elements for %s at %s: %s", planet_name, t.utc_iso(), e, exc_info=False)
          return default_elements
     except AttributeError as e: # Structure changes
-        logger.error(f"AttributeError calculating elements for {planet_name} at {t.utc_iso()}: {e}", exc_info=True)
+        logger.error("AttributeError calculating elements for %s at %s: %s", planet_name, t.utc_iso(), e, exc_info=True)
         return default_elements
     except Exception as e: # Other errors
-         logger.error(f"Unexpected error calculating orbital elements for {planet_name} at {t.utc_iso()}: {e}", exc_info=True)
+         logger.error("Unexpected error calculating orbital elements for %s at %s: %s", planet_name, t.utc_iso(), e, exc_info=True)
          return default_elements
 
+# --- Cached Lookups (rounded instants) ---
+# Chat "info" queries and repeated plot updates ask for the same (or nearly the same)
+# instant over and over; see CACHE_JD_DECIMALS for the key rounding.
+
+@lru_cache(maxsize=4096)
+def _elements_cached(planet_name: str, tt_rounded: float) -> Dict[str, float]:
+    """
+    Cache layer for get_orbital_elements keyed on (name, rounded TT JD).
+    Raises LookupError when only the all-zero default came back, so failures are never cached.
+    """
+    elements = get_orbital_elements(planet_name, ts.tt_jd(tt_rounded))
+    if elements["semi_major_axis"] == 0.0 and elements["eccentricity"] == 0.0:
+        raise LookupError(f"No orbital elements for {planet_name} at JD {tt_rounded}")
+    return elements
+
+@lru_cache(maxsize=4096)
+def _helio_cached(planet_name: str, tt_rounded: float) -> np.ndarray:
+    """
+    Cache layer for a single body's heliocentric position keyed on (name, rounded TT JD).
+    Raises LookupError when no position could be computed, so failures are never cached.
+    """
+    pos_au = get_heliocentric_positions([planet_name], ts.tt_jd(tt_rounded)).get(planet_name)
+    if pos_au is None:
+        raise LookupError(f"No heliocentric position for {planet_name} at JD {tt_rounded}")
+    pos_au.setflags(write=False) # Shared between callers, must not be mutated
+    return pos_au
+
+def get_orbital_elements_cached(planet_name: str, t: Time) -> Dict[str, float]:
+    """
+    Same as get_orbital_elements, but served from an LRU cache keyed on the
+    planet name and the TT Julian date rounded to CACHE_JD_DECIMALS.
+    """
+    if not isinstance(t, Time):
+        return get_orbital_elements(planet_name, t) # Let the uncached path report the error
+    try: return dict(_elements_cached(planet_name, round(float(t.tt), CACHE_JD_DECIMALS)))
+    except LookupError: # Already logged by get_orbital_elements; retried on the next call
+        return {"semi_major_axis": 0.0, "eccentricity": 0.0}
+
+def get_heliocentric_positions_cached(selected_planets: List[str], t: Time) -> Dict[str, np.ndarray]:
+    """
+    Same as get_heliocentric_positions, but each body's (read-only) position vector
+    is served from an LRU cache keyed on the planet name and the rounded TT Julian date.
+    """
+    if not isinstance(t, Time):
+        return get_heliocentric_positions(selected_planets, t) # Let the uncached path report the error
+    tt_rounded = round(float(t.tt), CACHE_JD_DECIMALS)
+    positions = {}
+    for name in selected_planets:
+        try: positions[name] = _helio_cached(name, tt_rounded)
+        except LookupError: pass # Already logged by get_heliocentric_positions; retried on the next call
+    return positions
+
 # --- Event Calculation Helpers ---
 def _calculate_angle(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """Helper: Calculate angle degrees between two 3D vectors. Handles zero vectors, clips cosine."""
@@ -441,31 +533,46 @@ def _calculate_angle(vec1: np.ndarray, vec2: np.ndarray) -> float:
     angle_rad = np.arccos(cos_angle)
     return np.degrees(angle_rad)
 
+def _calculate_angles(vecs1: np.ndarray, vecs2: np.ndarray) -> np.ndarray:
+    """
+    Helper: Vectorized _calculate_angle for (3, N) arrays of vectors (column-wise).
+    Returns an (N,) array of angles in degrees; near-zero vectors give 0.0.
+    """
+    norms1 = np.linalg.norm(vecs1, axis=0)
+    norms2 = np.linalg.norm(vecs2, axis=0)
+    norms = norms1 * norms2
+    dots = np.einsum('ij,ij->j', vecs1, vecs2)
+    valid = (norms1 >= 1e-12) & (norms2 >= 1e-12) # Same per-vector tolerance as _calculate_angle
+    cos_angles = np.ones_like(dots) # cos(0) for degenerate vectors
+    np.divide(dots, norms, out=cos_angles, where=valid)
+    return np.degrees(np.arccos(np.clip(cos_angles, -1.0, 1.0)))
+
 # --- Approximate Geometric Event Check (for specific time) ---
 def calculate_events(t: Time, angle_threshold: float = 5.0) -> List[Tuple[str, str]]:
     """Detects approximate geometric events at time t. Checks bounds."""
     # Implementation remains the same as previous corrected version, as it calculates relative geometry.
     # Adding checks for prerequisites at the start.
     if not isinstance(t, Time):
-        logger.error(f"Invalid time object provided to calculate_events: {type(t)}")
+        logger.error("Invalid time object provided to calculate_events: %s", type(t))
         return []
     if ts is None or planets is None or sun is None or earth is None:
         logger.critical("Core objects not loaded, cannot calculate events.")
         return []
     if not (ephem_start_jd <= t.tt <= ephem_end_jd):
-        logger.error(f"Time {t.utc_iso()} (JD {t.tt:.4f}) is outside loaded ephemeris range. Cannot calculate events.")
+        logger.error("Time %s (JD %.4f) is outside loaded ephemeris range. Cannot calculate events.", t.utc_iso(), t.tt)
         return []
 
     events = []
     try:
         earth_observer = earth.at(t)
         sun_pos_geo = earth_observer.observe(sun).position.au
-        earth_pos_helio = (earth - sun).at(t).position.au
         dist_earth_sun = np.linalg.norm(sun_pos_geo)
         if dist_earth_sun < 1e-6: # Avoid division by zero if something weird happens
-            logger.error("Earth-Sun distance near zero at {t.utc_iso()}. Cannot calculate geometric events.")
+            logger.error("Earth-Sun distance near zero at %s. Cannot calculate geometric events.", t.utc_iso())
             return []
 
+        # Skyfield evaluations are per body; the geometry below runs once over all of them
+        names, helio_vectors, geo_vectors = [], [], []
         for name, data in planet_dict.items():
             if name in ["Earth", "Moon"]: continue
             if "body" not in data: continue
@@ -473,27 +580,92 @@ def calculate_events(t: Time, angle_threshold: float = 5.0) -> List[Tuple[str, s
             try:
                  planet_pos_helio = (planet_body - sun).at(t).position.au
                  earth_to_planet_geo = earth_observer.observe(planet_body).position.au
-                 elongation_angle = _calculate_angle(sun_pos_geo, earth_to_planet_geo)
-                 dist_sun_planet = np.linalg.norm(planet_pos_helio)
-                 is_inner_planet = dist_sun_planet < dist_earth_sun
-
-                 if is_inner_planet:
-                     if elongation_angle < angle_threshold: events.append((name, "Inferior Conjunction"))
-                     elif abs(elongation_angle - 180.0) < angle_threshold: events.append((name, "Superior Conjunction"))
-                 else:
-                     if abs(elongation_angle - 180.0) < angle_threshold: events.append((name, "Opposition"))
-                     elif elongation_angle < angle_threshold: events.append((name, "Superior Conjunction"))
-            except ValueError as e: logger.warning(f"ValueError during geometric event check for {name} at {t.utc_iso()}: {e}")
-            except Exception as e: logger.warning(f"Unexpected error during geometric event check for {name} at {t.utc_iso()}: {e}")
-
-    except ValueError as e: logger.error(f"ValueError during base vector calculation for geometric events at {t.utc_iso()}: {e}")
-    except Exception as e: logger.error(f"Unexpected error during setup for geometric event check at {t.utc_iso()}: {e}", exc_info=True)
-
-    if events: logger.debug(f"Found approximate geometric events at {t.utc_iso()}: {events}")
+            except ValueError as e:
+                 logger.warning("ValueError during geometric event check for %s at %s: %s", name, t.utc_iso(), e)
+                 continue
+            except Exception as e:
+                 logger.warning("Unexpected error during geometric event check for %s at %s: %s", name, t.utc_iso(), e)
+                 continue
+            names.append(name)
+            helio_vectors.append(planet_pos_helio)
+            geo_vectors.append(earth_to_planet_geo)
+
+        if names:
+            # (3, n_bodies) columns: elongation of every body from the Sun in one call
+            geo = np.column_stack(geo_vectors)
+            elongations = _calculate_angles(np.broadcast_to(sun_pos_geo[:, None], geo.shape), geo)
+            is_inner = np.linalg.norm(np.column_stack(helio_vectors), axis=0) < dist_earth_sun
+            near_conjunction = elongations < angle_threshold
+            near_opposition = np.abs(elongations - 180.0) < angle_threshold
+            for name, inner, conj, opp in zip(names, is_inner.tolist(), near_conjunction.tolist(), near_opposition.tolist()):
+                if inner:
+                    if conj: events.append((name, "Inferior Conjunction"))
+                    elif opp: events.append((name, "Superior Conjunction"))
+                else:
+                    if opp: events.append((name, "Opposition"))
+                    elif conj: events.append((name, "Superior Conjunction"))
+
+    except ValueError as e: logger.error("ValueError during base vector calculation for geometric events at %s: %s", t.utc_iso(), e)
+    except Exception as e: logger.error("Unexpected error during setup for geometric event check at %s: %s", t.utc_iso(), e, exc_info=True)
+
+    if events and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Found approximate geometric events at %s: %s", t.utc_iso(), events)
     return events
 
 
 # --- Precise Event Finding (using Skyfield Search) ---
+def _find_events_for_planet(name: str, search_start_clamped: Time, search_end_clamped: Time,
+                            angle_threshold_degrees: float, step_days: float) -> List[Tuple[str, str, str]]:
+    """Helper for find_next_events: elongation extrema search for a single body."""
+    events = []
+    planet_body = planet_dict[name]["body"]
+
+    # Elongation function (same as before)
+    def elongation_angle_degrees(t: Time) -> Union[float, np.ndarray]:
+        try:
+            earth_observer = earth.at(t)
+            sun_app_vector = earth_observer.observe(sun).apparent().position.au
+            planet_app_vector = earth_observer.observe(planet_body).apparent().position.au
+            if isinstance(sun_app_vector, np.ndarray) and sun_app_vector.ndim > 1:
+                return _calculate_angles(sun_app_vector, planet_app_vector) # Whole sample grid at once
+            else: return _calculate_angle(sun_app_vector, planet_app_vector)
+        except ValueError as e: return np.nan # Signal error to search
+        except Exception as e: logger.warning("Elongation calc error for %s: %s", name, e); return np.nan
+    elongation_angle_degrees.step_days = step_days
+
+    # Perform search (same as before)
+    try:
+        times_min, angles_min = find_minima(search_start_clamped, search_end_clamped, elongation_angle_degrees)
+        times_max, angles_max = find_maxima(search_start_clamped, search_end_clamped, elongation_angle_degrees)
+
+        if times_min is not None: # Process minima
+             for t_event, angle_event_deg in zip(times_min, angles_min):
+                if not np.isnan(angle_event_deg) and angle_event_deg < angle_threshold_degrees:
+                    event_date_str = t_event.utc_strftime('%Y-%m-%d %H:%M UTC')
+                    try: # Distinguish conjunction type
+                        dist_sun_planet = (planet_body - sun).at(t_event).distance().au
+                        dist_earth_sun = (earth - sun).at(t_event).distance().au
+                        event_type = "Inferior Conjunction" if dist_sun_planet < dist_earth_sun else "Superior Conjunction"
+                    except ValueError as e_dist: event_type = "Conjunction (Unknown Type)"
+                    events.append((name, event_type, event_date_str)); logger.info("Found %s for %s near %s", event_type, name, event_date_str)
+
+        if times_max is not None: # Process maxima
+             for t_event, angle_event_deg in zip(times_max, angles_max):
+                 if not np.isnan(angle_event_deg) and abs(angle_event_deg - 180.0) < angle_threshold_degrees:
+                     event_date_str = t_event.utc_strftime('%Y-%m-%d %H:%M UTC')
+                     try: # Distinguish opposition/conj type
+                         dist_sun_planet = (planet_body - sun).at(t_event).distance().au
+                         dist_earth_sun = (earth - sun).at(t_event).distance().au
+                         event_type = "Opposition" if dist_sun_planet > dist_earth_sun else "Superior Conjunction"
+                     except ValueError as e_dist: event_type = "Opposition/Superior Conj. (Unknown Type)"
+                     events.append((name, event_type, event_date_str)); logger.info("Found %s for %s near %s", event_type, name, event_date_str)
+
+    except ValueError as e: logger.error("Skyfield search ValueError for %s: %s", name, e)
+    except Exception as e: logger.error("Unexpected error during event search for %s: %s", name, e, exc_info=True)
+
+    return events
+
+
 def find_next_events( selected_planets: List[str], t_start: Time, t_end: Time,
                      angle_threshold_degrees: float = 1.0, step_days: float = 0.5
                     ) -> List[Tuple[str, str, str]]:
@@ -506,7 +678,7 @@ def find_next_events( selected_planets: List[str], t_start: Time, t_end: Time,
         logger.error("Invalid Time objects provided to find_next_events.")
         return []
     if t_start.tt >= t_end.tt:
-        logger.error(f"Start time ({t_start.utc_iso()}) must be before end time ({t_end.utc_iso()}).")
+        logger.error("Start time (%s) must be before end time (%s).", t_start.utc_iso(), t_end.utc_iso())
         return []
     if ts is None or planets is None or sun is None or earth is None:
         logger.critical("Core objects not loaded, cannot find events.")
@@ -516,61 +688,24 @@ def find_next_events( selected_planets: List[str], t_start: Time, t_end: Time,
     search_start_clamped_jd = max(t_start.tt, ephem_start_jd)
     search_end_clamped_jd = min(t_end.tt, ephem_end_jd)
     if search_start_clamped_jd >= search_end_clamped_jd - 1e-6:
-        logger.warning(f"Event search range clamps to zero duration.")
+        logger.warning("Event search range clamps to zero duration.")
         return []
     search_start_clamped = ts.tt(jd=search_start_clamped_jd)
     search_end_clamped = ts.tt(jd=search_end_clamped_jd)
 
-    logger.info(f"Searching for precise events involving {selected_planets} between {search_start_clamped.utc_iso()} and {search_end_clamped.utc_iso()}")
+    logger.info("Searching for precise events involving %s between %s and %s", selected_planets, search_start_clamped.utc_iso(), search_end_clamped.utc_iso())
 
-    for name in selected_planets:
-        if name not in planet_dict: continue
-        if name in ["Earth", "Moon"]: continue
-        planet_body = planet_dict[name]["body"]
-
-        # Elongation function (same as before)
-        def elongation_angle_degrees(t: Time) -> Union[float, np.ndarray]:
-            try:
-                earth_observer = earth.at(t)
-                sun_app_vector = earth_observer.observe(sun).apparent().position.au
-                planet_app_vector = earth_observer.observe(planet_body).apparent().position.au
-                if isinstance(sun_app_vector, np.ndarray) and sun_app_vector.ndim > 1:
-                    angles = np.array([_calculate_angle(sv, pv) for sv, pv in zip(sun_app_vector.T, planet_app_vector.T)])
-                    return angles
-                else: return _calculate_angle(sun_app_vector, planet_app_vector)
-            except ValueError as e: return np.nan # Signal error to search
-            except Exception as e: logger.warning(f"Elongation calc error for {name}: {e}"); return np.nan
-        elongation_angle_degrees.step_days = step_days
-
-        # Perform search (same as before)
-        try:
-            times_min, angles_min = find_minima(search_start_clamped, search_end_clamped, elongation_angle_degrees)
-            times_max, angles_max = find_maxima(search_start_clamped, search_end_clamped, elongation_angle_degrees)
-
-            if times_min is not None: # Process minima
-                 for t_event, angle_event_deg in zip(times_min, angles_min):
-                    if not np.isnan(angle_event_deg) and angle_event_deg < angle_threshold_degrees:
-                        event_date_str = t_event.utc_strftime('%Y-%m-%d %H:%M UTC')
-                        try: # Distinguish conjunction type
-                            dist_sun_planet = (planet_body - sun).at(t_event).distance().au
-                            dist_earth_sun = (earth - sun).at(t_event).distance().au
-                            event_type = "Inferior Conjunction" if dist_sun_planet < dist_earth_sun else "Superior Conjunction"
-                        except ValueError as e_dist: event_type = "Conjunction (Unknown Type)"
-                        events.append((name, event_type, event_date_str)); logger.info(f"Found {event_type} for {name} near {event_date_str}")
-
-            if times_max is not None: # Process maxima
-                 for t_event, angle_event_deg in zip(times_max, angles_max):
-                     if not np.isnan(angle_event_deg) and abs(angle_event_deg - 180.0) < angle_threshold_degrees:
-                         event_date_str = t_event.utc_strftime('%Y-%m-%d %H:%M UTC')
-                         try: # Distinguish opposition/conj type
-                             dist_sun_planet = (planet_body - sun).at(t_event).distance().au
-                             dist_earth_sun = (earth - sun).at(t_event).distance().au
-                             event_type = "Opposition" if dist_sun_planet > dist_earth_sun else "Superior Conjunction"
-                         except ValueError as e_dist: event_type = "Opposition/Superior Conj. (Unknown Type)"
-                         events.append((name, event_type, event_date_str)); logger.info(f"Found {event_type} for {name} near {event_date_str}")
-
-        except ValueError as e: logger.error(f"Skyfield search ValueError for {name}: {e}")
-        except Exception as e: logger.error(f"Unexpected error during event search for {name}: {e}", exc_info=True)
+    # Each body's search is independent and Skyfield/NumPy spend most of it outside the
+    # GIL, so the bodies are searched concurrently on a short-lived local pool.
+    search_names = [name for name in selected_planets if name in planet_dict and name not in ["Earth", "Moon"]]
+    if not search_names: return []
+    max_workers = min(len(search_names), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="EventSearch") as executor:
+        futures = [executor.submit(_find_events_for_planet, name, search_start_clamped, search_end_clamped,
+                                   angle_threshold_degrees, step_days)
+                   for name in search_names]
+        for future in futures:
+            events.extend(future.result()) # Helper handles its own errors
 
     return sorted(events, key=lambda item: item[2])
 
@@ -587,17 +722,17 @@ if __name__ == "__main__":
     else:
         try:
             t_test_ref = parse_date_time("2024-06-01", "00:00:00")
-            module_logger.info(f"Reference time: {t_test_ref.utc_iso()}")
+            module_logger.info("Reference time: %s", t_test_ref.utc_iso())
 
             # Test Moon position
             module_logger.info("\nTesting Moon Heliocentric Position:")
             moon_pos = get_heliocentric_positions(["Moon"], t_test_ref)
             if "Moon" in moon_pos:
-                 module_logger.info(f"  Moon Heliocentric Position (AU): {moon_pos['Moon']}")
+                 module_logger.info("  Moon Heliocentric Position (AU): %s", moon_pos['Moon'])
                  # Simple sanity check: Moon distance from Earth should be small AU
                  earth_pos = get_heliocentric_positions(["Earth"], t_test_ref)["Earth"]
                  moon_geo_dist = np.linalg.norm(moon_pos["Moon"] - earth_pos)
-                 module_logger.info(f"  Implied Moon Geocentric Distance (AU): {moon_geo_dist:.6f} (Expected ~0.0026 AU)")
+                 module_logger.info("  Implied Moon Geocentric Distance (AU): %.6f (Expected ~0.0026 AU)", moon_geo_dist)
                  if not (0.002 < moon_geo_dist < 0.003):
                      module_logger.warning("  => Moon geocentric distance seems unexpected.")
             else:
@@ -608,22 +743,22 @@ if __name__ == "__main__":
             t_orbit_end = ts.tt(jd=t_test_ref.tt + 5)
             moon_orbit = calculate_orbit("Moon", t_test_ref.tt, t_orbit_end.tt, num_points=50)
             if moon_orbit.shape == (3, 50):
-                 module_logger.info(f"  Moon orbit calculated, shape {moon_orbit.shape}")
+                 module_logger.info("  Moon orbit calculated, shape %s", moon_orbit.shape)
                  # Check first and last point distances from Earth again
                  earth_orbit_vec = (earth-sun).at(ts.linspace(t_test_ref, t_orbit_end, 50)).position.au
                  moon_geo_dist_orbit_start = np.linalg.norm(moon_orbit[:,0] - earth_orbit_vec[:,0])
                  moon_geo_dist_orbit_end = np.linalg.norm(moon_orbit[:,-1] - earth_orbit_vec[:,-1])
-                 module_logger.info(f"  Implied Moon Geo Dist Start/End (AU): {moon_geo_dist_orbit_start:.6f} / {moon_geo_dist_orbit_end:.6f}")
+                 module_logger.info("  Implied Moon Geo Dist Start/End (AU): %.6f / %.6f", moon_geo_dist_orbit_start, moon_geo_dist_orbit_end)
                  if not (0.002 < moon_geo_dist_orbit_start < 0.003) or not (0.002 < moon_geo_dist_orbit_end < 0.003):
                      module_logger.warning("  => Moon geocentric distance during orbit seems unexpected.")
             else:
-                 module_logger.error(f"  Moon orbit calculation failed or returned wrong shape: {moon_orbit.shape}")
+                 module_logger.error("  Moon orbit calculation failed or returned wrong shape: %s", moon_orbit.shape)
 
              # Test orbital elements for Moon (should still be geocentric)
             module_logger.info("\nTesting Moon Orbital Elements (Geocentric):")
             moon_elements = get_orbital_elements("Moon", t_test_ref)
             if moon_elements["semi_major_axis"] != 0.0:
-                module_logger.info(f"  Moon: SMA={moon_elements['semi_major_axis']:.6f} AU, Ecc={moon_elements['eccentricity']:.5f}")
+                module_logger.info("  Moon: SMA=%.6f AU, Ecc=%.5f", moon_elements['semi_major_axis'], moon_elements['eccentricity'])
             else:
                 module_logger.warning("  Moon elements calculation failed.")
 
@@ -631,7 +766,7 @@ if __name__ == "__main__":
             # (Previous tests for other planets, parsing, events etc. would run here)
 
         except Exception as e:
-             module_logger.critical(f"An unexpected error occurred during tests: {e}", exc_info=True)
+             module_logger.critical("An unexpected error occurred during tests: %s", e, exc_info=True)
 
     module_logger.info("\n--- Planet Calculations Test Complete ---")
 
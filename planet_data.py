@@ -61,7 +61,7 @@ class PlanetData:
                 self.api_data = self._create_fallback_data()
                 # Optionally cache the fallback data too, or leave cache empty
                 # self.save_data_to_cache() # Decide if caching fallback is desired
-        logger.info(f"PlanetData initialized. Tracking {len(self.api_data)} bodies.")
+        logger.info("PlanetData initialized. Tracking %s bodies.", len(self.api_data))
 
     def load_cached_data(self) -> Optional[Dict]:
         """
@@ -78,15 +78,15 @@ class PlanetData:
                     if isinstance(data, dict) and data:
                         return data
                     else:
-                        logger.warning(f"Cache file {self.cache_file} is empty or not a valid dictionary.")
+                        logger.warning("Cache file %s is empty or not a valid dictionary.", self.cache_file)
                         self._remove_invalid_cache()
                         return None
             except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Error loading or parsing cache file {self.cache_file}: {e}")
+                logger.error("Error loading or parsing cache file %s: %s", self.cache_file, e)
                 self._remove_invalid_cache()
                 return None
             except Exception as e: # Catch unexpected errors during load
-                 logger.error(f"Unexpected error loading cache {self.cache_file}: {e}", exc_info=True)
+                 logger.error("Unexpected error loading cache %s: %s", self.cache_file, e, exc_info=True)
                  self._remove_invalid_cache()
                  return None
         return None
@@ -95,9 +95,9 @@ class PlanetData:
         """Attempts to remove the cache file, logging errors."""
         try:
             os.remove(self.cache_file)
-            logger.info(f"Removed potentially invalid cache file: {self.cache_file}")
+            logger.info("Removed potentially invalid cache file: %s", self.cache_file)
         except OSError as remove_err:
-            logger.error(f"Error removing cache file {self.cache_file}: {remove_err}")
+            logger.error("Error removing cache file %s: %s", self.cache_file, remove_err)
 
     def save_data_to_cache(self) -> None:
         """Save the current API data to a local JSON file."""
@@ -110,17 +110,17 @@ class PlanetData:
             cache_dir = os.path.dirname(self.cache_file)
             if cache_dir and not os.path.exists(cache_dir):
                 os.makedirs(cache_dir)
-                logger.info(f"Created cache directory: {cache_dir}")
+                logger.info("Created cache directory: %s", cache_dir)
 
             with open(self.cache_file, 'w', encoding='utf-8') as f:
                 json.dump(self.api_data, f, indent=4, ensure_ascii=False) # ensure_ascii=False for potential non-latin names if API changes
-            logger.info(f"Planet data successfully cached to {self.cache_file}")
+            logger.info("Planet data successfully cached to %s", self.cache_file)
         except IOError as e:
-            logger.error(f"Failed to write cache to {self.cache_file}: {e}")
+            logger.error("Failed to write cache to %s: %s", self.cache_file, e)
         except TypeError as e:
-            logger.error(f"Failed to serialize data for caching: {e}")
+            logger.error("Failed to serialize data for caching: %s", e)
         except Exception as e: # Catch unexpected errors during save
-            logger.error(f"Unexpected error saving cache to {self.cache_file}: {e}", exc_info=True)
+            logger.error("Unexpected error saving cache to %s: %s", self.cache_file, e, exc_info=True)
 
 
     def _create_fallback_data(self) -> Dict[str, Dict]:
@@ -194,13 +194,13 @@ class PlanetData:
             response = requests.get(url, params=params, timeout=self.api_timeout)
             response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
             api_response_data = response.json()
-            logger.info(f"API data fetched successfully ({response.elapsed.total_seconds():.2f}s).")
+            logger.info("API data fetched successfully (%.2fs).", response.elapsed.total_seconds())
 
             # Process the response
             fetched_bodies = {}
             if 'bodies' in api_response_data and isinstance(api_response_data['bodies'], list):
                  num_fetched = len(api_response_data['bodies'])
-                 logger.debug(f"Processing {num_fetched} bodies received from API.")
+                 logger.debug("Processing %s bodies received from API.", num_fetched)
                  for body in api_response_data['bodies']:
                      # Use englishName as key, ensure it exists
                      name = body.get('englishName')
@@ -222,7 +222,7 @@ class PlanetData:
                     final_data[planet_name] = fetched_bodies[planet_name]
                 else:
                     # This body was expected (in planet_dict) but not found in the API response
-                    logger.warning(f"'{planet_name}' not found in API response. Creating partial fallback entry.")
+                    logger.warning("'%s' not found in API response. Creating partial fallback entry.", planet_name)
                     # Create a minimal entry based on defaults, similar to _create_fallback_data but just for one
                     final_data[planet_name] = {
                         "englishName": planet_name,
@@ -238,26 +238,26 @@ class PlanetData:
                  logger.warning("No bodies defined in planet_dict were found in the API response after filtering.")
                  return None # Return None if nothing matched our list
 
-            logger.debug(f"Filtered API data to {len(final_data)} relevant bodies: {list(final_data.keys())}")
+            logger.debug("Filtered API data to %s relevant bodies: %s", len(final_data), list(final_data.keys()))
             return final_data
 
         except requests.exceptions.Timeout:
-            logger.error(f"API request timed out after {self.api_timeout} seconds.")
+            logger.error("API request timed out after %s seconds.", self.api_timeout)
             return None
         except requests.exceptions.HTTPError as e:
-             logger.error(f"HTTP Error fetching data from API: {e.response.status_code} {e.response.reason}")
+             logger.error("HTTP Error fetching data from API: %s %s", e.response.status_code, e.response.reason)
              return None
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to connect to API or other network issue: {e}")
+            logger.error("Failed to connect to API or other network issue: %s", e)
             return None
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response from API: {e}")
+            logger.error("Failed to parse JSON response from API: %s", e)
             # Log response text safely (limit length)
-            try: logger.debug(f"API Response Text (first 500 chars): {response.text[:500]}")
+            try: logger.debug("API Response Text (first 500 chars): %s", response.text[:500])
             except NameError: logger.debug("Response object not available.")
             return None
         except Exception as e: # Catch unexpected errors during fetch/processing
-            logger.error(f"An unexpected error occurred during API fetch: {e}", exc_info=True)
+            logger.error("An unexpected error occurred during API fetch: %s", e, exc_info=True)
             return None
 
     def get_planet_info(self, planet_name: str) -> Optional[Dict[str, str]]:
@@ -273,7 +273,7 @@ class PlanetData:
                                       various properties, or None if the planet is not found.
         """
         if planet_name not in self.api_data:
-             logger.warning(f"No data available for '{planet_name}' in stored API data.")
+             logger.warning("No data available for '%s' in stored API data.", planet_name)
              # Attempt to provide minimal info based on planet_dict if it exists there
              if planet_name in planet_dict:
                  return {
@@ -290,7 +290,7 @@ class PlanetData:
              return None
 
         data = self.api_data[planet_name]
-        logger.debug(f"Retrieving formatted info for {planet_name} from data: {list(data.keys())}")
+        logger.debug("Retrieving formatted info for %s from data: %s", planet_name, list(data.keys()))
 
         # Helper function for safe formatting of numeric values
         def format_numeric(value: Optional[Union[int, float]], unit: str = "", precision: int = 2, sci_notation: bool = False, allow_zero: bool = True) -> str:
@@ -347,7 +347,7 @@ class PlanetData:
         radius_km = data.get('meanRadius')
         # Fallback to planet_dict radius if API value is missing/invalid
         if not isinstance(radius_km, (int, float)) or radius_km <= 0:
-             logger.debug(f"API radius missing/invalid for {planet_name}, falling back to planet_dict.")
+             logger.debug("API radius missing/invalid for %s, falling back to planet_dict.", planet_name)
              radius_km = planet_dict.get(planet_name, {}).get('radius')
         # Format radius in km with commas
         radius_str = format_numeric(radius_km, "km", 0) # Radius usually shown as integer km
@@ -385,6 +385,15 @@ class PlanetData:
         """
         return planet_dict.get(planet_name, {}).get("color", "#808080") # Default gray
 
+    def get_all_planet_colors(self) -> Dict[str, str]:
+        """
+        Get the display colors of all bodies in `planet_dict` in one call.
+
+        Returns:
+            Dict[str, str]: New dictionary mapping planet name to hex color code (#RRGGBB).
+        """
+        return {name: data.get("color", "#808080") for name, data in planet_dict.items()}
+
     def get_planet_radius(self, planet_name: str) -> float:
         """
         Get the mean radius of a planet in kilometers. Prioritizes API data,
@@ -403,17 +412,17 @@ class PlanetData:
             if isinstance(radius_api, (int, float)) and radius_api > 0:
                 return float(radius_api)
             else:
-                logger.debug(f"API radius data missing or invalid for {planet_name}: {radius_api}")
+                logger.debug("API radius data missing or invalid for %s: %s", planet_name, radius_api)
 
         # 2. Try hardcoded planet_dict data
         planet_default_data = planet_dict.get(planet_name, {})
         radius_default = planet_default_data.get("radius")
         if isinstance(radius_default, (int, float)) and radius_default > 0:
-            logger.debug(f"Using default radius from planet_dict for {planet_name}.")
+            logger.debug("Using default radius from planet_dict for %s.", planet_name)
             return float(radius_default)
 
         # 3. Ultimate fallback
-        logger.warning(f"No valid radius found for {planet_name} from API or defaults. Using fallback: 1000.0 km")
+        logger.warning("No valid radius found for %s from API or defaults. Using fallback: 1000.0 km", planet_name)
         return 1000.0
 
 
@@ -436,7 +445,7 @@ except Exception as e:
     # Catch potential errors during initialization (e.g., disk permission for cache)
     # Use print here as logger might fail if basicConfig wasn't called by importer yet
     print(f"CRITICAL: Failed to initialize PlanetData: {e}. Some features may be unavailable.")
-    logger.critical(f"Failed to initialize PlanetData", exc_info=True)
+    logger.critical("Failed to initialize PlanetData", exc_info=True)
     # Provide a dummy object or raise the exception depending on application needs
     # Assigning None allows the calling code to check if initialization succeeded
     planet_data = None
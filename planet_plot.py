@@ -1,4 +1,3 @@
-import plotly.graph_objects as go
 import numpy as np
 from datetime import datetime, UTC
 from skyfield.timelib import Time # For type hinting
@@ -23,6 +22,24 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# plotly is imported on first plot rather than at application startup (it is the
+# slowest import in the app); _load_plotly binds these module-level names.
+go = None
+pio = None
+
+def _load_plotly():
+    """Imports plotly on first use."""
+    global go, pio
+    if go is None:
+        import plotly.graph_objects as plotly_go
+        import plotly.io as plotly_io
+        go, pio = plotly_go, plotly_io
+
+def _max_radius(orbit_pos: np.ndarray) -> float:
+    """Largest distance from the Sun along a (3, N) orbit (one sqrt instead of one per point)."""
+    return float(np.sqrt(np.einsum('ij,ij->j', orbit_pos, orbit_pos).max()))
+
+
 class PlanetPlot:
     """
     Manages 3D plotting of planetary positions and orbits using Plotly.
@@ -37,10 +54,42 @@ class PlanetPlot:
              raise TypeError(msg)
         self.planet_data = planet_data
         self.on_pick_callback = on_pick_callback
-        self.fig: go.Figure = go.Figure()
+        self.fig = None # plotly Figure, built on the first plot
+        self.frames: List[dict] = [] # Animation frames of self.fig as plain dicts (empty for static plots)
         self.master = master # Store reference to the Tkinter root for messageboxes
         logger.info("PlanetPlot initialized successfully.")
 
+    def write_html(self, file_path: str, config: Optional[dict] = None):
+        """
+        Writes the current figure (including any animation frames) to an HTML file.
+        The figure is serialized from its dict form without re-validation: the static
+        traces were validated when added to self.fig, and the frames only carry
+        marker coordinates.
+        """
+        fig_dict = self.fig.to_dict()
+        if self.frames: fig_dict["frames"] = self.frames
+        # plotly.js comes from the CDN and MathJax is never needed (no LaTeX labels);
+        # the page is built as one string and written in a single UTF-8 write
+        html = pio.to_html(fig_dict, config=config, include_plotlyjs='cdn', include_mathjax=False,
+                           full_html=True, validate=False)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+    def _body_style_arrays(self, names: List[str], zoom: float,
+                           colors_to_use: Dict[str, str]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Snapshots per-body styling for one plot as aligned arrays (index i <-> names[i]),
+        so trace building indexes by position instead of repeating dict/data lookups.
+
+        Returns:
+            (radii_km, marker_sizes, colors)
+        """
+        base_size, radius_scale_factor = 5.0, 15.0 / 69911.0 # Marker size scaled relative to Jupiter's radius
+        radii_km = np.array([self.planet_data.get_planet_radius(name) for name in names], dtype=float)
+        marker_sizes = np.clip((base_size*zoom) + (radii_km*radius_scale_factor*zoom), 3.0*zoom, 50.0*zoom)
+        colors = [colors_to_use.get(name) or self.planet_data.get_planet_color(name) for name in names]
+        return radii_km, marker_sizes, colors
+
     def update_plot(self,
                     positions: Dict[str, np.ndarray],
                     orbit_positions: Dict[str, np.ndarray],
@@ -56,9 +105,10 @@ class PlanetPlot:
             logger.error("Invalid current_time object passed to update_plot. Expected skyfield.timelib.Time.")
             return
 
-        logger.info(f"Updating static plot for time {current_time.utc_iso()} with planets: {active_planets}")
+        logger.info("Updating static plot for time %s with planets: %s", current_time.utc_iso(), active_planets)
         colors_to_use = planet_colors if planet_colors is not None else {}
-        self.fig = go.Figure()
+        _load_plotly()
+        self.fig = go.Figure(); self.frames = []
         events_dict = {name: event_type for name, event_type in events}
 
         # Sun
@@ -66,30 +116,32 @@ class PlanetPlot:
         self.fig.add_trace(go.Scatter3d(x=[0],y=[0],z=[0],mode='markers',marker=dict(size=sun_size, color='yellow', opacity=0.9),name='Sun',hoverinfo='name'))
         self.fig.add_trace(go.Scatter3d(x=[0],y=[0],z=[0],mode='markers',marker=dict(size=sun_size * 2, color='yellow', opacity=0.15),name='Sun Glow',showlegend=False,hoverinfo='skip'))
 
+        radii_km, marker_sizes, colors = self._body_style_arrays(active_planets, zoom, colors_to_use)
+
         # Orbits
         max_orbit_radius = 0.0
-        for name in active_planets:
-             if (name in orbit_positions and isinstance(orbit_positions[name], np.ndarray) and
-                 orbit_positions[name].ndim == 2 and orbit_positions[name].shape[0] == 3 and orbit_positions[name].shape[1] > 1):
-                  orbit_pos = orbit_positions[name]; color = colors_to_use.get(name, self.planet_data.get_planet_color(name))
+        for i, name in enumerate(active_planets):
+             # calculate_orbit only hands out (3, N) arrays and callers drop the empty ones,
+             # so a dict lookup is the only check needed here
+             orbit_pos = orbit_positions.get(name)
+             if orbit_pos is not None:
+                  color = colors[i]
                   self.fig.add_trace(go.Scatter3d(x=orbit_pos[0,:],y=orbit_pos[1,:],z=orbit_pos[2,:],mode='lines',line=dict(color=color, width=1.5),name=f"{name} Orbit",opacity=0.6,hoverinfo='skip'))
-                  try: max_orbit_radius = max(max_orbit_radius, np.max(np.linalg.norm(orbit_pos, axis=0)))
-                  except ValueError: logger.warning(f"Could not calculate max radius for {name}'s orbit.")
-             else:
-                 if name in active_planets: logger.warning(f"No valid static orbit data for active planet: {name}")
+                  try: max_orbit_radius = max(max_orbit_radius, _max_radius(orbit_pos))
+                  except ValueError: logger.warning("Could not calculate max radius for %s's orbit.", name)
+             else: logger.warning("No valid static orbit data for active planet: %s", name) # Loop is over active_planets
         
         # Planets
-        max_planet_radius = 0.0; base_size = 5.0; jupiter_radius_km = 69911.0; radius_scale_factor = 15.0 / jupiter_radius_km
-        for name in active_planets:
+        max_planet_radius = 0.0
+        for i, name in enumerate(active_planets):
              if (name in positions and isinstance(positions[name], np.ndarray) and positions[name].shape == (3,)):
                   pos = positions[name]; x, y, z = pos; current_dist = np.linalg.norm(pos); max_planet_radius = max(max_planet_radius, current_dist)
-                  radius_km = self.planet_data.get_planet_radius(name); marker_size = max(3.0*zoom, min((base_size*zoom)+(radius_km*radius_scale_factor*zoom), 50.0*zoom))
-                  color = colors_to_use.get(name, self.planet_data.get_planet_color(name)); event_type = events_dict.get(name); symbol="circle"; event_text = ""
+                  radius_km = radii_km[i]; marker_size = marker_sizes[i]
+                  color = colors[i]; event_type = events_dict.get(name); symbol="circle"; event_text = ""
                   if event_type: symbol_map={"Opposition":"star", "Inferior Conjunction":"diamond-tall", "Superior Conjunction":"cross"}; symbol=symbol_map.get(event_type, "circle-open"); event_text=f"<br><b>{event_type}!</b>"
                   hover_text = f"<b>{name}</b><br>Pos: ({x:.3f}, {y:.3f}, {z:.3f}) AU<br>Dist: {current_dist:.3f} AU<br>Radius: {radius_km:,.0f} km{event_text}"
                   self.fig.add_trace(go.Scatter3d(x=[x],y=[y],z=[z],mode='markers+text',marker=dict(size=marker_size,color=color,symbol=symbol,opacity=0.95,line=dict(width=0.5,color='DarkSlateGrey')),text=[name],textfont=dict(size=10,color=color),textposition="top center",name=name,customdata=[name],hoverinfo="text",hovertext=hover_text,hovertemplate = hover_text + '<extra></extra>'))
-             else:
-                  if name in active_planets: logger.warning(f"No valid position data for active planet: {name}")
+             else: logger.warning("No valid position data for active planet: %s", name)
 
         # Layout
         grid_size = max(max_orbit_radius, max_planet_radius, 1.5) * 1.1; elev_rad, azim_rad = np.radians(elev), np.radians(azim); cam_dist = max(2.0, grid_size * 2.5)
@@ -99,20 +151,16 @@ class PlanetPlot:
         
         # --- ROBUST BROWSER LAUNCH LOGIC (REPLACES OLD `fig.show()`) ---
         plot_file_path = "solar_system_plot.html"
-        logger.info(f"Saving static plot to '{plot_file_path}'...")
+        logger.info("Saving static plot to '%s'...", plot_file_path)
         try:
-            self.fig.write_html(
-                file=plot_file_path,
-                config={'displaylogo': False, 'modeBarButtonsToRemove': ['sendDataToCloud']},
-                include_plotlyjs='cdn'
-            )
+            self.write_html(plot_file_path, config={'displaylogo': False, 'modeBarButtonsToRemove': ['sendDataToCloud']})
             logger.info("Plot saved. Attempting to open in browser...")
 
             file_url = 'file://' + os.path.abspath(plot_file_path)
             webbrowser.open(file_url, new=2)
-            logger.info(f"Browser launch command issued for: {file_url}")
+            logger.info("Browser launch command issued for: %s", file_url)
         except Exception as e:
-            logger.error(f"Failed to save or automatically open static plot: {e}", exc_info=True)
+            logger.error("Failed to save or automatically open static plot: %s", e, exc_info=True)
             if self.master and self.master.winfo_exists():
                 messagebox.showwarning(
                     "Browser Warning",
@@ -123,7 +171,8 @@ class PlanetPlot:
                 )
 
     def create_animation(self,
-                         positions_list: List[Dict[str, np.ndarray]],
+                         frame_positions: np.ndarray,
+                         position_names: List[str],
                          times: List[Time],
                          orbit_positions: Dict[str, np.ndarray],
                          active_planets: List[str],
@@ -135,26 +184,30 @@ class PlanetPlot:
                          status_callback: Optional[Callable[[str], None]] = None):
         """Creates an animated plot, saves it, and attempts to open it in a browser."""
         # [This part is identical to your original correct code]
-        logger.info(f"Creating animation: {len(times)} frames, {frame_duration_ms}ms/frame, planets: {active_planets}")
+        logger.info("Creating animation: %s frames, %sms/frame, planets: %s", len(times), frame_duration_ms, active_planets)
         if status_callback: status_callback("Validating animation inputs...")
-        if not positions_list or not times or len(positions_list) != len(times):
-            logger.error("Animation input error: positions_list and times mismatch or empty.")
+        # frame_positions is a (len(times), len(position_names), 3) array: frame i is frame_positions[i]
+        num_frames = len(times) if times is not None else 0
+        if (not position_names or num_frames == 0 or
+                frame_positions.shape != (num_frames, len(position_names), 3)):
+            logger.error("Animation input error: frame_positions and times/names mismatch or empty.")
             if status_callback: status_callback("Animation failed: Input data length mismatch.")
             return
         colors_to_use = planet_colors if planet_colors is not None else {}
-        self.fig = go.Figure()
-        initial_positions = positions_list[0]
-        base_size, jupiter_radius_km, radius_scale_factor = 5.0, 69911.0, 15.0 / 69911.0
+        _load_plotly()
+        self.fig = go.Figure(); self.frames = []
+        _, marker_sizes, colors = self._body_style_arrays(active_planets, zoom, colors_to_use)
 
         if status_callback: status_callback("Adding initial animation traces...")
         planet_trace_indices = []
         initially_added_planets = []
         trace_counter = 0
-        for name in active_planets:
-            if (name in initial_positions and isinstance(initial_positions[name], np.ndarray) and initial_positions[name].shape == (3,)):
-                 pos = initial_positions[name]; radius_km = self.planet_data.get_planet_radius(name)
-                 marker_size = max(3.0*zoom, min((base_size*zoom)+(radius_km*radius_scale_factor*zoom), 50.0*zoom))
-                 color = colors_to_use.get(name, self.planet_data.get_planet_color(name))
+        name_index = {name: j for j, name in enumerate(position_names)}
+        for i, name in enumerate(active_planets):
+            if name in name_index:
+                 pos = frame_positions[0, name_index[name]]
+                 marker_size = marker_sizes[i]
+                 color = colors[i]
                  hover_text = f"<b>{name}</b>"
                  self.fig.add_trace(go.Scatter3d(
                       x=[pos[0]], y=[pos[1]], z=[pos[2]], mode='markers+text',
@@ -170,24 +223,28 @@ class PlanetPlot:
         self.fig.add_trace(go.Scatter3d(x=[0],y=[0],z=[0],mode='markers',marker=dict(size=sun_size, color='yellow', opacity=0.9),name='Sun',hoverinfo='name')); trace_counter += 1
         self.fig.add_trace(go.Scatter3d(x=[0],y=[0],z=[0],mode='markers',marker=dict(size=sun_size * 2, color='yellow', opacity=0.15),name='Sun Glow',showlegend=False,hoverinfo='skip')); trace_counter += 1
         max_orbit_radius = 0.0
-        for name in active_planets:
-             if (name in orbit_positions and isinstance(orbit_positions[name], np.ndarray) and orbit_positions[name].ndim == 2):
-                 orbit_pos = orbit_positions[name]; color = colors_to_use.get(name, self.planet_data.get_planet_color(name))
+        for i, name in enumerate(active_planets):
+             orbit_pos = orbit_positions.get(name)
+             if orbit_pos is not None:
+                 color = colors[i]
                  self.fig.add_trace(go.Scatter3d(x=orbit_pos[0,:],y=orbit_pos[1,:],z=orbit_pos[2,:],mode='lines',line=dict(color=color,width=1.5),name=f"{name} Orbit",opacity=0.6,hoverinfo='skip')); trace_counter += 1
-                 try: max_orbit_radius = max(max_orbit_radius, np.max(np.linalg.norm(orbit_pos, axis=0)))
-                 except ValueError: logger.warning(f"Could not calculate max radius for static orbit of {name}.")
+                 try: max_orbit_radius = max(max_orbit_radius, _max_radius(orbit_pos))
+                 except ValueError: logger.warning("Could not calculate max radius for static orbit of %s.", name)
 
         if status_callback: status_callback("Generating animation frames...")
-        frames = []; num_frames = len(times); max_abs_val_anim = 0.0
-        for frame_idx in range(num_frames):
-            current_positions = positions_list[frame_idx]; current_time = times[frame_idx]
-            frame_data = [go.Scatter3d(x=[current_positions.get(name, [None])[0]], y=[current_positions.get(name, [None])[1]], z=[current_positions.get(name, [None])[2]]) for name in initially_added_planets]
-            frame_name = current_time.utc_strftime('%Y-%m-%d %H:%M')
-            frames.append(go.Frame(data=frame_data, name=frame_name, traces=planet_trace_indices))
+        # Frames are plain dicts that only carry the moving marker coordinates; building a
+        # validated Scatter3d/Frame object per planet per frame dominated animation setup.
+        frames = []; max_abs_val_anim = 0.0
+        frame_names = times.utc_strftime('%Y-%m-%d %H:%M') # One vectorized format call for all frames
+        # One slice + tolist() gives every frame's [x, y, z] rows as Python floats, in trace order
+        frame_rows = frame_positions[:, [name_index[name] for name in initially_added_planets], :].tolist()
+        for frame_idx, rows in enumerate(frame_rows):
+            frame_data = [dict(type='scatter3d', x=[x], y=[y], z=[z]) for x, y, z in rows]
+            frames.append(dict(data=frame_data, name=frame_names[frame_idx], traces=planet_trace_indices))
             if status_callback and (frame_idx+1)%max(1,num_frames//20)==0: status_callback(f"Generating animation frames... {frame_idx + 1}/{num_frames}")
 
-        self.fig.frames = frames
-        logger.info(f"Generated {len(frames)} animation frames.")
+        self.frames = frames
+        logger.info("Generated %s animation frames.", len(frames))
         
         # [Layout code is identical to your original correct code]
         if status_callback: status_callback("Configuring animation layout...")
@@ -197,7 +254,7 @@ class PlanetPlot:
         axis_config = dict(range=[-grid_size,grid_size],showgrid=False,zeroline=False,showbackground=True,backgroundcolor="#101020",showticklabels=True,tickfont=dict(color='#a0a0b0',size=9),title=dict(font=dict(color='#c0c0d0',size=10)))
         play_button = dict(label="Play", method="animate", args=[None, {"frame": {"duration": frame_duration_ms, "redraw": True}, "mode": "immediate", "fromcurrent": True, "transition": {"duration": 0}}])
         pause_button = dict(label="Pause", method="animate", args=[[None], {"frame": {"duration": 0, "redraw": False}, "mode": "immediate", "transition": {"duration": 0}}])
-        slider_steps = [dict(method="animate", args=[[f.name], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate", "transition": {"duration": 0}}], label=f.name.split(" ")[0]) for f in self.fig.frames]
+        slider_steps = [dict(method="animate", args=[[f["name"]], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate", "transition": {"duration": 0}}], label=f["name"].split(" ")[0]) for f in self.frames]
         self.fig.update_layout(
              title=dict(text=f"Planetary Motion: {times[0].utc_strftime('%Y-%m-%d')} to {times[-1].utc_strftime('%Y-%m-%d')}", font=dict(color="#e0e0ff",size=16),x=0.5,xanchor='center'),
              scene=dict(xaxis_title="X (AU)",yaxis_title="Y (AU)",zaxis_title="Z (AU)",xaxis=axis_config,yaxis=axis_config,zaxis=axis_config,camera=dict(eye=dict(x=cam_x,y=cam_y,z=cam_z),up=dict(x=0,y=0,z=1)),aspectmode='cube'),
@@ -210,22 +267,18 @@ class PlanetPlot:
         # --- ROBUST BROWSER LAUNCH LOGIC (FOR ANIMATION) ---
         animation_file_path = "solar_system_animation.html"
         if status_callback: status_callback("Saving animation file...")
-        logger.info(f"Saving animation to '{animation_file_path}'...")
+        logger.info("Saving animation to '%s'...", animation_file_path)
         try:
-            self.fig.write_html(
-                file=animation_file_path,
-                config={'displaylogo': False, 'modeBarButtonsToRemove': ['sendDataToCloud']},
-                include_plotlyjs='cdn'
-            )
+            self.write_html(animation_file_path, config={'displaylogo': False, 'modeBarButtonsToRemove': ['sendDataToCloud']})
             logger.info("Animation saved. Attempting to open in browser...")
 
             file_url = 'file://' + os.path.abspath(animation_file_path)
             webbrowser.open(file_url, new=2)
-            logger.info(f"Browser launch command issued for: {file_url}")
+            logger.info("Browser launch command issued for: %s", file_url)
             if status_callback: status_callback("Animation ready in browser.")
 
         except Exception as e:
-            logger.error(f"Failed to save or automatically open animation: {e}", exc_info=True)
+            logger.error("Failed to save or automatically open animation: %s", e, exc_info=True)
             if status_callback: status_callback("Animation display failed.")
             if self.master and self.master.winfo_exists():
                 messagebox.showwarning(
@@ -241,10 +294,10 @@ class PlanetPlot:
         if self.on_pick_callback and points and points.point_inds:
             point_index = points.point_inds[0]
             if (hasattr(trace, 'customdata') and isinstance(trace.customdata, (list, tuple)) and len(trace.customdata) > point_index):
-                name = trace.customdata[point_index]; logger.info(f"Plot element '{name}' clicked.")
+                name = trace.customdata[point_index]; logger.info("Plot element '%s' clicked.", name)
                 try: self.on_pick_callback(name)
-                except Exception as e: logger.error(f"Error executing on_pick_callback: {e}", exc_info=True)
-            else: logger.warning(f"Clicked element lacks customdata for callback.")
+                except Exception as e: logger.error("Error executing on_pick_callback: %s", e, exc_info=True)
+            else: logger.warning("Clicked element lacks customdata for callback.")
 
 
 # --- Standalone Test Block ---
@@ -257,7 +310,7 @@ if __name__ == "__main__":
     calculations_available = False
     try: from planet_calculations import ts, parse_date_time, get_heliocentric_positions, calculate_orbit, calculate_events; calculations_available = True
     except ImportError: module_logger.error("-> Prerequisite Error: Cannot import from 'planet_calculations'.")
-    except Exception as e: module_logger.error(f"-> Prerequisite Error during import from 'planet_calculations': {e}", exc_info=True)
+    except Exception as e: module_logger.error("-> Prerequisite Error during import from 'planet_calculations': %s", e, exc_info=True)
     
     if planet_data_available and calculations_available:
         # Create a dummy Tkinter root for the messagebox parent
@@ -275,20 +328,22 @@ if __name__ == "__main__":
             static_events=calculate_events(t_static)
             module_logger.info("Generating static plot...")
             plotter.update_plot(positions=static_positions,orbit_positions=static_orbit_positions,current_time=t_static,active_planets=static_planets,events=static_events,zoom=1.2,elev=25,azim=45)
-        except Exception as e: module_logger.error(f"Static plot test error:", exc_info=True)
+        except Exception as e: module_logger.error("Static plot test error:", exc_info=True)
         
         # Animation Test
         module_logger.info("\n--- Animation Test ---")
         try:
             t_anim_start=parse_date_time("2024-01-01"); t_anim_end=parse_date_time("2024-03-01"); anim_planets=["Mercury","Venus","Earth","Moon","Mars"]
             num_frames=60; times_anim=ts.linspace(t_anim_start, t_anim_end, num_frames)
-            positions_anim_list = [get_heliocentric_positions(anim_planets, t_frame) for t_frame in times_anim]
+            position_series_anim = get_heliocentric_positions(anim_planets, times_anim) # (3, num_frames) per planet
+            anim_names = [p for p in anim_planets if p in position_series_anim]
+            frame_positions_anim = np.stack([position_series_anim[p] for p in anim_names]).transpose(2, 0, 1) # (frames, planets, 3)
             t_orb_anim_start = t_anim_start; t_orb_anim_end = ts.tt(jd=t_anim_start.tt+90)
             anim_orbit_positions={p:calculate_orbit(p,t_orb_anim_start.tt,t_orb_anim_end.tt,num_points=180) for p in anim_planets}
             module_logger.info("Generating animation plot...")
-            status_update=lambda msg: module_logger.info(f"    [Anim Status] {msg}")
-            plotter.create_animation(positions_list=positions_anim_list,times=times_anim,orbit_positions=anim_orbit_positions,active_planets=anim_planets,frame_duration_ms=60,zoom=1.0,elev=30,azim=-30,status_callback=status_update)
-        except Exception as e: module_logger.error(f"Animation test error:", exc_info=True)
+            status_update=lambda msg: module_logger.info("    [Anim Status] %s", msg)
+            plotter.create_animation(frame_positions=frame_positions_anim,position_names=anim_names,times=times_anim,orbit_positions=anim_orbit_positions,active_planets=anim_planets,frame_duration_ms=60,zoom=1.0,elev=30,azim=-30,status_callback=status_update)
+        except Exception as e: module_logger.error("Animation test error:", exc_info=True)
         
         module_logger.info("--- To see plots, open the generated .html files in your browser. ---")
         # In standalone mode, plots are generated but we can't block with a mainloop.